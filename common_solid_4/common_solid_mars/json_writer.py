@@ -0,0 +1,120 @@
+"""행 단위 스트리밍 JSON/NDJSON 저장 모듈
+
+기능:
+  ① 전체 데이터를 하나의 문자열로 만들지 않고 행이 생길 때마다 바로 파일에 기록
+  ② 모드
+     - pretty : json.dumps(indent=2)와 같은 형태(기존 결과와 동일)
+     - compact: 들여쓰기/공백 없는 한 줄 JSON
+     - ndjson : 한 줄에 한 행(JSON Lines). 딕셔너리 키는 기록하지 않음
+  ③ write()는 행이 기록된 byte 구간을 반환 -> 역색인(log_index.py)에서 사용
+  ④ 동명 파일이 있으면 덮어쓰지 않도록 타임스탬프(+일련번호) 파일명 생성
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO
+
+JSON_MODES = ("pretty", "compact", "ndjson")
+
+
+def timestamped_path(result_path: Path, default_stem: str, mode: str = "pretty") -> Path:
+    '''
+    결과 경로로부터 덮어쓰지 않는 저장 경로를 만듭니다.
+    - 확장자가 .json/.ndjson이면 파일로 간주, 아니면 폴더로 간주(없으면 생성)
+    - <이름>_<YYYYmmdd_HHMMSS>.json, 같은 초에 이미 있으면 _1, _2 ... 를 붙임
+    '''
+    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    suffix = ".ndjson" if mode == "ndjson" else ".json"
+    p = Path(result_path)
+    if p.suffix.lower() in (".json", ".ndjson"):
+        p.parent.mkdir(parents=True, exist_ok=True)
+        stem, folder = p.stem, p.parent
+    else:
+        p.mkdir(parents=True, exist_ok=True)
+        stem, folder = default_stem, p
+
+    out = folder / f"{stem}_{ts}{suffix}"
+    n = 1
+    while out.exists():
+        out = folder / f"{stem}_{ts}_{n}{suffix}"
+        n += 1
+    return out
+
+
+class JsonStreamWriter:
+    '''
+    with 문으로 사용하는 스트리밍 writer.
+
+        with JsonStreamWriter(path, mode="pretty", keyed=True) as w:
+            for i, row in enumerate(rows, start=1):
+                w.write(row, key=i)
+
+    keyed=True면 {"키": 행, ...}, False면 [행, ...] 형태로 기록합니다(ndjson은 무시).
+    '''
+
+    def __init__(self, path: Path, mode: str = "pretty", keyed: bool = False) -> None:
+        if mode not in JSON_MODES:
+            raise ValueError(f"mode는 {'/'.join(JSON_MODES)} 중 하나여야 합니다.: {mode}")
+        self.path = Path(path)
+        self.mode = mode
+        self.keyed = keyed
+        self.count = 0
+        self._f: BinaryIO | None = None
+
+    def __enter__(self) -> "JsonStreamWriter":
+        self._f = self.path.open("wb")
+        if self.mode != "ndjson":
+            self._f.write(b"{" if self.keyed else b"[")
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close(complete=exc_type is None)
+
+    def _dumps(self, obj: Any) -> str:
+        if self.mode == "pretty":
+            # 한 단계 안쪽에 들어가므로 구조용 줄바꿈마다 2칸 들여쓰기(문자열 안 \n은 이스케이프됨)
+            return json.dumps(obj, ensure_ascii=False, indent=2).replace("\n", "\n  ")
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+    def write(self, row: Any, key: Any = None) -> tuple[int, int]:
+        '''
+        한 행을 기록하고 파일 안에서 행 객체가 차지하는 byte 구간 (start, end)를 반환합니다.
+        '''
+        f = self._f
+        if f is None:
+            raise ValueError("writer가 열려 있지 않습니다(with 문 안에서 사용).")
+        self.count += 1
+        if self.mode == "ndjson":
+            start = f.tell()
+            f.write(self._dumps(row).encode("utf-8"))
+            end = f.tell()
+            f.write(b"\n")
+            return start, end
+
+        sep = b"," if self.count > 1 else b""
+        if self.mode == "pretty":
+            sep += b"\n  "
+        f.write(sep)
+        if self.keyed:
+            colon = b": " if self.mode == "pretty" else b":"
+            f.write(json.dumps(str(key), ensure_ascii=False).encode("utf-8") + colon)
+        start = f.tell()
+        f.write(self._dumps(row).encode("utf-8"))
+        return start, f.tell()
+
+    def close(self, complete: bool = True) -> None:
+        '''
+        닫는 괄호를 기록하고 파일을 닫습니다. 예외로 중단되면 괄호 없이 닫습니다.
+        '''
+        f = self._f
+        if f is None:
+            return
+        try:
+            if complete and self.mode != "ndjson":
+                if self.count and self.mode == "pretty":
+                    f.write(b"\n")
+                f.write(b"}" if self.keyed else b"]")
+        finally:
+            f.close()
+            self._f = None
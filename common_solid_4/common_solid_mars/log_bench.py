@@ -0,0 +1,202 @@
+"""mission_computer_main.log 분석기 벤치마크 + 합성 로그 생성기
+
+기능:
+  ① generate_log: 재현 가능한(seed) 합성 로그 생성
+     - 행 수, 구분자, BOM 유무, 위험 키워드 밀도, 잘못된 timestamp 비율 설정
+  ② run_benchmark: main.py 단계별 처리량(rows/s)과 RSS 증가량 측정
+     - read_log_file -> sort_log_datetime -> generate_markdown_report
+       -> filter_risk_logs -> save_to_json -> search_json
+     - 단계마다 fork된 자식 프로세스에서 실행(fork 불가 시 같은 프로세스)
+     - fork된 자식의 최대 RSS는 부모의 RSS(미리 준비한 입력 포함)에서 시작하므로,
+       단계 시작 시점의 RSS를 기록하고 단계 중 증가한 양(최대 RSS - 시작 RSS)을 보고
+
+사용법:
+  python log_bench.py --rows 10000 100000 [--delimiter ";"] [--bom] [--density 0.05]
+                      [--malformed 0.01] [--seed 0] [--columnar] [--json bench.json]
+"""
+
+import argparse
+import csv
+import json
+import multiprocessing as mp
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable
+
+import main as analyzer
+from time_index import TS_FORMAT
+
+LEVELS = ("INFO", "INFO", "INFO", "WARN", "ERROR")
+MESSAGES = (
+    "Rocket initialization process started.",
+    "Power systems online. Batteries at optimal charge.",
+    "Communication established with mission control.",
+    "Navigation system calibrated.",
+    "Touchdown confirmed. Rocket safely landed.",
+    "Mission completed successfully. Recovery team dispatched.",
+)
+RISK_MESSAGES = (
+    "Oxygen tank unstable.",
+    "Oxygen tank explosion.",
+    "엔진 고온 경고",
+    "연료 누출 감지",
+    "보조 탱크 폭발",
+)
+MALFORMED = ("", "N/A", "2023/08/27 10:00", "27-08-2023 10:00:00", "2023-13-40 99:99:99")
+
+
+def generate_log(path: Path, rows: int, *, delimiter: str = ",", bom: bool = False,
+                 density: float = 0.05, malformed: float = 0.01, seed: int = 0,
+                 start: datetime = datetime(2023, 8, 27, 10, 0, 0)) -> Path:
+    '''
+    합성 로그(CSV)를 생성합니다. 같은 인자/seed면 항상 같은 파일이 만들어집니다.
+    - density: 위험 키워드가 들어간 메시지 비율
+    - malformed: 파싱할 수 없는 timestamp 비율
+    '''
+    rng = random.Random(seed)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    ts = start
+    with path.open("w", encoding="utf-8-sig" if bom else "utf-8", newline="") as f:
+        w = csv.writer(f, delimiter=delimiter, lineterminator="\n")
+        w.writerow(["timestamp", "event", "message"])
+        for _ in range(rows):
+            ts += timedelta(seconds=rng.choice((0, 1, 5, 30, 60)))
+            stamp = rng.choice(MALFORMED) if rng.random() < malformed else ts.strftime(TS_FORMAT)
+            msg = rng.choice(RISK_MESSAGES) if rng.random() < density else rng.choice(MESSAGES)
+            w.writerow([stamp, rng.choice(LEVELS), msg])
+    return path
+
+
+def _peak_rss_mb() -> float:
+    '''
+    현재 프로세스의 최대 RSS(MB). 리눅스는 KB, macOS는 byte 단위로 보고됩니다.
+    '''
+    try:
+        import resource
+    except ImportError:  # Windows
+        return float("nan")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _run(fn: Callable[[], Any]) -> tuple[float, float, float]:
+    base = _peak_rss_mb()
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0, base, _peak_rss_mb() - base
+
+
+def _child(fn: Callable[[], Any], conn: Any) -> None:
+    conn.send(_run(fn))
+    conn.close()
+
+
+def _measure(fn: Callable[[], Any], isolate: bool) -> tuple[float, float, float]:
+    '''
+    (소요 시간 초, 시작 RSS MB, RSS 증가량 MB)를 반환합니다. isolate=True면 fork된 자식에서 실행합니다.
+    같은 프로세스에서 실행하면 이전 단계의 최대치를 넘는 증가분만 잡히므로 과소 측정될 수 있습니다.
+    '''
+    if isolate:
+        ctx = mp.get_context("fork")
+        parent, child = ctx.Pipe(duplex=False)
+        proc = ctx.Process(target=_child, args=(fn, child))
+        proc.start()
+        child.close()
+        result = parent.recv()
+        proc.join()
+        return result
+    return _run(fn)
+
+
+def run_benchmark(log_path: Path, *, columnar: bool = False, query: str = "oxygen",
+                  work_dir: Path | None = None) -> list[dict[str, Any]]:
+    '''
+    한 로그에 대해 단계별 측정 결과 목록을 반환합니다.
+    이후 단계의 입력(정렬된 로그, 저장된 JSON)은 부모 프로세스에서 미리 준비합니다.
+    '''
+    isolate = "fork" in mp.get_all_start_methods()
+    work = Path(work_dir) if work_dir else Path(tempfile.mkdtemp(prefix="log_bench_"))
+    work.mkdir(parents=True, exist_ok=True)
+
+    if columnar and analyzer.LogTable is None:
+        raise RuntimeError("--columnar 벤치마크는 NumPy가 필요합니다.")
+
+    def load() -> Any:
+        if columnar:
+            return analyzer.LogTable.from_csv(log_path)
+        return analyzer.read_log_file(log_path)
+
+    # 측정 대상과 별개로 다음 단계 입력 준비
+    logs = load()
+    n = len(logs)
+    sorted_logs = analyzer.sort_log_datetime(logs)
+    json_path = analyzer.save_to_json(analyzer.convert_list_to_dict(sorted_logs), work)
+
+    stages: list[tuple[str, Callable[[], Any]]] = [
+        ("read_log_file", load),
+        ("sort_log_datetime", lambda: analyzer.sort_log_datetime(logs)),
+        ("generate_markdown_report", lambda: analyzer.generate_markdown_report(sorted_logs, work / "log_analysis.md")),
+        ("filter_risk_logs", lambda: analyzer.filter_risk_logs(sorted_logs, work)),
+        ("save_to_json", lambda: analyzer.save_to_json(analyzer.convert_list_to_dict(sorted_logs), work)),
+        ("search_json", lambda: analyzer.search_json(json_path, query)),
+    ]
+    results = []
+    for name, fn in stages:
+        sec, base, delta = _measure(fn, isolate)
+        results.append({
+            "stage": name,
+            "rows": n,
+            "seconds": round(sec, 4),
+            "rows_per_sec": round(n / sec) if sec > 0 else None,
+            "base_rss_mb": round(base, 1),
+            "rss_delta_mb": round(delta, 1),
+        })
+    return results
+
+
+def print_results(title: str, results: list[dict[str, Any]]) -> None:
+    print(f"\n=== {title} ===")
+    print(f"{'stage':<26}{'rows':>10}{'seconds':>10}{'rows/s':>14}{'base RSS(MB)':>14}{'+RSS(MB)':>10}")
+    for r in results:
+        rps = f"{r['rows_per_sec']:,}" if r["rows_per_sec"] is not None else "-"
+        print(f"{r['stage']:<26}{r['rows']:>10,}{r['seconds']:>10.3f}{rps:>14}"
+              f"{r['base_rss_mb']:>14.1f}{r['rss_delta_mb']:>10.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="mission log 분석기 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000], help="생성할 행 수(여러 개 가능)")
+    parser.add_argument("--delimiter", default=",", help="구분자(, ; | \\t)")
+    parser.add_argument("--bom", action="store_true", help="UTF-8 BOM 포함")
+    parser.add_argument("--density", type=float, default=0.05, help="위험 키워드 밀도(0~1)")
+    parser.add_argument("--malformed", type=float, default=0.01, help="잘못된 timestamp 비율(0~1)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--columnar", action="store_true", help="LogTable(NumPy) 경로 측정")
+    parser.add_argument("--query", default="oxygen", help="search_json 질의")
+    parser.add_argument("--json", type=Path, default=None, help="결과를 JSON으로 저장할 경로")
+    args = parser.parse_args()
+    delimiter = "\t" if args.delimiter in ("\\t", "tab") else args.delimiter
+
+    report: dict[str, Any] = {"params": {k: str(v) for k, v in vars(args).items()}, "runs": []}
+    with tempfile.TemporaryDirectory(prefix="log_bench_") as tmp:
+        for rows in args.rows:
+            log_path = generate_log(Path(tmp) / f"synthetic_{rows}.log", rows, delimiter=delimiter,
+                                    bom=args.bom, density=args.density, malformed=args.malformed,
+                                    seed=args.seed)
+            results = run_benchmark(log_path, columnar=args.columnar, query=args.query,
+                                    work_dir=Path(tmp) / f"out_{rows}")
+            print_results(f"{rows:,} rows{' (columnar)' if args.columnar else ''}", results)
+            report["runs"].append({"rows": rows, "results": results})
+
+    if args.json:
+        args.json.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"\n결과 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
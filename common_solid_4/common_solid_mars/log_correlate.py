@@ -0,0 +1,187 @@
+"""위험 키워드 이벤트 상관 분석(슬라이딩 시간 창) 모듈
+
+시간 오름차순으로 들어오는 (시각, 위험 키워드 목록)을 한 번만 훑으며 다음을 계산합니다.
+  ① 버스트: window초 안에 서로 다른 키워드가 min_kinds개 이상 함께 나타난 구간
+  ② 이벤트 간 지연: A 다음 window초 안에 B가 나오면 A→B 지연(횟수/평균/최소/최대)
+  ③ 인과 사슬 후보: A→B→C 순서가 window초 안에 이어진 횟수와 평균 소요 시간으로 순위화
+     (예: 고온 → 누출 → 폭발)
+
+상태는 창 안의 이벤트(deque, 상한 있음), 키워드별 마지막 시각, 키워드 쌍/삼중 집계,
+상위 버스트 힙뿐이므로 로그 크기와 관계없이 메모리가 일정합니다.
+같은 행에서 함께 나온 키워드는 버스트에는 포함하되 순서를 알 수 없어 사슬/지연에서는 제외합니다.
+"""
+
+import heapq
+from collections import Counter, deque
+from itertools import count
+from typing import Any, Iterable
+
+from time_index import epoch_to_str
+
+DEFAULT_WINDOW = 300  # 초
+
+
+class _Agg:
+    '''
+    지연 시간 누적(횟수/합/최소/최대)
+    '''
+    __slots__ = ("n", "total", "lo", "hi")
+
+    def __init__(self) -> None:
+        self.n = 0
+        self.total = 0.0
+        self.lo = float("inf")
+        self.hi = 0.0
+
+    def add(self, v: float) -> None:
+        self.n += 1
+        self.total += v
+        self.lo = min(self.lo, v)
+        self.hi = max(self.hi, v)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.n if self.n else 0.0
+
+
+class Correlator:
+    '''
+    스트리밍 상관 분석기. feed()를 시간 오름차순으로 호출한 뒤 result()로 결과를 얻습니다.
+    '''
+
+    def __init__(self, keywords: Iterable[str], window: float = DEFAULT_WINDOW, min_kinds: int = 2,
+                 top: int = 5, max_window_events: int = 10_000) -> None:
+        self.keywords = tuple(keywords)
+        self.window = window
+        self.min_kinds = min_kinds
+        self.top = top
+        self.max_window_events = max_window_events
+
+        self._events: deque[tuple[float, str]] = deque()
+        self._kinds: Counter[str] = Counter()
+        self._last: dict[str, float] = {}
+        self._pairs: dict[tuple[str, str], _Agg] = {}
+        self._chains: dict[tuple[str, str, str], _Agg] = {}
+        self._burst: dict[str, Any] | None = None
+        self._bursts: list[tuple[tuple[int, int], int, dict[str, Any]]] = []
+        self._tick = count()
+        self._now = float("-inf")
+
+    def feed(self, t: float, matched: Iterable[str]) -> None:
+        '''
+        t: epoch 초, matched: 해당 행에서 발견된 위험 키워드들
+        '''
+        matched = list(dict.fromkeys(matched))
+        if not matched:
+            return
+        # 순서가 살짝 어긋난 행(follow 모드 등)은 직전 시각으로 맞춰 음수 지연을 막음
+        t = max(float(t), self._now)
+        self._now = t
+        w = self.window
+        last = self._last
+
+        # ②③ 이전 행들의 마지막 등장 시각으로 지연/사슬 집계
+        for c in matched:
+            for b, tb in last.items():
+                if b == c or t - tb > w:
+                    continue
+                self._pairs.setdefault((b, c), _Agg()).add(t - tb)
+                for a, ta in last.items():
+                    # a는 b보다 엄격히 먼저(같은 행이면 순서를 알 수 없으므로 제외)
+                    if a in (b, c) or ta >= tb or t - ta > w:
+                        continue
+                    self._chains.setdefault((a, b, c), _Agg()).add(t - ta)
+        for c in matched:
+            last[c] = t
+
+        # ① 창 갱신 후 서로 다른 키워드 수 확인
+        ev = self._events
+        for c in matched:
+            ev.append((t, c))
+            self._kinds[c] += 1
+        while ev and (t - ev[0][0] > w or len(ev) > self.max_window_events):
+            _, old = ev.popleft()
+            self._kinds[old] -= 1
+            if not self._kinds[old]:
+                del self._kinds[old]
+
+        burst = self._burst
+        if len(self._kinds) >= self.min_kinds:
+            if burst is not None and t - burst["end"] <= w:
+                burst["end"] = t
+                burst["kinds"].update(matched)
+                burst["events"] += len(matched)
+            else:
+                self._close_burst()
+                self._burst = {
+                    "start": ev[0][0],
+                    "end": t,
+                    "kinds": set(self._kinds),
+                    "events": len(ev),
+                }
+        elif burst is not None and t - burst["end"] > w:
+            self._close_burst()
+
+    def _close_burst(self) -> None:
+        b = self._burst
+        if b is None:
+            return
+        self._burst = None
+        # (키워드 종류 수, 이벤트 수) 기준 상위 top개만 보관
+        item = ((len(b["kinds"]), b["events"]), -next(self._tick), b)
+        if len(self._bursts) < self.top:
+            heapq.heappush(self._bursts, item)
+        elif item[:2] > self._bursts[0][:2]:
+            heapq.heapreplace(self._bursts, item)
+
+    def result(self) -> dict[str, Any]:
+        '''
+        버스트/지연/사슬 결과를 보고서용 기본 자료형으로 반환합니다(진행 중 버스트 포함).
+        '''
+        bursts = list(self._bursts)
+        if self._burst is not None:
+            b = self._burst
+            bursts.append(((len(b["kinds"]), b["events"]), 0, b))
+        bursts.sort(key=lambda x: x[:2], reverse=True)
+        order = {k: i for i, k in enumerate(self.keywords)}
+
+        def _kinds(kinds: set[str]) -> list[str]:
+            return sorted(kinds, key=lambda k: order.get(k, len(order)))
+
+        latencies = sorted(
+            ((a, b, g.n, g.mean, g.lo, g.hi) for (a, b), g in self._pairs.items()),
+            key=lambda x: (-x[2], x[3]),
+        )
+        chains = sorted(
+            (((a, b, c), g.n, g.mean) for (a, b, c), g in self._chains.items()),
+            key=lambda x: (-x[1], x[2]),
+        )
+        return {
+            "window": self.window,
+            "bursts": [
+                {"start": epoch_to_str(b["start"]), "end": epoch_to_str(b["end"]),
+                 "seconds": b["end"] - b["start"], "kinds": _kinds(b["kinds"]), "events": b["events"]}
+                for _, _, b in bursts[:self.top]
+            ],
+            "latencies": latencies[:self.top * 2],
+            "chains": chains[:self.top],
+        }
+
+
+def correlate(events: Iterable[tuple[float, Iterable[str]]], keywords: Iterable[str],
+              window: float = DEFAULT_WINDOW, **kwargs: Any) -> dict[str, Any]:
+    '''
+    (epoch 초, 키워드 목록) iterable(시간 오름차순)을 한 번 훑어 상관 분석 결과를 반환합니다.
+
+    같은 행의 키워드는 사슬을 만들지 않습니다.
+    >>> r = correlate([(0, ['고온', '누출']), (10, ['폭발'])], ['고온', '누출', '폭발'])
+    >>> r["chains"]
+    []
+    >>> r = correlate([(0, ['고온']), (5, ['누출']), (10, ['폭발'])], ['고온', '누출', '폭발'])
+    >>> [chain for chain, _, _ in r["chains"]]
+    [('고온', '누출', '폭발')]
+    '''
+    engine = Correlator(keywords, window=window, **kwargs)
+    for t, matched in events:
+        engine.feed(t, matched)
+    return engine.result()
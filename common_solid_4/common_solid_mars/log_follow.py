@@ -0,0 +1,173 @@
+"""mission_computer_main.log 실시간 추적(tail -f) 모듈
+
+기능:
+  ① LogTailer: 로그 파일 끝에서부터 새로 추가된 완전한 줄만 읽어 dict 행으로 변환
+     - 줄 중간에서 끊긴 조각은 다음 읽기까지 보관
+     - 파일이 잘리거나(크기 감소) 교체되면 처음부터 다시 읽음
+  ② LiveReport: 행이 들어올 때마다 보고서 통계를 증분 갱신(전체 재스캔 없음)
+     - 관찰 구간, 레벨 분포, 위험 키워드 건수, 최근 이벤트(상위 N개 힙), 키워드 등장 순서
+     - 위험 키워드 상관 분석(log_correlate.Correlator)도 도착 순서대로 증분 처리
+     - stats()는 generate_markdown_report가 쓰는 통계와 같은 형태
+"""
+
+import csv
+import heapq
+from collections import Counter
+from datetime import datetime
+from itertools import count
+from pathlib import Path
+from typing import Any, Iterable
+
+from log_correlate import DEFAULT_WINDOW, Correlator
+from log_format import BOM, LogFormat, detect_format
+from time_index import TS_FORMAT, parse_ts, to_epoch
+
+
+class LogTailer:
+    '''
+    로그 파일을 이어 읽는 tailer. poll()을 반복 호출하면 새 행만 돌려줍니다.
+    '''
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.offset = 0
+        self.header: list[str] | None = None
+        self.fmt: LogFormat | None = None
+        self.rows_read = 0
+        self._partial = b""
+        self._inode: int | None = None
+
+    def _reset(self) -> None:
+        self.offset = 0
+        self.header = None
+        self.fmt = None  # 교체된 파일은 구분자/BOM이 다를 수 있으므로 다시 감지
+        self.rows_read = 0
+        self._partial = b""
+
+    def poll(self) -> tuple[list[dict[str, Any]], bool]:
+        '''
+        (새 행 목록, 리셋 여부)를 반환합니다. 리셋이면 호출 측 통계도 초기화해야 합니다.
+        '''
+        if not self.path.exists():
+            return [], False
+        st = self.path.stat()
+        reset = False
+        if (self._inode is not None and st.st_ino != self._inode) or st.st_size < self.offset:
+            # 로그 교체/잘림 -> 처음부터
+            self._reset()
+            reset = True
+        self._inode = st.st_ino
+        if st.st_size == self.offset:
+            return [], reset
+
+        with self.path.open("rb") as f:
+            f.seek(self.offset)
+            chunk = f.read(st.st_size - self.offset)
+        self.offset += len(chunk)
+
+        data = self._partial + chunk
+        cut = data.rfind(b"\n") + 1
+        self._partial = data[cut:]
+        if not cut:
+            return [], reset
+        text = data[:cut]
+        if self.header is None:
+            # 처음 읽을 때만 형식 감지(같은 파일 상태면 log_format 캐시 사용)
+            self.fmt = detect_format(self.path) if self.fmt is None else self.fmt
+            if text.startswith(BOM):
+                text = text[len(BOM):]
+        # 깨진 바이트가 한 번 추가돼도 추적이 멈추지 않도록 대체 문자(U+FFFD)로 디코딩
+        lines = text.decode(self.fmt.encoding, errors="replace").splitlines(keepends=True)
+        params = self.fmt.fmtparams()
+
+        if self.header is None:
+            first = next(csv.reader(lines[:1], **params), [])
+            self.header = [h.strip() for h in first]
+            lines = lines[1:]
+
+        rows: list[dict[str, Any]] = []
+        for rec in csv.reader(lines, **params):
+            if not rec:
+                continue
+            self.rows_read += 1
+            row: dict[str, Any] = {
+                h: (rec[j].strip() if j < len(rec) else None) for j, h in enumerate(self.header)
+            }
+            row["orig_idx"] = self.rows_read
+            rows.append(row)
+        return rows, reset
+
+
+class LiveReport:
+    '''
+    보고서 통계를 증분으로 유지합니다. 메모리는 최근 이벤트/등장 순서 상한만큼만 사용합니다.
+    '''
+
+    def __init__(self, keywords: Iterable[str], recent: int = 5, seq_limit: int = 10,
+                 window: float = DEFAULT_WINDOW) -> None:
+        self.keywords = tuple(keywords)
+        self.window = window
+        self._lower = [k.lower() for k in self.keywords]
+        self.recent_n = recent
+        self.seq_limit = seq_limit
+        self.reset()
+
+    def reset(self) -> None:
+        self.total = 0
+        self.start: datetime | None = None
+        self.end: datetime | None = None
+        self.levels: Counter[str] = Counter()
+        self.risks: Counter[str] = Counter()
+        self.seq: list[str] = []
+        self._recent: list[tuple[datetime, int, dict[str, Any]]] = []
+        self._tick = count()
+        self.corr = Correlator(self.keywords, window=self.window)
+        self.dirty = True
+
+    def add(self, row: dict[str, Any]) -> None:
+        self.total += 1
+        self.dirty = True
+
+        ts = parse_ts(row.get("timestamp"))
+        if ts:
+            self.start = ts if self.start is None else min(self.start, ts)
+            self.end = ts if self.end is None else max(self.end, ts)
+
+        level = row.get("level") or row.get("event")
+        if isinstance(level, str) and level:
+            self.levels[level] += 1
+
+        blob = " ".join(str(v) for v in row.values() if isinstance(v, (str, int, float))).lower()
+        hit = [kw for kw, low in zip(self.keywords, self._lower) if low in blob]
+        for kw in hit:
+            self.risks[kw] += 1
+            if len(self.seq) < self.seq_limit:
+                self.seq.append(kw)
+        if hit and ts:
+            # 도착 순서대로 상관 분석기에 흘려보냄(상태 크기 일정)
+            self.corr.feed(to_epoch(ts), hit)
+
+        # 최근 N건: (시각, -도착순) 최소 힙 -> 가장 오래된 것을 밀어냄
+        # 동시각이면 먼저 들어온 행이 앞(sorted(reverse=True)와 같은 순서)
+        item = (ts or datetime.min, -next(self._tick), row)
+        if len(self._recent) < self.recent_n:
+            heapq.heappush(self._recent, item)
+        elif item[:2] > self._recent[0][:2]:
+            heapq.heapreplace(self._recent, item)
+
+    def extend(self, rows: Iterable[dict[str, Any]]) -> None:
+        for row in rows:
+            self.add(row)
+
+    def stats(self) -> dict[str, Any]:
+        recent = sorted(self._recent, key=lambda t: t[:2], reverse=True)
+        return {
+            "total": self.total,
+            "start": self.start.strftime(TS_FORMAT) if self.start else "N/A",
+            "end": self.end.strftime(TS_FORMAT) if self.end else "N/A",
+            "level_counts": self.levels.most_common(),
+            "risk_counts": self.risks.most_common(),
+            "recent": [r for _, _, r in recent],
+            "risk_seq": list(self.seq),
+            "correlation": self.corr.result(),
+        }
@@ -0,0 +1,119 @@
+"""로그(CSV) 인코딩/구분자 감지 + 캐시 모듈
+
+기능:
+  ① 파일 앞부분 바이트 샘플만 읽어 한 번에 감지
+     - BOM 확인(utf-8-sig) -> 샘플 UTF-8 디코딩 검사 -> csv.Sniffer로 구분자 추정
+     - 디코딩 실패 시 전체 파일을 다시 읽지 않고 바로 UnicodeDecodeError
+  ② 결과를 (경로, 크기, mtime) 키로 캐시
+     - 프로세스 안: 메모리 딕셔너리
+     - 재실행: 로그 옆 <로그파일>.fmt (JSON) 사이드카
+"""
+
+import csv
+import json
+from pathlib import Path
+from typing import Any, NamedTuple
+
+BOM = b"\xef\xbb\xbf"
+SAMPLE_BYTES = 4096
+FMT_SUFFIX = ".fmt"
+DELIMITERS = ',;\t|'
+
+_CACHE: dict[tuple[str, int, int], "LogFormat"] = {}
+
+
+class LogFormat(NamedTuple):
+    '''
+    감지 결과. encoding은 텍스트 모드로 열 때 쓰는 이름(BOM 있으면 utf-8-sig),
+    bom은 바이너리로 읽을 때 건너뛸 byte 수입니다.
+    '''
+    encoding: str
+    bom: int
+    delimiter: str
+    quotechar: str
+    doublequote: bool
+    skipinitialspace: bool
+
+    def fmtparams(self) -> dict[str, Any]:
+        '''
+        csv.reader / csv.DictReader에 넘길 키워드 인자
+        '''
+        return {
+            "delimiter": self.delimiter,
+            "quotechar": self.quotechar,
+            "doublequote": self.doublequote,
+            "skipinitialspace": self.skipinitialspace,
+        }
+
+
+def fmt_path_for(log_path: Path) -> Path:
+    log_path = Path(log_path)
+    return log_path.with_name(log_path.name + FMT_SUFFIX)
+
+
+def sniff_sample(head: bytes) -> LogFormat:
+    '''
+    파일 앞부분 바이트로 인코딩/구분자를 감지합니다.
+    '''
+    bom = len(BOM) if head.startswith(BOM) else 0
+    body = head[bom:]
+    try:
+        sample = body.decode("utf-8")
+    except UnicodeDecodeError as e:
+        # 샘플 끝에서 멀티바이트 문자가 잘린 경우(최대 3byte)만 허용
+        if e.start < len(body) - 3:
+            raise UnicodeDecodeError("utf-8/utf-8-sig", body, e.start, e.end, "지원 인코딩으로 디코딩 실패") from e
+        sample = body[:e.start].decode("utf-8")
+
+    try:
+        dialect = csv.Sniffer().sniff(sample, delimiters=DELIMITERS)
+    except csv.Error:
+        # 추정 실패 시 엑셀 기본값(콤마)
+        dialect = csv.get_dialect('excel')
+    return LogFormat(
+        encoding="utf-8-sig" if bom else "utf-8",
+        bom=bom,
+        delimiter=dialect.delimiter,
+        quotechar=dialect.quotechar or '"',
+        doublequote=dialect.doublequote,
+        skipinitialspace=dialect.skipinitialspace,
+    )
+
+
+def detect_format(path: Path) -> LogFormat:
+    '''
+    로그 파일의 LogFormat을 반환합니다. 같은 (경로, 크기, mtime)이면 감지를 건너뜁니다.
+    '''
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"로그 파일을 찾을 수 없습니다.: {path}")
+    st = path.stat()
+    key = (str(path.resolve()), st.st_size, st.st_mtime_ns)
+    cached = _CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    side = fmt_path_for(path)
+    fmt: LogFormat | None = None
+    try:
+        saved = json.loads(side.read_text(encoding="utf-8"))
+        if [saved.get("size"), saved.get("mtime_ns")] == [st.st_size, st.st_mtime_ns]:
+            fmt = LogFormat(**saved["format"])
+    except (OSError, ValueError, KeyError, TypeError):
+        fmt = None
+
+    if fmt is None:
+        with path.open("rb") as f:
+            fmt = sniff_sample(f.read(SAMPLE_BYTES))
+        try:
+            side.write_text(json.dumps({
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+                "format": fmt._asdict(),
+            }, ensure_ascii=False), encoding="utf-8")
+        except OSError:
+            # 읽기 전용 위치면 메모리 캐시만 사용
+            pass
+
+    _CACHE[key] = fmt
+    return fmt
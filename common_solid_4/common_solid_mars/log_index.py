@@ -0,0 +1,437 @@
+"""save_to_json 결과(JSON)에 대한 역색인(inverted index) 모듈
+
+기능:
+  ① JSON 저장과 동시에 필드별 n-gram 역색인(<JSON 파일명>.idx) 생성(save_to_json(build_index=True), 선택)
+  ② 검색 시 n-gram 포스팅만 교집합/합집합하여 후보 행을 좁힘
+  ③ 후보 행만 JSON 원본에서 byte offset으로 seek 하여 읽어 검증
+  ④ AND/OR, 필드 지정(field:검색어), 따옴표 구문 지원
+  ⑤ MemoryIndex: 메모리에 올린 행 목록에 같은 색인/질의 규칙 적용(REPL 반복 질의용)
+  ⑥ match_rows: 색인 없이 같은 질의 규칙으로 선형 검색(색인 유무와 관계없이 같은 결과)
+
+색인 파일 구조(.idx, 네이티브 byte order):
+  [MAGIC 8byte][헤더 JSON 길이 uint64][헤더 JSON]
+  [행 위치: uint64 (시작, 길이) * 행 수][포스팅 ...]
+  헤더의 fields = {필드: {gram: [종류, 포스팅 구간 기준 byte 위치, byte 길이]}}
+  포스팅 종류: 0 = uint32 행 번호 목록(드문 gram), 1 = 행 비트맵(행의 1/32 이상에 나오는 gram)
+  -> 원소당 4byte 목록과 행당 1bit 비트맵 중 작은 쪽. 기록은 gram 단위로 바로 파일에 씀, 읽기는 mmap
+  질의 중 후보 집합은 int 비트셋으로 AND/OR(C 수준 연산)
+
+질의 예시:
+  oxygen tank            -> 두 검색어를 모두 포함(AND)
+  폭발 OR 누출            -> 둘 중 하나라도 포함(OR)
+  event:info message:탱크 -> 필드 지정 검색
+  "oxygen tank"          -> 공백 포함 부분 문자열
+"""
+
+import json
+import mmap
+import shlex
+import struct
+import sys
+from array import array
+from itertools import chain
+from pathlib import Path
+from typing import Any, Iterable
+
+# n-gram 길이(3-gram). 3글자 이상 검색어는 n-gram 교집합으로 후보를 구합니다.
+NGRAM = 3
+INDEX_SUFFIX = ".idx"
+INDEX_VERSION = 2
+MAGIC = b"MLIDX002"
+_LIST, _BITMAP = 0, 1
+# 포스팅이 이 개수 이상이고 행의 1/32 이상이면 비트맵으로 전환
+_DENSE_MIN = 1024
+# byte 값 -> 켜진 bit 위치(비트셋 -> 행 번호 복원용)
+_BITS = [tuple(b for b in range(8) if v >> b & 1) for v in range(256)]
+
+# 반복 검색을 위해 로드된 색인을 (경로 -> (mtime, size), 색인)으로 보관
+_CACHE: dict[Path, tuple[tuple[tuple[int, int], tuple[int, int]], "LogIndex"]] = {}
+
+
+def index_path_for(json_path: Path) -> Path:
+    '''
+    JSON 결과 파일에 대응하는 색인 파일 경로를 반환합니다.
+    '''
+    json_path = Path(json_path)
+    return json_path.with_name(json_path.name + INDEX_SUFFIX)
+
+
+def ngrams(text: str, n: int = NGRAM) -> set[str]:
+    '''
+    문자열의 n-gram 집합. n보다 짧은 문자열은 문자열 자체를 하나의 gram으로 취급합니다.
+    '''
+    if len(text) < n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def _to_bitmap(docs: Iterable[int], nbytes: int) -> bytearray:
+    bits = bytearray(nbytes)
+    for d in docs:
+        bits[d >> 3] |= 1 << (d & 7)
+    return bits
+
+
+def bits_to_docs(bits: int) -> list[int]:
+    '''
+    int 비트셋 -> 오름차순 행 번호 목록
+    '''
+    out: list[int] = []
+    raw = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    for i, v in enumerate(raw):
+        if v:
+            base = i * 8
+            out.extend(base + b for b in _BITS[v])
+    return out
+
+
+def _stat_key(path: Path) -> tuple[int, int]:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+class IndexBuilder:
+    '''
+    JSON 저장 중 행 단위로 호출되어 (필드, 값)별 행 번호와 행 위치(byte span)를 누적합니다.
+    gram 포스팅은 build()에서 값 단위로 한 번만 n-gram을 계산해 만듭니다(로그는 같은 값이 반복됨).
+    포스팅은 array('I')(원소당 4byte), 자주 나오는 gram은 비트맵(bytearray), 행 위치는 array('Q')
+    '''
+
+    def __init__(self) -> None:
+        self.values: dict[str, dict[str, array]] = {}
+        self.spans = array("Q")
+
+    def __len__(self) -> int:
+        return len(self.spans) // 2
+
+    def add(self, row: Any, start: int, end: int) -> None:
+        '''
+        row: 저장된 행, start/end: JSON 파일 안에서 행 객체의 byte 구간
+        '''
+        doc = len(self)
+        self.spans.append(start)
+        self.spans.append(end - start)
+        if not isinstance(row, dict):
+            return
+        for k, v in row.items():
+            if not isinstance(v, str) or not v:
+                continue
+            field = self.values.get(k)
+            if field is None:
+                field = self.values[str(k)] = {}
+            docs = field.get(v)
+            if docs is None:
+                docs = field[v] = array("I")
+            docs.append(doc)
+
+    def build(self) -> dict[str, dict[str, array | bytearray]]:
+        '''
+        필드별 {gram: 포스팅}. 포스팅은 행 번호 목록(array('I')) 또는 행 비트맵(bytearray)
+        '''
+        n = len(self)
+        nbytes = (n + 7) // 8
+        grams: dict[str, dict[str, array | bytearray]] = {}
+        for field, values in self.values.items():
+            table: dict[str, Any] = {}
+            if len(values) * 4 <= n:
+                # 값이 반복되는 필드: 값별 비트셋을 gram마다 OR
+                for v, docs in values.items():
+                    bits = int.from_bytes(_to_bitmap(docs, nbytes), "little")
+                    for g in ngrams(v.lower()):
+                        table[g] = table.get(g, 0) | bits
+                for g, bits in table.items():
+                    count = bits.bit_count()
+                    if count >= _DENSE_MIN and count * 32 > n:
+                        table[g] = bytearray(bits.to_bytes(nbytes, "little"))
+                    else:
+                        table[g] = array("I", bits_to_docs(bits))
+            else:
+                # 값이 거의 고유한 필드(timestamp 등): 행 번호를 gram 목록에 이어 붙임
+                for v, docs in values.items():
+                    for g in ngrams(v.lower()):
+                        p = table.get(g)
+                        if p is None:
+                            table[g] = array("I", docs)
+                        else:
+                            p.extend(docs)
+                for g, p in table.items():
+                    if len(p) >= _DENSE_MIN and len(p) * 32 > n:
+                        table[g] = _to_bitmap(p, nbytes)
+            grams[field] = table
+        return grams
+
+    def write(self, json_path: Path) -> Path:
+        '''
+        색인을 JSON 옆에 저장합니다. 원본의 (mtime, size)를 기록해 변경 여부를 판단합니다.
+        포스팅은 gram 단위로 바로 기록합니다(전체를 한 문자열로 만들지 않음).
+        '''
+        json_path = Path(json_path)
+        idx_path = index_path_for(json_path)
+        mtime, size = _stat_key(json_path)
+        grams = self.build()
+        nbytes = (len(self) + 7) // 8
+        # 비트맵 길이는 행 수 기준, 목록 포스팅의 4byte 정렬 유지
+        padded = (nbytes + 3) // 4 * 4
+        fields: dict[str, dict[str, list[int]]] = {}
+        pos = 0
+        for field, table in grams.items():
+            entries = fields[field] = {}
+            for g, p in table.items():
+                if type(p) is array:
+                    entries[g] = [_LIST, pos, len(p) * 4]
+                    pos += len(p) * 4
+                else:
+                    entries[g] = [_BITMAP, pos, nbytes]
+                    pos += padded
+        header = {
+            "version": INDEX_VERSION,
+            "byteorder": sys.byteorder,
+            "source": json_path.name,
+            "source_mtime_ns": mtime,
+            "source_size": size,
+            "ngram": NGRAM,
+            "docs": len(self),
+            "fields": fields,
+        }
+        head = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        try:
+            with idx_path.open("wb") as f:
+                f.write(MAGIC)
+                f.write(struct.pack("<Q", len(head)))
+                f.write(head)
+                self.spans.tofile(f)
+                for table in grams.values():
+                    for p in table.values():
+                        if type(p) is array:
+                            p.tofile(f)
+                        else:
+                            f.write(p[:padded].ljust(padded, b"\0"))
+        except OSError as e:
+            raise OSError(f"색인 저장 실패: {idx_path} (사유: {e})") from e
+        return idx_path
+
+
+def parse_query(query: str, fields: Iterable[str] | None = None) -> list[list[tuple[str | None, str]]]:
+    '''
+    질의를 OR로 묶인 AND 그룹 목록으로 변환합니다.
+    예) "a b OR field:c" -> [[(None, "a"), (None, "b")], [("field", "c")]]
+    fields가 주어지면 알려진 필드명일 때만 field:검색어로 해석합니다(10:05 같은 시각 보호).
+    '''
+    known = set(fields) if fields is not None else None
+    try:
+        words = shlex.split(query)
+    except ValueError:
+        # 따옴표 짝이 맞지 않으면 공백 기준으로만 분리
+        words = query.split()
+
+    groups: list[list[tuple[str | None, str]]] = [[]]
+    for w in words:
+        if w == "OR":
+            if groups[-1]:
+                groups.append([])
+            continue
+        if w == "AND":
+            continue
+        field: str | None = None
+        term = w
+        if ":" in w:
+            head, _, tail = w.partition(":")
+            if head and tail and (known is None or head in known):
+                field, term = head, tail
+        groups[-1].append((field, term.lower()))
+    return [g for g in groups if g]
+
+
+class LogIndex:
+    '''
+    디스크 색인을 mmap으로 열어 질의를 처리합니다. load()로 생성합니다.
+    헤더(gram -> 포스팅 위치)만 읽고, 포스팅은 질의에 쓰인 gram만 mmap에서 꺼냅니다.
+    '''
+
+    def __init__(self, json_path: Path, header: dict[str, Any], mm: mmap.mmap, base: int) -> None:
+        self.json_path = Path(json_path)
+        self.n: int = header.get("ngram", NGRAM)
+        self.grams: dict[str, dict[str, list[int]]] = header["fields"]
+        self.docs: int = header["docs"]
+        self._mm = mm
+        self._spans = memoryview(mm)[base:base + self.docs * 16].cast("Q")
+        self._base = base + self.docs * 16
+
+    def close(self) -> None:
+        self._spans.release()
+        self._mm.close()
+
+    @classmethod
+    def load(cls, json_path: Path) -> "LogIndex | None":
+        '''
+        색인이 없거나 JSON이 색인 이후 바뀌었으면 None을 반환합니다.
+        같은 색인은 프로세스 안에서 한 번만 엽니다(색인/JSON 중 하나라도 바뀌면 닫고 다시 확인).
+        '''
+        json_path = Path(json_path).resolve()
+        idx_path = index_path_for(json_path)
+        if not idx_path.exists() or not json_path.exists():
+            return None
+        key = (_stat_key(idx_path), _stat_key(json_path))
+        cached = _CACHE.get(idx_path)
+        if cached:
+            if cached[0] == key:
+                return cached[1]
+            del _CACHE[idx_path]
+            cached[1].close()
+        try:
+            with idx_path.open("rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        try:
+            if mm[:len(MAGIC)] != MAGIC:
+                raise ValueError("형식 불일치")
+            (head_len,) = struct.unpack_from("<Q", mm, len(MAGIC))
+            start = len(MAGIC) + 8
+            header = json.loads(mm[start:start + head_len].decode("utf-8"))
+        except (ValueError, struct.error):
+            mm.close()
+            return None
+        if (header.get("version") != INDEX_VERSION or header.get("byteorder") != sys.byteorder
+                or header.get("source") != json_path.name
+                or (header.get("source_mtime_ns"), header.get("source_size")) != key[1]):
+            mm.close()
+            return None
+        index = cls(json_path, header, mm, start + head_len)
+        _CACHE[idx_path] = (key, index)
+        return index
+
+    def _posting(self, entry: Any) -> int:
+        '''
+        gram 항목 [종류, 위치, 길이] -> int 비트셋
+        '''
+        kind, off, size = entry
+        start = self._base + off
+        if kind == _BITMAP:
+            return int.from_bytes(self._mm[start:start + size], "little")
+        docs = memoryview(self._mm)[start:start + size].cast("I")
+        bits = _to_bitmap(docs, (self.docs + 7) // 8)
+        docs.release()
+        return int.from_bytes(bits, "little")
+
+    def _span(self, doc: int) -> tuple[int, int]:
+        return self._spans[2 * doc], self._spans[2 * doc + 1]
+
+    def _postings(self, field: str, term: str) -> int:
+        table = self.grams.get(field)
+        if not table:
+            return 0
+        if len(term) >= self.n:
+            hit = -1
+            for g in ngrams(term, self.n):
+                e = table.get(g)
+                if not e:
+                    return 0
+                hit &= self._posting(e)
+                if not hit:
+                    break
+            return hit
+        # n보다 짧은 검색어: 검색어를 포함하는 gram들의 합집합
+        out = 0
+        for g, e in table.items():
+            if term in g:
+                out |= self._posting(e)
+        return out
+
+    def candidates(self, field: str | None, term: str) -> int:
+        '''
+        검색어를 포함할 수 있는 행의 int 비트셋(상위 집합)을 반환합니다.
+        '''
+        if field is not None:
+            return self._postings(field, term)
+        out = 0
+        for f in self.grams:
+            out |= self._postings(f, term)
+        return out
+
+    def match_docs(self, groups: list[list[tuple[str | None, str]]]) -> list[int]:
+        '''
+        parse_query 결과에 대한 후보 행 번호(오름차순, 상위 집합, 검증 전)
+        '''
+        docs = 0
+        for group in groups:
+            hit = -1
+            for field, term in sorted(group, key=lambda t: -len(t[1])):
+                hit &= self.candidates(field, term)
+                if not hit:
+                    break
+            docs |= hit
+        return bits_to_docs(docs)
+
+    def search(self, query: str) -> list[dict[str, Any]]:
+        '''
+        질의를 처리하여 일치하는 행을 원본 순서대로 반환합니다.
+        '''
+        groups = parse_query(query, self.grams)
+        docs = self.match_docs(groups)
+        if not docs:
+            return []
+
+        rows: list[dict[str, Any]] = []
+        with self.json_path.open("rb") as f:
+            for doc in docs:
+                start, length = self._span(doc)
+                f.seek(start)
+                row = json.loads(f.read(length).decode("utf-8"))
+                # n-gram 후보는 상위 집합이므로 실제 행으로 최종 검증
+                if isinstance(row, dict) and _match(row, groups):
+                    rows.append(row)
+        return rows
+
+
+class MemoryIndex(LogIndex):
+    '''
+    메모리의 행 목록에 대한 n-gram 색인. 파일 seek 없이 행 목록에서 바로 검증합니다.
+    '''
+
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        builder = IndexBuilder()
+        for row in rows:
+            builder.add(row, 0, 0)
+        self.json_path = None
+        self.n = NGRAM
+        self.grams = builder.build()
+        self.docs = len(rows)
+        self.rows = rows
+
+    def _posting(self, entry: Any) -> int:
+        if type(entry) is array:
+            entry = _to_bitmap(entry, (self.docs + 7) // 8)
+        return int.from_bytes(entry, "little")
+
+    def search(self, query: str) -> list[dict[str, Any]]:
+        groups = parse_query(query, self.grams)
+        return [self.rows[d] for d in self.match_docs(groups) if _match(self.rows[d], groups)]
+
+
+def match_rows(rows: Iterable[dict[str, Any]], query: str) -> list[dict[str, Any]]:
+    '''
+    색인 없이 행을 한 번 훑어 질의와 일치하는 행을 반환합니다(LogIndex.search와 같은 규칙).
+    field:검색어는 첫 행의 필드명 기준으로 해석합니다.
+    '''
+    it = iter(rows)
+    first = next(it, None)
+    if first is None:
+        return []
+    groups = parse_query(query, first.keys() if isinstance(first, dict) else ())
+    hits: list[dict[str, Any]] = []
+    for row in chain((first,), it):
+        if isinstance(row, dict) and _match(row, groups):
+            hits.append(row)
+    return hits
+
+
+def _term_in(row: dict[str, Any], field: str | None, term: str) -> bool:
+    if field is not None:
+        v = row.get(field)
+        return isinstance(v, str) and term in v.lower()
+    return any(isinstance(v, str) and term in v.lower() for v in row.values())
+
+
+def _match(row: dict[str, Any], groups: list[list[tuple[str | None, str]]]) -> bool:
+    return any(all(_term_in(row, f, t) for f, t in g) for g in groups)
@@ -0,0 +1,157 @@
+"""분석 단계 DAG 파이프라인 모듈
+
+한 번 읽고 정렬한 로그를 여러 읽기 전용 단계(JSON 저장, 보고서, 위험 필터, 검색)에 나눠 주고,
+의존 관계가 없는 단계는 풀에서 동시에 실행합니다.
+  - 단계는 add(이름, 함수, deps)로 등록, 함수는 의존 단계 결과를 순서대로 인자로 받음
+  - executor
+      thread : ThreadPoolExecutor(기본, 파일 기록/NumPy 연산이 겹침)
+      process: fork한 작업 프로세스(GIL 회피). 입력은 fork로 물려받아 복사/피클링하지 않고
+               결과(경로 등)만 돌려받음. fork가 없는 플랫폼에서는 thread로 대체
+      serial : 등록 순서대로 하나씩(비교용)
+  - 단계별 소요 시간과 전체 경과 시간을 함께 반환 -> 전체 시간은 합이 아니라 가장 긴 경로에 수렴
+  - 실패한 단계는 errors에 기록하고, 그 단계에 의존하는 단계만 건너뜀
+"""
+
+import multiprocessing as mp
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Any, Callable, NamedTuple
+
+EXECUTORS = ("thread", "process", "serial")
+
+# process 모드에서 fork된 작업 프로세스가 물려받는 단계 함수 표(실행 중에만 채워짐)
+_ACTIVE: dict[str, Callable[..., Any]] = {}
+
+
+class Stage(NamedTuple):
+    name: str
+    fn: Callable[..., Any]
+    deps: tuple[str, ...]
+
+
+class PipelineResult(NamedTuple):
+    '''
+    results: 단계 이름 -> 반환값, timings: 단계 이름 -> 초, errors: 단계 이름 -> 예외,
+    skipped: 의존 단계 실패로 건너뛴 단계, wall: 전체 경과 시간(초)
+    '''
+    results: dict[str, Any]
+    timings: dict[str, float]
+    errors: dict[str, BaseException]
+    skipped: list[str]
+    wall: float
+
+
+def _timed(fn: Callable[..., Any], args: tuple[Any, ...]) -> tuple[Any, float]:
+    t0 = time.perf_counter()
+    value = fn(*args)
+    return value, time.perf_counter() - t0
+
+
+def _timed_active(name: str, args: tuple[Any, ...]) -> tuple[Any, float]:
+    return _timed(_ACTIVE[name], args)
+
+
+class Pipeline:
+    '''
+    작은 DAG 실행기.
+
+        p = Pipeline()
+        p.add("json", lambda: save_to_json(...))
+        p.add("search", lambda path: search_json(path, q), deps=("json",))
+        res = p.run(executor="thread")
+    '''
+
+    def __init__(self) -> None:
+        self.stages: dict[str, Stage] = {}
+
+    def add(self, name: str, fn: Callable[..., Any], deps: tuple[str, ...] = ()) -> "Pipeline":
+        if name in self.stages:
+            raise ValueError(f"이미 등록된 단계입니다.: {name}")
+        missing = [d for d in deps if d not in self.stages]
+        if missing:
+            # 의존 단계를 먼저 등록하게 하여 순환을 원천 차단
+            raise ValueError(f"{name}: 등록되지 않은 의존 단계 {', '.join(missing)}")
+        self.stages[name] = Stage(name, fn, tuple(deps))
+        return self
+
+    def run(self, executor: str = "thread", workers: int | None = None) -> PipelineResult:
+        if executor not in EXECUTORS:
+            raise ValueError(f"executor는 {'/'.join(EXECUTORS)} 중 하나여야 합니다.: {executor}")
+        if executor == "process" and "fork" not in mp.get_all_start_methods():
+            executor = "thread"
+
+        results: dict[str, Any] = {}
+        timings: dict[str, float] = {}
+        errors: dict[str, BaseException] = {}
+        skipped: list[str] = []
+        t0 = time.perf_counter()
+
+        if executor == "serial":
+            for st in self.stages.values():
+                if any(d not in results for d in st.deps):
+                    skipped.append(st.name)
+                    continue
+                try:
+                    results[st.name], timings[st.name] = _timed(st.fn, tuple(results[d] for d in st.deps))
+                except Exception as e:
+                    errors[st.name] = e
+            return PipelineResult(results, timings, errors, skipped, time.perf_counter() - t0)
+
+        size = workers or max(1, len(self.stages))
+        pool: Executor
+        if executor == "process":
+            _ACTIVE.clear()
+            _ACTIVE.update({name: st.fn for name, st in self.stages.items()})
+            pool = ProcessPoolExecutor(max_workers=size, mp_context=mp.get_context("fork"))
+        else:
+            pool = ThreadPoolExecutor(max_workers=size, thread_name_prefix="stage")
+
+        pending = dict(self.stages)
+        running: dict[Future, str] = {}
+        try:
+            with pool:
+                while pending or running:
+                    # 의존 단계가 모두 끝난 단계 제출, 의존 단계가 실패/건너뜀이면 건너뜀
+                    for name, st in list(pending.items()):
+                        if any(d in errors or d in skipped for d in st.deps):
+                            skipped.append(name)
+                            del pending[name]
+                        elif all(d in results for d in st.deps):
+                            args = tuple(results[d] for d in st.deps)
+                            if executor == "process":
+                                fut = pool.submit(_timed_active, name, args)
+                            else:
+                                fut = pool.submit(_timed, st.fn, args)
+                            running[fut] = name
+                            del pending[name]
+                    if not running:
+                        continue
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        name = running.pop(fut)
+                        try:
+                            results[name], timings[name] = fut.result()
+                        except Exception as e:
+                            errors[name] = e
+        finally:
+            _ACTIVE.clear()
+        return PipelineResult(results, timings, errors, skipped, time.perf_counter() - t0)
+
+
+def format_timings(res: PipelineResult, order: list[str] | None = None) -> list[str]:
+    '''
+    단계별 소요 시간 표(출력용 문자열 줄 목록)
+    '''
+    names = order or list(res.timings) + list(res.errors) + res.skipped
+    lines = [f"{'단계':<12}{'초':>10}  상태"]
+    for name in names:
+        if name in res.errors:
+            lines.append(f"{name:<12}{'-':>10}  실패: {res.errors[name]}")
+        elif name in res.skipped:
+            lines.append(f"{name:<12}{'-':>10}  건너뜀")
+        elif name in res.timings:
+            lines.append(f"{name:<12}{res.timings[name]:>10.3f}  완료")
+    total = sum(res.timings.values())
+    lines.append(f"{'단계 합계':<12}{total:>10.3f}")
+    lines.append(f"{'전체 경과':<12}{res.wall:>10.3f}")
+    return lines
@@ -0,0 +1,196 @@
+"""로드된 로그에 대한 대화형 질의(REPL) 모듈
+
+한 번 읽고 정렬한 로그와 색인을 메모리에 둔 채 질의를 반복해서 처리합니다(재파싱/재정렬 없음).
+색인은 첫 질의 때 한 번만 만들며, LogTable(--columnar)이면 dict 행 목록으로 바꾸지 않고 컬럼에서 바로 만듭니다.
+  - 키워드 : search_json과 같은 문법(AND/OR, field:검색어, 따옴표) -> log_index.MemoryIndex
+  - 레벨   : level/event 값별 행 번호 목록(대소문자 무시)
+  - 시간   : epoch 오름차순 배열 + 이진 탐색(bisect)
+질의마다 결과 건수와 처리 시간(ms)을 함께 출력합니다.
+
+명령:
+  <검색어>                 키워드 검색        예) oxygen tank / 폭발 OR 누출 / event:info message:tank
+  :level <값>              레벨 검색          예) :level ERROR
+  :range <시작> <끝>       시간 구간(오름차순) 예) :range "2023-08-27 10:02" "2023-08-27 10:05"
+  :limit <N>               출력 행 수 제한(기본 35, 0=건수만)
+  :help / :quit            도움말 / 종료(빈 줄, EOF도 종료)
+"""
+
+import shlex
+import time
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import Any, Callable, Iterable, Iterator
+
+from log_index import MemoryIndex
+from time_index import to_epoch
+
+try:
+    import numpy as np
+    from log_table import EPOCH_NA, Categorical, LogTable
+except ImportError:  # NumPy 없음 -> dict 행 목록만 지원
+    LogTable = None
+
+PROMPT = "> "
+DEFAULT_LIMIT = 35
+
+
+class _TableRows:
+    '''
+    LogTable을 dict 행 시퀀스처럼 보이게 하는 얇은 뷰(행 dict는 접근할 때만 만듦)
+    '''
+
+    def __init__(self, table: Any) -> None:
+        self.table = table
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __getitem__(self, i: int) -> dict[str, Any]:
+        return self.table.row(int(i))
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return self.table.iter_rows()
+
+
+class LogSession:
+    '''
+    질의용 메모리 상주 세션. rows는 read_log_file/sort_log_datetime 결과(dict 행 목록 또는 LogTable)입니다.
+    색인(n-gram, 레벨, 시각)은 build()에서 한 번만 만들며, 질의 메서드가 처음 불릴 때 자동으로 호출됩니다.
+    '''
+
+    def __init__(self, rows: Iterable[dict[str, Any]] | Any) -> None:
+        self._table = rows if LogTable is not None and isinstance(rows, LogTable) else None
+        self.rows: Any = _TableRows(rows) if self._table is not None else list(rows)
+        self.index: MemoryIndex | None = None
+        self.levels: dict[str, list[int]] = {}
+        self.epochs: list[int] = []
+        self.order: list[int] = []
+        self.build_seconds = 0.0
+
+    @property
+    def built(self) -> bool:
+        return self.index is not None
+
+    def build(self) -> None:
+        if self.built:
+            return
+        t0 = time.perf_counter()
+        if self._table is not None:
+            self._build_table(self._table)
+        else:
+            self._build_rows(self.rows)
+        self.index = MemoryIndex(self.rows)
+        self.build_seconds = time.perf_counter() - t0
+
+    def _build_rows(self, rows: list[dict[str, Any]]) -> None:
+        levels: dict[str, list[int]] = defaultdict(list)
+        timed: list[tuple[int, int]] = []
+        for i, row in enumerate(rows):
+            level = row.get("level") or row.get("event")
+            if isinstance(level, str) and level:
+                levels[level.lower()].append(i)
+            ts = row.get("timestamp")
+            if isinstance(ts, str):
+                try:
+                    timed.append((to_epoch(ts), i))
+                except ValueError:
+                    continue
+        # 동시각은 원래(행 목록) 순서 유지
+        timed.sort(key=lambda t: t[0])
+        self.levels = dict(levels)
+        self.epochs = [e for e, _ in timed]
+        self.order = [i for _, i in timed]
+
+    def _build_table(self, table: Any) -> None:
+        # 레벨: level이 비어 있으면 event(dict 행의 row.get("level") or row.get("event")와 같은 규칙)
+        labels = np.full(len(table), -1, dtype=np.int64)
+        names: list[str] = []
+        for name in ("event", "level"):
+            col = table.data.get(name)
+            if not isinstance(col, Categorical):
+                continue
+            offset = len(names)
+            names.extend(col.categories)
+            valid = col.codes >= 0
+            if "" in col.categories:
+                valid &= col.codes != col.categories.index("")
+            labels = np.where(valid, col.codes.astype(np.int64) + offset, labels)
+        groups: dict[str, list[np.ndarray]] = defaultdict(list)
+        for code in np.unique(labels[labels >= 0]).tolist():
+            groups[names[code].lower()].append(np.flatnonzero(labels == code))
+        self.levels = {k: np.sort(np.concatenate(v)).tolist() for k, v in groups.items()}
+
+        # 시각: epoch 오름차순 안정 정렬(파싱 실패 행 제외)
+        asc = table.time_order(reverse=False)
+        asc = asc[table.epoch[asc] != EPOCH_NA]
+        self.epochs = table.epoch[asc].tolist()
+        self.order = asc.tolist()
+
+    def search(self, query: str) -> list[dict[str, Any]]:
+        self.build()
+        return self.index.search(query)
+
+    def by_level(self, level: str) -> list[dict[str, Any]]:
+        self.build()
+        return [self.rows[i] for i in self.levels.get(level.lower(), [])]
+
+    def between(self, start: str, end: str) -> list[dict[str, Any]]:
+        '''
+        start <= timestamp <= end 인 행을 시간 오름차순으로 반환합니다.
+        '''
+        self.build()
+        lo = bisect_left(self.epochs, to_epoch(start))
+        hi = bisect_right(self.epochs, to_epoch(end))
+        return [self.rows[i] for i in self.order[lo:hi]]
+
+
+def run_repl(session: LogSession, read: Callable[[str], str] = input, limit: int = DEFAULT_LIMIT) -> None:
+    '''
+    빈 줄/EOF/:quit 까지 질의를 반복 처리합니다. 색인은 첫 질의 때 만듭니다.
+    '''
+    print(f"[REPL] {len(session.rows)}건 로드")
+    print("   검색어 / :level 값 / :range 시작 끝 / :limit N / :help / :quit (빈 줄=종료)")
+    while True:
+        try:
+            line = read(PROMPT).strip()
+        except (EOFError, KeyboardInterrupt):
+            print()
+            break
+        if not line or line in (":quit", ":q", ":exit"):
+            break
+        if line == ":help":
+            print(__doc__)
+            continue
+
+        if not line.startswith((":limit", ":help")) and not session.built:
+            session.build()
+            levels = ", ".join(sorted(session.levels)) or "-"
+            print(f"[REPL] 색인 {session.build_seconds * 1000:.1f} ms (레벨: {levels})")
+
+        t0 = time.perf_counter()
+        try:
+            if line.startswith(":"):
+                cmd, _, rest = line.partition(" ")
+                args = shlex.split(rest)
+                if cmd == ":limit" and len(args) == 1:
+                    limit = max(0, int(args[0]))
+                    print(f"출력 제한: {limit}행")
+                    continue
+                if cmd == ":level" and len(args) == 1:
+                    hits = session.by_level(args[0])
+                elif cmd == ":range" and len(args) == 2:
+                    hits = session.between(*args)
+                else:
+                    print(f"[입력 오류] 알 수 없는 명령/인자: {line} (:help 참고)")
+                    continue
+            else:
+                hits = session.search(line)
+        except ValueError as e:
+            print(f"[입력 오류] {e}")
+            continue
+        ms = (time.perf_counter() - t0) * 1000
+
+        for h in hits[:limit]:
+            print(h)
+        more = f" (앞 {limit}건 출력)" if len(hits) > limit else ""
+        print(f"검색 결과: {len(hits)}건, {ms:.2f} ms{more}")
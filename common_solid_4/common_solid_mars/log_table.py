@@ -0,0 +1,278 @@
+"""mission_computer_main.log 컬럼형(NumPy) 로그 테이블
+
+행마다 dict(키 이름 + orig_idx)를 들고 다니는 대신 컬럼별 배열로 보관합니다.
+  - 컬럼 이름: sys.intern으로 한 번만 보관
+  - level / event: 범주형(categorical) -> int32 코드 + 범주 목록
+  - timestamp: 원본 문자열 + int64 epoch 컬럼(파싱 실패는 EPOCH_NA)
+  - message 등 나머지: NumPy StringDType 문자열 컬럼
+  - orig_idx: int64 배열(원본 CSV의 1-based 행 번호)
+
+정렬/필터/집계/보고서 통계는 모두 배열 연산(argsort, 불리언 마스크, bincount)으로 처리합니다.
+NumPy가 필요하며, main.py에서는 --columnar 옵션으로 사용합니다.
+"""
+
+import csv
+import sys
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+import numpy as np
+
+from log_correlate import DEFAULT_WINDOW, correlate
+from log_format import detect_format
+from time_index import epoch_to_str, parse_epoch
+
+EPOCH_NA = np.iinfo(np.int64).min  # 파싱 실패 시각(정렬 시 datetime.min과 같은 위치)
+CATEGORICAL = ("level", "event")
+_STR = np.dtypes.StringDType()
+
+
+class Categorical:
+    '''
+    범주형 컬럼: codes[i]는 categories 인덱스, 값이 없으면 -1
+    '''
+
+    def __init__(self, codes: np.ndarray, categories: list[str]) -> None:
+        self.codes = codes
+        self.categories = categories
+
+    @classmethod
+    def encode(cls, values: Iterable[str | None]) -> "Categorical":
+        lookup: dict[str, int] = {}
+        codes = np.fromiter(
+            (-1 if v is None else lookup.setdefault(v, len(lookup)) for v in values),
+            dtype=np.int32,
+        )
+        return cls(codes, list(lookup))
+
+    def take(self, idx: np.ndarray) -> "Categorical":
+        return Categorical(self.codes[idx], self.categories)
+
+    def value(self, i: int) -> str | None:
+        c = self.codes[i]
+        return None if c < 0 else self.categories[c]
+
+    def contains(self, needle: str) -> np.ndarray:
+        '''
+        소문자 부분 문자열 포함 여부 마스크. 범주 목록만 검사 후 코드로 펼칩니다.
+        '''
+        hit = np.array([needle in c.lower() for c in self.categories] + [False], dtype=bool)
+        return hit[self.codes]  # -1 코드는 마지막 False를 가리킴
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+class LogTable:
+    '''
+    컬럼형 로그 테이블. from_csv()/from_rows()로 생성합니다.
+    '''
+
+    def __init__(self, columns: list[str], data: dict[str, Any], epoch: np.ndarray, orig_idx: np.ndarray) -> None:
+        self.columns = columns
+        self.data = data
+        self.epoch = epoch
+        self.orig_idx = orig_idx
+        self._lowered: dict[str, np.ndarray] = {}  # 소문자 문자열 컬럼(contains용, 처음 쓸 때 한 번만 계산)
+
+    def __len__(self) -> int:
+        return len(self.orig_idx)
+
+    # ---------- 생성 ----------
+    @classmethod
+    def from_records(cls, header: list[str], records: Iterable[list[str]]) -> "LogTable":
+        '''
+        헤더와 레코드(문자열 리스트) iterable로 테이블을 만듭니다. 행 dict는 만들지 않습니다.
+        '''
+        columns = [sys.intern(h.strip()) for h in header]
+        raw: list[list[str | None]] = [[] for _ in columns]
+        for rec in records:
+            if not rec:
+                continue
+            for j, col in enumerate(raw):
+                col.append(rec[j].strip() if j < len(rec) else None)
+
+        data: dict[str, Any] = {}
+        for name, values in zip(columns, raw):
+            if name in CATEGORICAL:
+                data[name] = Categorical.encode(values)
+            else:
+                data[name] = np.array(["" if v is None else v for v in values], dtype=_STR)
+
+        ts = raw[columns.index("timestamp")] if "timestamp" in columns else []
+        epoch = np.fromiter((EPOCH_NA if (e := parse_epoch(v)) is None else e for v in ts),
+                            dtype=np.int64, count=len(ts))
+        if not len(epoch):
+            epoch = np.full(len(raw[0]) if raw else 0, EPOCH_NA, dtype=np.int64)
+        orig_idx = np.arange(1, len(epoch) + 1, dtype=np.int64)
+        return cls(columns, data, epoch, orig_idx)
+
+    @classmethod
+    def from_csv(cls, path: Path) -> "LogTable":
+        '''
+        read_log_file과 같은 규칙(detect_format: BOM/구분자 감지 + 캐시)으로 CSV를 읽습니다.
+        '''
+        path = Path(path)
+        fmt = detect_format(path)
+        with path.open("r", encoding=fmt.encoding, newline="") as f:
+            reader = csv.reader(f, **fmt.fmtparams())
+            header = next(reader, [])
+            return cls.from_records(header, reader)
+
+    @classmethod
+    def from_rows(cls, rows: list[dict[str, Any]]) -> "LogTable":
+        '''
+        read_log_file 결과(dict 행 리스트)를 테이블로 변환합니다.
+        '''
+        if not rows:
+            return cls.from_records([], [])
+        header = [k for k in rows[0] if k != "orig_idx"]
+        table = cls.from_records(header, ([r.get(k) or "" for k in header] for r in rows))
+        table.orig_idx = np.array([r.get("orig_idx", i) for i, r in enumerate(rows, start=1)], dtype=np.int64)
+        return table
+
+    # ---------- 변환 ----------
+    def take(self, idx: np.ndarray) -> "LogTable":
+        '''
+        인덱스 배열 또는 불리언 마스크로 행을 골라 새 테이블을 만듭니다.
+        '''
+        data = {k: v.take(idx) if isinstance(v, Categorical) else v[idx] for k, v in self.data.items()}
+        return LogTable(self.columns, data, self.epoch[idx], self.orig_idx[idx])
+
+    def __getitem__(self, key: slice) -> "LogTable":
+        return self.take(np.arange(len(self))[key])
+
+    def value(self, name: str, i: int) -> str | None:
+        col = self.data[name]
+        return col.value(i) if isinstance(col, Categorical) else str(col[i])
+
+    def row(self, i: int) -> dict[str, Any]:
+        out: dict[str, Any] = {name: self.value(name, i) for name in self.columns}
+        out["orig_idx"] = int(self.orig_idx[i])
+        return out
+
+    def iter_rows(self) -> Iterator[dict[str, Any]]:
+        '''
+        read_log_file과 같은 형태의 dict 행을 하나씩 만들어 냅니다(출력/저장용).
+        '''
+        for i in range(len(self)):
+            yield self.row(i)
+
+    __iter__ = iter_rows
+
+    # ---------- 정렬/필터/집계 ----------
+    def sort_by_time(self, reverse: bool = True) -> "LogTable":
+        '''
+        epoch 기준 안정 정렬. reverse=True는 sorted(..., reverse=True)와 같은 순서입니다.
+        '''
+        return self.take(self.time_order(reverse))
+
+    def time_order(self, reverse: bool = True) -> np.ndarray:
+        '''
+        sort_by_time의 행 인덱스 순서
+        '''
+        if reverse:
+            # 뒤집어서 안정 정렬 후 다시 뒤집어야 동순위 행의 원래 순서가 유지됨
+            order = np.argsort(self.epoch[::-1], kind="stable")
+            return (len(self) - 1 - order)[::-1]
+        return np.argsort(self.epoch, kind="stable")
+
+    def _lower(self, name: str) -> np.ndarray:
+        col = self._lowered.get(name)
+        if col is None:
+            col = self._lowered[name] = np.strings.lower(self.data[name])
+        return col
+
+    def contains(self, needle: str) -> np.ndarray:
+        '''
+        문자열 컬럼 중 하나라도 needle(대소문자 무시)을 포함하는 행 마스크
+        '''
+        needle = needle.lower()
+        mask = np.zeros(len(self), dtype=bool)
+        for name, col in self.data.items():
+            if isinstance(col, Categorical):
+                mask |= col.contains(needle)
+            else:
+                mask |= np.strings.find(self._lower(name), needle) >= 0
+        return mask
+
+    def keyword_masks(self, keywords: Iterable[str]) -> dict[str, np.ndarray]:
+        return {kw: self.contains(kw) for kw in keywords}
+
+    def level_counts(self) -> list[tuple[str, int]]:
+        '''
+        level(없으면 event) 값 분포. Counter.most_common과 같은 순서(건수 내림차순, 동률은 먼저 나온 순).
+        '''
+        labels = np.full(len(self), -1, dtype=np.int64)
+        names: list[str] = []
+        for name in ("event", "level"):
+            col = self.data.get(name)
+            if not isinstance(col, Categorical):
+                continue
+            offset = len(names)
+            names.extend(col.categories)
+            valid = col.codes >= 0
+            if "" in col.categories:
+                valid &= col.codes != col.categories.index("")
+            # level이 있으면 level 우선(나중에 덮어씀)
+            labels = np.where(valid, col.codes.astype(np.int64) + offset, labels)
+        present = labels >= 0
+        if not present.any():
+            return []
+        # 같은 문자열이 level/event 양쪽에 있으면 합침
+        merged: dict[str, tuple[int, int]] = {}
+        uniq, first, counts = np.unique(labels[present], return_index=True, return_counts=True)
+        for u, f, c in zip(uniq, first, counts):
+            name = names[u]
+            cnt, pos = merged.get(name, (0, len(self)))
+            merged[name] = (cnt + int(c), min(pos, int(f)))
+        return [(k, v[0]) for k, v in sorted(merged.items(), key=lambda kv: (-kv[1][0], kv[1][1]))]
+
+    def report_stats(self, keywords: Iterable[str], recent: int = 5, seq_limit: int = 10,
+                     window: float = DEFAULT_WINDOW) -> dict[str, Any]:
+        '''
+        generate_markdown_report에 필요한 통계를 배열 연산으로 계산합니다.
+        '''
+        keywords = list(keywords)
+        valid = self.epoch != EPOCH_NA
+        start = epoch_to_str(self.epoch[valid].min()) if valid.any() else "N/A"
+        end = epoch_to_str(self.epoch[valid].max()) if valid.any() else "N/A"
+
+        masks = self.keyword_masks(keywords)
+        order = []
+        for k_i, kw in enumerate(keywords):
+            m = masks[kw]
+            cnt = int(m.sum())
+            if cnt:
+                order.append((-cnt, int(m.argmax()), k_i, kw))
+        risk_counts = [(kw, -neg) for neg, _, _, kw in sorted(order)]
+
+        # 행 순서대로 등장 키워드 나열(앞 seq_limit개만 필요하므로 일찍 중단)
+        seq: list[str] = []
+        if order:
+            stacked = np.vstack([masks[kw] for kw in keywords])
+            for i in np.flatnonzero(stacked.any(axis=0)):
+                seq.extend(kw for k_i, kw in enumerate(keywords) if stacked[k_i, i])
+                if len(seq) >= seq_limit:
+                    break
+
+        # 상관 분석: 키워드가 있는 행만 시간 오름차순(동시각은 원래 순서)으로 한 번 훑음
+        asc = self.time_order(reverse=False)
+        any_hit = np.logical_or.reduce([masks[kw] for kw in keywords]) if keywords else np.zeros(len(self), bool)
+        rows = asc[any_hit[asc] & valid[asc]]
+        events = (
+            (float(self.epoch[i]), [kw for kw in keywords if masks[kw][i]])
+            for i in rows
+        )
+        correlation = correlate(events, keywords, window=window)
+
+        return {
+            "total": len(self),
+            "start": start,
+            "end": end,
+            "level_counts": self.level_counts(),
+            "risk_counts": risk_counts,
+            "recent": [self.row(int(i)) for i in self.time_order()[:recent]],
+            "risk_seq": seq[:seq_limit],
+            "correlation": correlation,
+        }
@@ -5,26 +5,62 @@
   ② timestamp 기준 역순 정렬하여 출력
   ③ 리스트를 딕셔너리로 변환하여 출력
   ④ JSON 파일로 저장 (동명이면 덮어쓰지 않도록 타임스탬프를 붙여 저장)
+  ⑤ --index: JSON 저장 시 역색인(.idx)을 함께 생성하여 검색 가속(log_index.py)
+  ⑥ --range 시작 끝: 시간 색인(.tidx)으로 구간 행만 바로 조회(time_index.py)
+  ⑦ --columnar: NumPy 컬럼형 테이블로 정렬/필터/집계/보고서 처리(log_table.py)
+  ⑧ --follow: 로그를 tail 하며 보고서를 증분 갱신(최대 --interval 초마다 재작성, log_follow.py)
+  ⑨ 디렉터리/glob 입력: 여러 로그를 동시에 읽고 시간순 k-way 병합하여 하나의 보고서 생성
+  ⑩ 보고서 원인 가설: 시간 창(--window) 기반 버스트/지연/인과 사슬 분석(log_correlate.py)
+  ⑪ JSON 저장/보고서/위험 필터/검색을 DAG 파이프라인으로 동시 실행, 단계별 시간 출력(log_pipeline.py)
+  ⑫ 대화형 질의(REPL): 로드된 로그와 색인을 메모리에 두고 키워드/레벨/시간 구간 질의 반복(log_repl.py)
+     - 터미널에서 실행했거나 --repl일 때만(배치/파이프 실행은 색인을 만들지 않고 종료)
 
 제약사항:
   - Python 3.x, PEP 8 일부 준수, 함수별 독스트링 포함
   - UTF-8 / UTF-8-SIG 인코딩 지원
   - CSV 구분자 자동 추정(csv.Sniffer), 실패 시 엑셀 기본 Dialect
+  - 인코딩/구분자 감지 결과는 파일별로 캐시(log_format.py)
 """
 
 # 구현에 필요한 라이브러리를 호출합니다.
+import argparse
 import csv
+import glob
+import heapq
 import re
 import json
+import sys
+import time
 from datetime import datetime
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Iterable
 from sys import argv
 
+from json_writer import JSON_MODES, JsonStreamWriter, timestamped_path
+from log_index import IndexBuilder, LogIndex, match_rows
+from log_correlate import DEFAULT_WINDOW, correlate
+from log_follow import LiveReport, LogTailer
+from log_format import detect_format
+from log_pipeline import EXECUTORS, Pipeline, format_timings
+from log_repl import LogSession, run_repl
+from time_index import TS_FORMAT, parse_ts, query_time_range, to_epoch
+
+try:
+    import numpy as np
+    from log_table import LogTable
+except ImportError:  # NumPy가 없으면 컬럼형 테이블(--columnar) 없이 dict 행으로만 동작
+    np = None
+    LogTable = None
+
 # 위험 키워드 정의
 RISK_KEYWORDS = ("폭발", "누출", "고온", "Oxygen")
 
+# 디렉터리 입력 시 읽을 로그 패턴 / 제외할 사이드카 확장자
+LOG_PATTERNS = ("*.log", "*.csv")
+SIDECAR_SUFFIXES = (".tidx", ".fmt", ".idx")
+
 # import os
 # LOG_ENV = "LOG_FILE"
 # RESULT_ENV = "RESULT"
@@ -42,25 +78,60 @@ RISK_KEYWORDS = ("폭발", "누출", "고온", "Oxygen")
     
 #     return Path(log_file), Path(result_file)
 
-def require_env() -> tuple[Path, Path]:
-    '''(.env 미사용) CLI 인자 또는 기본값으로 경로 반환
-    사용법: python main.py [로그파일경로] [결과경로(디렉터리 또는 .json)]
+def parse_args(args: list[str] | None = None) -> argparse.Namespace:
+    '''CLI 인자 해석
+    사용법: python main.py [로그파일경로] [결과경로(디렉터리 또는 .json)] [--range 시작 끝]
     '''
     base = Path.cwd()
-    log = Path(argv[1]) if len(argv) > 1 else base / "mission_computer_main.log"
-    out = Path(argv[2]) if len(argv) > 2 else base / "result"
+    parser = argparse.ArgumentParser(description="mission_computer_main.log 분석")
+    parser.add_argument("log", nargs="?", default=base / "mission_computer_main.log", type=Path,
+                        help='로그 파일/디렉터리/glob 경로 (예: "logs/**/*.log", 따옴표 필수)')
+    parser.add_argument("out", nargs="?", default=base / "result", type=Path,
+                        help="결과 경로(디렉터리 또는 .json)")
+    parser.add_argument("--range", nargs=2, metavar=("START", "END"), dest="time_range",
+                        help='시간 구간 조회만 수행 (예: --range "2023-08-27 10:02" "2023-08-27 10:05")')
+    parser.add_argument("--json-mode", choices=JSON_MODES, default="pretty",
+                        help="JSON 저장 형식(pretty=indent 2, compact=한 줄, ndjson=행 단위)")
+    parser.add_argument("--columnar", action="store_true",
+                        help="NumPy 컬럼형 테이블(log_table.py)로 읽고 정렬/필터/보고서를 벡터 연산으로 처리")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="여러 로그를 동시에 읽을 스레드 수(기본: 파일 수, 최대 8)")
+    parser.add_argument("--window", type=float, default=DEFAULT_WINDOW,
+                        help=f"위험 키워드 상관 분석 시간 창(초, 기본 {DEFAULT_WINDOW})")
+    parser.add_argument("--follow", action="store_true",
+                        help="로그 끝을 계속 추적하며 log_analysis.md를 주기적으로 갱신(Ctrl+C로 종료)")
+    parser.add_argument("--interval", type=float, default=5.0,
+                        help="--follow 모드의 보고서 최소 갱신 간격(초, 기본 5)")
+    parser.add_argument("--executor", choices=EXECUTORS, default="thread",
+                        help="저장/보고서/필터/검색 단계 실행 방식(thread=스레드 풀, process=fork 프로세스, serial=순차)")
+    parser.add_argument("--index", action="store_true",
+                        help="JSON 저장 시 역색인(.idx)도 생성(같은 JSON을 여러 번 검색할 때)")
+    parser.add_argument("--query", default=None,
+                        help="검색어를 미리 지정하면 검색도 파이프라인 단계로 실행(입력 프롬프트 생략)")
+    parser.add_argument("--repl", action="store_true",
+                        help="표준 입력이 터미널이 아니어도 대화형 질의 실행(기본: 터미널일 때만)")
+    ns = parser.parse_args(argv[1:] if args is None else args)
 
     # 홈(~) 확장 + 절대경로 정규화 (협업/클론 환경에서도 안전)
-    log = log.expanduser().resolve()
-    out = out.expanduser().resolve()
-    return log, out
+    ns.log = Path(ns.log).expanduser().resolve()
+    ns.out = Path(ns.out).expanduser().resolve()
+    return ns
+
+def require_env() -> tuple[Path, Path]:
+    '''(.env 미사용) CLI 인자 또는 기본값으로 경로 반환
+    사용법: python main.py [로그파일경로] [결과경로(디렉터리 또는 .json)]
+    '''
+    ns = parse_args()
+    return ns.log, ns.out
 
 def read_log_file(path: Path) -> list[dict[str, Any]]:
     '''
     Args:
     구현 기능
     - log file read 리스트 형태로 반환
-    - 인코딩은 utf-8 -> 실패하면 utf-8-sig로 재시도 구현
+    - 인코딩/구분자는 detect_format으로 한 번만 감지(BOM 확인 + 4KB 바이트 샘플)
+      -> 디코딩 실패 시 파일 전체를 다시 읽는 재시도 없음
+      -> (경로, 크기, mtime) 기준 캐시(<로그파일>.fmt)로 재실행 시 감지 생략
     - csv.Sniffer 사용. 구분자 자동 추정(, ; | TAB)
     - 모든 문자열 k/v 값에 대해 공백제거 -> .strip()
     - csv.DictReader:  콤마를 기준 가정, Sniffer로 구분자 추정
@@ -71,52 +142,82 @@ def read_log_file(path: Path) -> list[dict[str, Any]]:
     # 2. main에서 사용자의 직관적인 메세지 처리.
     if not path.exists():
         raise FileNotFoundError(f"로그 파일을 찾을 수 없습니다.: {path}")
-    
-    # 인코딩 시도
-    for enc in ("utf-8","utf-8-sig"):
-        try:
-            with path.open('r', encoding=enc, newline="") as f:
-                # 구분자 추정(,/;/tab/파이프)
-                sample = f.read(4096)
-                f.seek(0)
-                try:
-                    dialect = csv.Sniffer().sniff(sample, delimiters=',;\t|')
-                except csv.Error:
-                    # 추정 실패 시 콤마 기본
-                    dialect = csv.get_dialect('excel') # 실패 시 기본값 세팅
-
-                reader = csv.DictReader(f, dialect=dialect)
-                rows: list[dict[str, Any]] = []
-                for i, row in enumerate(reader, start=1):
-                    # 키/값 str이면 좌우 공백 제거
-                    clean = {
-                        (k.strip() if isinstance(k, str) else k):
-                        (v.strip() if isinstance(v, str) else v)
-                        for k, v in row.items()
-                    }
-                    clean["orig_idx"] = i   # ← 원본 CSV의 1-based 행 번호
-                    rows.append(clean)
-                return rows
-        except UnicodeDecodeError:
-            continue
-
-    # 모든 인코딩 시도 실패.
-    raise UnicodeDecodeError("utf-8/utf-8-sig", b"", 0, 1, "지원 인코딩으로 디코딩 실패")
+
+    fmt = detect_format(path)
+    with path.open('r', encoding=fmt.encoding, newline="") as f:
+        reader = csv.DictReader(f, **fmt.fmtparams())
+        rows: list[dict[str, Any]] = []
+        for i, row in enumerate(reader, start=1):
+            # 키/값 str이면 좌우 공백 제거
+            clean = {
+                (k.strip() if isinstance(k, str) else k):
+                (v.strip() if isinstance(v, str) else v)
+                for k, v in row.items()
+            }
+            clean["orig_idx"] = i   # ← 원본 CSV의 1-based 행 번호
+            rows.append(clean)
+        return rows
 
 def sort_log_datetime(logs):
     '''
     Args:
     - timestamp 필드 기준으로 시간 역순 정렬을 위한 함수입니다.
     - (YYYY-MM-DD HH:MM:SS) 기준 역순 정렬
+    - LogTable이면 epoch 컬럼 argsort로 정렬
     '''
-    def key(row: dict[str, Any]):
-        ts = parse_ts_safe(row.get("timestamp"))
-        return ts or datetime.min   # 파싱 실패 시 안전하게 최소값
+    if _is_table(logs):
+        return logs.sort_by_time(reverse=True)
     try:
-        return sorted(logs, key=key, reverse=True)
+        return sorted(logs, key=_ts_key, reverse=True)
     except Exception:
         return logs
 
+def _ts_key(row: dict[str, Any]) -> datetime:
+    ts = parse_ts(row.get("timestamp"))
+    return ts or datetime.min   # 파싱 실패 시 안전하게 최소값
+
+def expand_log_paths(spec: Path | str) -> list[Path]:
+    '''
+    로그 경로를 실제 파일 목록으로 펼칩니다.
+    - 디렉터리: 안의 *.log / *.csv 전체
+    - glob 패턴(*, ?, [ ]): 일치하는 파일 전체(** 재귀 지원, 셸 확장을 피하려면 따옴표로 감싸기)
+    - 그 외: 단일 파일 그대로
+    색인/캐시 사이드카(.tidx, .fmt, .idx)는 제외합니다.
+    '''
+    spec = Path(spec)
+    if spec.is_dir():
+        found = [p for pat in LOG_PATTERNS for p in spec.glob(pat)]
+    elif any(ch in str(spec) for ch in "*?["):
+        found = [Path(p) for p in glob.glob(str(spec), recursive=True)]
+    else:
+        return [spec]
+    return sorted({p for p in found if p.is_file() and p.suffix not in SIDECAR_SUFFIXES})
+
+def _read_sorted(path: Path, tag: bool) -> list[dict[str, Any]]:
+    '''
+    파일 하나를 읽어 시간 역순으로 정렬합니다(이미 정렬된 로그면 timsort가 선형 시간).
+    tag=True면 행마다 출처 파일명(source)을 붙입니다.
+    '''
+    rows = read_log_file(path)
+    if tag:
+        for row in rows:
+            row["source"] = path.name
+    return sort_log_datetime(rows)
+
+def read_log_files(paths: list[Path], workers: int | None = None) -> list[dict[str, Any]]:
+    '''
+    여러 로그 파일을 스레드 풀로 동시에 읽고, 파일별 정렬 결과를 힙(heapq.merge)으로
+    k-way 병합하여 전체 시간 역순 목록을 만듭니다(전체 재정렬 없음, O(n log k)).
+    '''
+    if len(paths) == 1:
+        return _read_sorted(paths[0], tag=False)
+    with ThreadPoolExecutor(max_workers=workers or min(8, len(paths))) as pool:
+        streams = list(pool.map(lambda p: _read_sorted(p, tag=True), paths))
+    return list(heapq.merge(*streams, key=_ts_key, reverse=True))
+
+def _is_table(logs: Any) -> bool:
+    return LogTable is not None and isinstance(logs, LogTable)
+
 def convert_list_to_dict(logs: list[dict[str, Any]]) -> dict[int, dict[str, Any]]:
     '''
     Args:
@@ -125,43 +226,41 @@ def convert_list_to_dict(logs: list[dict[str, Any]]) -> dict[int, dict[str, Any]
     '''
     return {i: log for i, log in enumerate(logs, start=1)}
 
-def save_to_json(data: dict[int, dict[str, Any]] | list[dict[str, Any]], result_path: Path, *, default_stem: str = "mission_computer_main",) -> Path:
+def result_dir_for(result_path: Path) -> Path:
+    '''
+    save_to_json이 JSON을 기록할 폴더(.json/.ndjson 경로면 상위 폴더)
+    '''
+    p = Path(result_path)
+    return p.parent if p.suffix.lower() in (".json", ".ndjson") else p
+
+def save_to_json(data: dict[int, dict[str, Any]] | Iterable[dict[str, Any]], result_path: Path, *, default_stem: str = "mission_computer_main", build_index: bool = False, mode: str = "pretty") -> Path:
     '''
     - JSON 저장(폴더 자동 생성 및 예외 처리 포함)
     - 결과물을 timestamp 기준으로 덮어쓰기 방지하는 함수입니다.
     - 상위 폴더 없으면 자동생성
     - 파일 생성 중 오류 발생하면 메세지 출력 및 예외
+    - 행 단위로 바로 기록(JsonStreamWriter) -> 전체를 한 문자열로 만들지 않음
+    - data는 딕셔너리/리스트 외에 제너레이터 등 임의의 행 iterable도 가능
+    - mode: pretty(기본, indent=2) / compact / ndjson
+    - build_index=True면 기록하면서 역색인(<JSON 파일명>.idx)을 함께 생성(선택, 저장 시간/메모리 추가)
     '''
-    # 현재 시간을 기반 파일 생성
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    p = Path(result_path)
-    # 확장자가 json이라면 파일로 간주, 아니면 폴더로 간주
-    if p.suffix.lower() == ".json":
-        base = p.with_suffix(".json")
-        base.parent.mkdir(parents=True, exist_ok=True)
-        out = base.with_name(f"{base.stem}_{ts}{base.suffix}")
-
-    else:
-        p.mkdir(parents=True, exist_ok=True)
-        out = p / f"{default_stem}_{ts}.json"
+    out = timestamped_path(result_path, default_stem, mode)
+    builder = IndexBuilder() if build_index else None
+    is_dict = isinstance(data, dict)
+    items = data.items() if is_dict else ((None, row) for row in data)
     try:
-        out.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        with JsonStreamWriter(out, mode=mode, keyed=is_dict) as w:
+            for k, row in items:
+                start, end = w.write(row, key=k)
+                if builder is not None:
+                    builder.add(row, start, end)
+        if builder is not None:
+            builder.write(out)
     except OSError as e:
         raise OSError(f"결과물 저장 실패: {out} (사유: {e})") from e
     return out
 
 # 사고 분석 보고서
-def parse_ts_safe(s: Any) -> datetime | None:
-    '''
-    문자열을 datatime으로 안전 파싱(형식 다르면 None).
-    '''
-    if isinstance(s, str):
-        try:
-            return datetime.strptime(s.strip(), "%Y-%m-%d %H:%M:%S")
-        except ValueError:
-            return None
-    return None
-
 def md_escape(text: str) -> str:
     '''
     Markdown 충돌 방지를 위한 간단 이스케이프
@@ -169,20 +268,19 @@ def md_escape(text: str) -> str:
     return text.replace("|", "\|").replace("*", "\*").replace("_", "\_")
 
 
-def generate_markdown_report(logs: list[dict[str, Any]], out_path: Path = Path("log_analysis.md")) -> Path:
-    '''Args:
-    log data를 요약 정리하여 log_analysis.md(UTF-8)로 저장합니다.
+def _report_stats(logs: list[dict[str, Any]], window: float = DEFAULT_WINDOW) -> dict[str, Any]:
+    '''
+    dict 행 리스트로부터 보고서 통계를 계산합니다(LogTable.report_stats와 같은 형태).
     '''
-
     # 타임 레인지
     total = len(logs)
     times: list[datetime] = []
     for row in logs:
-        ts = parse_ts_safe(row.get("timestamp"))
+        ts = parse_ts(row.get("timestamp"))
         if ts:
             times.append(ts)
-    start = min(times).strftime("%Y-%m-%d %H:%M:%S") if times else "N/A"
-    end = max(times).strftime("%Y-%m-%d %H:%M:%S") if times else "N/A"
+    start = min(times).strftime(TS_FORMAT) if times else "N/A"
+    end = max(times).strftime(TS_FORMAT) if times else "N/A"
 
     # 레벨 분포
     level_counts: Counter[str] = Counter()
@@ -191,25 +289,81 @@ def generate_markdown_report(logs: list[dict[str, Any]], out_path: Path = Path("
         if isinstance(level, str) and level:
             level_counts[level] += 1
 
-    # 위험 키워드 카운트(본문 전체 스캔, 대소문자 무시)
+    # 위험 키워드 카운트(본문 전체 스캔, 대소문자 무시) + 행별 일치 키워드 보관
     risk_counter: Counter[str] = Counter()
-    joined_fields: list[str] = []
+    matches: list[list[str]] = []
     for row in logs:
         parts = [str(v) for v in row.values() if isinstance(v, (str, int, float))]
-        blob = " ".join(parts)
-        joined_fields.append(blob)
-        lower = blob.lower()
-        for kw in RISK_KEYWORDS:
-            if kw.lower() in lower:
-                risk_counter[kw] += 1
-    
-    # 최근 건수 설정 가능(샘플로 5개 지정)
-    recent = sort_log_datetime(logs)[:5]
+        lower = " ".join(parts).lower()
+        hit = [kw for kw in RISK_KEYWORDS if kw.lower() in lower]
+        matches.append(hit)
+        risk_counter.update(hit)
+
+    seq = [kw for hit in matches for kw in hit]
+
+    # 상관 분석은 키워드가 있는 행만 시간 오름차순(동시각은 원래 순서)으로 한 번 훑음
+    timed = [(ts, hit) for row, hit in zip(logs, matches)
+             if hit and (ts := parse_ts(row.get("timestamp")))]
+    timed.sort(key=lambda th: th[0])
+    events = ((to_epoch(ts), hit) for ts, hit in timed)
+    return {
+        "total": total,
+        "start": start,
+        "end": end,
+        "level_counts": level_counts.most_common(),
+        "risk_counts": risk_counter.most_common(),
+        # 최근 건수 설정 가능(샘플로 5개 지정)
+        "recent": heapq.nlargest(5, logs, key=_ts_key),
+        "risk_seq": seq[:10],
+        "correlation": correlate(events, RISK_KEYWORDS, window=window),
+    }
+
+def generate_markdown_report(logs: "list[dict[str, Any]] | LogTable", out_path: Path = Path("log_analysis.md"), *, window: float = DEFAULT_WINDOW) -> Path:
+    '''Args:
+    log data를 요약 정리하여 log_analysis.md(UTF-8)로 저장합니다.
+    LogTable이 주어지면 통계를 배열 연산으로 계산합니다.
+    window: 위험 키워드 상관 분석(버스트/지연/사슬) 시간 창(초)
+    '''
+    if _is_table(logs):
+        stats = logs.report_stats(RISK_KEYWORDS, window=window)
+    else:
+        stats = _report_stats(logs, window=window)
+    return write_markdown_report(stats, out_path)
+
+def _correlation_lines(corr: dict[str, Any]) -> list[str]:
+    '''
+    상관 분석 결과(log_correlate.Correlator.result)를 보고서 줄 목록으로 변환합니다.
+    '''
+    lines = ["", f"### 4-1) 위험 이벤트 상관 분석(시간 창 {corr['window']:g}초)"]
+    if corr["bursts"]:
+        lines.append("- 동시 발생 구간(버스트):")
+        for b in corr["bursts"]:
+            lines.append(f"  - {b['start']} ~ {b['end']} ({b['seconds']:g}초): "
+                         f"{', '.join(b['kinds'])} / {b['events']}건")
+    if corr["latencies"]:
+        lines.append("- 이벤트 간 지연(A → B):")
+        for a, b, n, mean, lo, hi in corr["latencies"]:
+            lines.append(f"  - {a} → {b}: {n}회, 평균 {mean:.1f}초 (최소 {lo:g}, 최대 {hi:g})")
+    if corr["chains"]:
+        lines.append("- 인과 사슬 후보(빈도순, 동률은 짧은 소요 시간 우선):")
+        for rank, (chain, n, mean) in enumerate(corr["chains"], start=1):
+            lines.append(f"  {rank}. {' → '.join(chain)}: {n}회, 평균 소요 {mean:.1f}초")
+    return lines
+
+def write_markdown_report(stats: dict[str, Any], out_path: Path = Path("log_analysis.md")) -> Path:
+    '''
+    보고서 통계(total/start/end/level_counts/risk_counts/recent/risk_seq)를 Markdown으로 저장합니다.
+    배치 실행과 --follow 모드가 같은 형식을 사용합니다.
+    '''
+    total, start, end = stats["total"], stats["start"], stats["end"]
+    level_counts = stats["level_counts"]
+    risk_counter = stats["risk_counts"]
+    recent = stats["recent"]
 
     # 간단 가설: 위험 키워드가 다수/연쇄 나오면 패턴 나열
     hypotheses: list[str] = []
-    if sum(risk_counter.values()) > 0:
-        seq = [kw for blob in joined_fields for kw in RISK_KEYWORDS if kw.lower() in blob.lower()]
+    if risk_counter:
+        seq = stats["risk_seq"]
         if seq:
             hypotheses.append(f"- 위험 키워드 등장 순서(일부): {', '.join(seq[:10])} ...")
     else:
@@ -219,20 +373,20 @@ def generate_markdown_report(logs: list[dict[str, Any]], out_path: Path = Path("
     lines = []
     lines.append("# 사고 원인 분석 보고서(자동생성)")
     lines.append("")
-    lines.append(f"- 생성 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    lines.append(f"- 생성 시각: {datetime.now().strftime(TS_FORMAT)}")
     lines.append(f"- 로그 총 개수: **{total}**")
     lines.append(f"- 관찰 구간: **{start} ~ {end}**")
     lines.append("")
     lines.append("## 1) 로그 수준(Level) 분포")
     if level_counts:
-        for lvl, cnt in level_counts.most_common():
+        for lvl, cnt in level_counts:
             lines.append(f"- {md_escape(lvl)}: {cnt}")
     else:
         lines.append("- 레벨 정보가 없습니다.")
     lines.append("")
     lines.append("## 2) 위험 키워드 감지")
     if risk_counter:
-        for kw, cnt in risk_counter.most_common():
+        for kw, cnt in risk_counter:
             lines.append(f"- {kw}: {cnt}")
     else:
         lines.append("- 감지된 위험 키워드 없음")
@@ -250,6 +404,9 @@ def generate_markdown_report(logs: list[dict[str, Any]], out_path: Path = Path("
     lines.append("")
     lines.append("## 4) 원인 가설(데이터 기반 단서)")
     lines.extend(hypotheses or ["- 제시할 단서가 부족합니다."])
+    corr = stats.get("correlation")
+    if corr and (corr["bursts"] or corr["latencies"]):
+        lines.extend(_correlation_lines(corr))
     lines.append("")
     lines.append("### 5) 데이터 품질 메모")
     lines.append("- 'timestamp' 포맷 불일치/누락 시 정렬 정확도 저하 발생.")
@@ -259,54 +416,150 @@ def generate_markdown_report(logs: list[dict[str, Any]], out_path: Path = Path("
     out_path.write_text("\n".join(map(str,lines)), encoding="utf-8")
     return out_path
 
-def filter_risk_logs(logs: list[dict[str, Any]], result_dir: Path) -> Path:
+def filter_risk_logs(logs: "Iterable[dict[str, Any]] | LogTable", result_dir: Path, *, mode: str = "pretty") -> Path:
     '''
     위험 키워드가 포함된 행만 필터링 후 JSON 형식으로 저장합니다.
+    - 일치하는 행을 리스트에 모으지 않고 찾는 즉시 파일에 기록
+    - LogTable이면 키워드 마스크로 한 번에 필터링
     '''
-    result_dir.mkdir(parents=True, exist_ok=True)
-    pattern = re.compile("|".join(re.escape(k) for k in RISK_KEYWORDS), re.IGNORECASE)
-    filtered: list[dict[str, Any]] = []
-    for row in logs:
-        if any(isinstance(v, str) and pattern.search(v) for v in row.values()):
-            filtered.append(row)
-
-    out = result_dir / f"risk_logs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with out.open("w", encoding="utf-8") as f:
-        json.dump(filtered, f, ensure_ascii=False, indent=2)
+    out = timestamped_path(result_dir, "risk_logs", mode)
+    if _is_table(logs):
+        # 키워드별 불리언 마스크 OR -> 해당 행만 dict로 만들어 기록
+        mask = np.logical_or.reduce(list(logs.keyword_masks(RISK_KEYWORDS).values()))
+        rows: Iterable[dict[str, Any]] = logs.take(mask)
+    else:
+        pattern = re.compile("|".join(re.escape(k) for k in RISK_KEYWORDS), re.IGNORECASE)
+        rows = (row for row in logs if any(isinstance(v, str) and pattern.search(v) for v in row.values()))
+    try:
+        with JsonStreamWriter(out, mode=mode) as w:
+            for row in rows:
+                w.write(row)
+    except OSError as e:
+        raise OSError(f"결과물 저장 실패: {out} (사유: {e})") from e
     return out
 
+def _iter_ndjson(path: Path) -> Iterable[dict[str, Any]]:
+    '''
+    NDJSON 파일을 한 줄씩 읽어 행을 내보냅니다(전체 로드 없음).
+    '''
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
 def search_json(json_path: Path, query: str) -> list[dict[str, Any]]:
     '''
     생성된 json 형식에서 부분 문자열을 검색합니다.
+    - 역색인이 있으면 포스팅 기반 검색(AND/OR, field:검색어 지원)
+    - 색인이 없거나 JSON이 바뀌었으면 전체 행을 선형 검색(같은 질의 규칙 -> 색인 유무와 관계없이 같은 결과)
     '''
     if not json_path.exists():
         print(f"[경고!] JSON 파일이 존재하지 않습니다.: {json_path}")
         return []
-    with json_path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+
+    index = LogIndex.load(json_path)
+    if index is not None:
+        return index.search(query)
 
     rows: Iterable[dict[str, Any]]
-    if isinstance(data, dict):
-        rows = list(data.values())
-    elif isinstance(data, list):
-        rows = data
+    if json_path.suffix.lower() == ".ndjson":
+        rows = _iter_ndjson(json_path)
     else:
-        print("[주의!] JSON 구조를 해석할 수 없습니다(리스트/딕셔너리만 지원가능).")
-        return []
-    
-    q = query.lower()
-    hits: list[dict[str, Any]] = []
-    for row in rows:
-        if any(isinstance(v, str) and q in v.lower() for v in row.values()):
-            hits.append(row)
-    return hits
+        with json_path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            rows = list(data.values())
+        elif isinstance(data, list):
+            rows = data
+        else:
+            print("[주의!] JSON 구조를 해석할 수 없습니다(리스트/딕셔너리만 지원가능).")
+            return []
+
+    return match_rows(rows, query)
                         
 
+def follow_log(log_path: Path, report_path: Path = Path("log_analysis.md"), interval: float = 5.0, poll: float = 0.5, window: float = DEFAULT_WINDOW) -> None:
+    '''
+    로그를 tail 하며 새 행만 증분 집계하고, 보고서는 최대 interval초마다 한 번 다시 씁니다.
+    Ctrl+C로 종료하면 마지막 상태를 한 번 더 저장합니다.
+    '''
+    tailer = LogTailer(log_path)
+    live = LiveReport(RISK_KEYWORDS, window=window)
+    last_write = 0.0
+    print(f"[FOLLOW] {log_path} 추적 시작 (보고서: {report_path}, 최소 {interval:g}초 간격, 종료: Ctrl+C)")
+    try:
+        while True:
+            rows, reset = tailer.poll()
+            if reset:
+                print("[FOLLOW] 로그 교체/잘림 감지 -> 처음부터 다시 집계")
+                live.reset()
+            if rows:
+                live.extend(rows)
+                for row in rows:
+                    print(row)
+            now = time.monotonic()
+            if live.dirty and now - last_write >= interval:
+                write_markdown_report(live.stats(), report_path)
+                live.dirty = False
+                last_write = now
+            time.sleep(poll)
+    except KeyboardInterrupt:
+        if live.dirty:
+            write_markdown_report(live.stats(), report_path)
+        print(f"\n[FOLLOW] 종료: 총 {live.total}건 집계, 보고서 -> {report_path}")
+
 def main() -> None:
-    log_path, result_path = require_env()
+    args = parse_args()
+    log_path, result_path = args.log, args.out
+    log_paths = expand_log_paths(log_path)
+    if not log_paths:
+        print(f"[입력 오류] 일치하는 로그 파일이 없습니다.: {log_path}")
+        return
+    multi = len(log_paths) > 1
+    if multi:
+        print(f"로그 파일 {len(log_paths)}개를 병합합니다: {', '.join(p.name for p in log_paths)}")
+
+    if args.time_range:
+        start, end = args.time_range
+        try:
+            # 파일별 시간 색인 구간(오름차순)을 다시 힙으로 병합
+            streams = []
+            for p in log_paths:
+                part = query_time_range(p, start, end)
+                if multi:
+                    for row in part:
+                        row["source"] = p.name
+                streams.append(part)
+            hits = list(heapq.merge(*streams, key=_ts_key))
+        except (FileNotFoundError, ValueError) as e:
+            print(f"[입력 오류] {e}")
+            return
+        print(f"구간 조회 결과 [{start} ~ {end}]: {len(hits)}건")
+        for row in hits:
+            print(row)
+        return
+
+    if args.follow:
+        if multi:
+            print("[입력 오류] --follow는 로그 파일 하나만 지원합니다.")
+            return
+        follow_log(log_paths[0], Path("log_analysis.md"), interval=args.interval, window=args.window)
+        return
+
+    if args.columnar and LogTable is None:
+        print("[입력 오류] --columnar 옵션은 NumPy가 필요합니다.")
+        return
+
     print("log 원본 출력: ")
     try:
-        logs = read_log_file(log_path)
+        if multi:
+            # 병합 결과는 이미 시간 역순
+            logs = read_log_files(log_paths, workers=args.workers)
+            if args.columnar:
+                logs = LogTable.from_rows(logs)
+        else:
+            logs = LogTable.from_csv(log_paths[0]) if args.columnar else read_log_file(log_paths[0])
     except FileNotFoundError as e:
         # 파일 없을 때 처리
         print(f"[입력 오류] {e}")
@@ -327,7 +580,7 @@ def main() -> None:
 
     # 정렬 후 출력
     print("\n 시간 기준 역순 정렬 로그 출력문!")
-    sorted_logs = sort_log_datetime(logs)
+    sorted_logs = logs if multi else sort_log_datetime(logs)
     for row in sorted_logs:
         print(row)
 
@@ -337,30 +590,55 @@ def main() -> None:
     for k, v in log_dict.items():
         print(f"{k}: {v}")
 
+    # ④~⑦ 읽기 전용 단계들을 DAG로 구성: 검색만 JSON 저장 결과에 의존
+    pipeline = Pipeline()
+    pipeline.add("json", lambda: save_to_json(log_dict, result_path, default_stem="merged_logs" if multi else log_paths[0].stem, build_index=args.index, mode=args.json_mode))
+    pipeline.add("report", lambda: generate_markdown_report(sorted_logs, Path("log_analysis.md"), window=args.window))
+    pipeline.add("risk", lambda: filter_risk_logs(sorted_logs, result_dir_for(result_path), mode=args.json_mode))
+    if args.query:
+        pipeline.add("search", lambda path: search_json(Path(path), args.query), deps=("json",))
+    res = pipeline.run(executor=args.executor)
+
+    def _stage_error(name: str) -> bool:
+        if name in res.errors:
+            print(f"[저장 오류] {res.errors[name]}")
+            return True
+        if name in res.skipped:
+            print("이전 단계 실패로 건너뜁니다.")
+            return True
+        return False
+
     print("\n④ JSON으로 저장:")
-    out_json = save_to_json(log_dict, result_path, default_stem=Path(log_path).stem)
-    print(f"저장 완료: {out_json}")
+    if not _stage_error("json"):
+        print(f"저장 완료: {res.results['json']}")
 
     print("\n⑤ 사고 분석 보고서(log_analysis.md) 생성:")
-    md_path = generate_markdown_report(sorted_logs, Path("log_analysis.md"))
-    print(f"보고서 저장 완료: {md_path}")
+    if not _stage_error("report"):
+        print(f"보고서 저장 완료: {res.results['report']}")
 
     print("\n⑥ 위험 키워드 필터 결과 저장:")
-    risk_out = filter_risk_logs(sorted_logs, Path(out_json).parent)
-    print(f"필터 결과 저장: {risk_out}")
+    if not _stage_error("risk"):
+        print(f"필터 결과 저장: {res.results['risk']}")
+
+    print(f"\n단계별 처리 시간({args.executor}):")
+    for line in format_timings(res, order=list(pipeline.stages)):
+        print("   " + line)
+
+    if args.query:
+        print(f"\n⑦ JSON 검색: {args.query}")
+        if not _stage_error("search"):
+            hits = res.results["search"]
+            print(f"검색 결과: {len(hits)}건")
+            for h in hits[:35]:
+                print(h)
+        return
 
-    print("\n⑦ JSON 검색: 검색할 문자열을 입력하세요(엔터=건너뜀)")
-    try:
-        query = input("> ").strip()
-    except EOFError:
-        query = ""
-    if query:
-        hits = search_json(Path(out_json), query)
-        print(f"검색 결과: {len(hits)}건")
-        for h in hits[:35]:
-            print(h)
-    else:
-        print("검색을 건너뜁니다.")
+    # 한 번 읽은 로그/색인을 메모리에 두고 질의 반복(빈 줄/EOF로 종료, 색인은 첫 질의 때 생성)
+    if not (args.repl or sys.stdin.isatty()):
+        return
+    print("\n⑦ 대화형 질의: 검색어 또는 명령을 입력하세요(엔터=종료)")
+    print("   예) oxygen tank / 폭발 OR 누출 / event:info message:tank / :level ERROR / :range \"2023-08-27 10:02\" \"2023-08-27 10:05\"")
+    run_repl(LogSession(sorted_logs))
 
 if __name__ == "__main__":
     main()
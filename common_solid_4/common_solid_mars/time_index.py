@@ -0,0 +1,260 @@
+"""mission_computer_main.log 시간 범위 색인 모듈
+
+기능:
+  ① 로그(CSV)를 한 번 훑어 (epoch, byte offset, 원본 행 번호)를 시간순으로 정렬해 저장
+     -> <로그파일>.tidx (로그의 mtime/size가 바뀌면 자동 재생성)
+  ② 범위 질의 시 이진 탐색(bisect)으로 구간을 찾고 원본 CSV의 해당 행만 seek 하여 읽음
+     -> 정렬/전체 스캔 O(n log n) 대신 O(log n + k)
+
+색인 파일 구조:
+  [MAGIC 8byte][메타 JSON 길이 8byte][메타 JSON][epochs int64 * n][offsets int64 * n][orig_idx int64 * n]
+
+시각 변환 공통 함수(다른 모듈도 여기서 가져다 씀):
+  TS_FORMAT, parse_ts(문자열 -> datetime | None), parse_epoch(문자열 -> epoch | None),
+  to_epoch(datetime/문자열 -> epoch), epoch_to_str(epoch -> 문자열)
+  epoch는 타임존 없는 시각을 UTC로 취급한 정수 초
+"""
+
+import calendar
+import csv
+import io
+import json
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Iterator
+
+from log_format import LogFormat, detect_format
+
+TS_FORMAT = "%Y-%m-%d %H:%M:%S"
+TIDX_SUFFIX = ".tidx"
+MAGIC = b"MLTIDX02"
+_EPOCH0 = datetime(1970, 1, 1)
+
+
+def parse_ts(s: Any) -> datetime | None:
+    '''
+    로그 timestamp 문자열(TS_FORMAT)을 datetime으로 안전 파싱(형식이 다르거나 문자열이 아니면 None).
+    '''
+    if isinstance(s, str):
+        try:
+            return datetime.strptime(s.strip(), TS_FORMAT)
+        except ValueError:
+            return None
+    return None
+
+
+def parse_epoch(s: Any) -> int | None:
+    '''
+    로그 timestamp 문자열을 epoch(초)로 변환(파싱 실패 시 None).
+    '''
+    ts = parse_ts(s)
+    return None if ts is None else to_epoch(ts)
+
+
+def epoch_to_str(epoch: float) -> str:
+    return (_EPOCH0 + timedelta(seconds=int(epoch))).strftime(TS_FORMAT)
+
+
+def to_epoch(ts: datetime | str) -> int:
+    '''
+    datetime 또는 "YYYY-MM-DD HH:MM[:SS]" 문자열을 epoch(초, 타임존 없는 UTC 취급)로 변환합니다.
+    '''
+    if isinstance(ts, str):
+        s = ts.strip()
+        for fmt in (TS_FORMAT, "%Y-%m-%d %H:%M", "%Y-%m-%d"):
+            try:
+                ts = datetime.strptime(s, fmt)
+                break
+            except ValueError:
+                continue
+        else:
+            raise ValueError(f"시각 형식 오류(YYYY-MM-DD HH:MM:SS): {s}")
+    return calendar.timegm(ts.timetuple())
+
+
+def tidx_path_for(log_path: Path) -> Path:
+    log_path = Path(log_path)
+    return log_path.with_name(log_path.name + TIDX_SUFFIX)
+
+
+def _lines_with_offsets(f: io.BufferedReader, encoding: str, pos: list[int]) -> Iterator[str]:
+    '''
+    바이너리 파일을 한 줄씩 디코딩해 넘기며, pos[0]에 "다음에 읽을 줄"의 byte offset을 유지합니다.
+    '''
+    while True:
+        line = f.readline()
+        if not line:
+            return
+        pos[0] += len(line)
+        yield line.decode(encoding)
+
+
+class TimeIndex:
+    '''
+    epoch 오름차순으로 정렬된 (epoch, offset, orig_idx) 배열과 CSV 메타 정보.
+    build()/load()/open()으로 생성합니다.
+    '''
+
+    def __init__(self, log_path: Path, meta: dict[str, Any], epochs: array, offsets: array, orig: array) -> None:
+        self.log_path = Path(log_path)
+        self.meta = meta
+        self.epochs = epochs
+        self.offsets = offsets
+        self.orig = orig
+
+    def __len__(self) -> int:
+        return len(self.epochs)
+
+    @classmethod
+    def build(cls, log_path: Path) -> "TimeIndex":
+        '''
+        로그 전체를 한 번 읽어 색인을 만들고 디스크에 저장합니다.
+        timestamp 파싱이 실패한 행은 범위 질의 대상이 아니므로 제외됩니다.
+        '''
+        log_path = Path(log_path)
+        if not log_path.exists():
+            raise FileNotFoundError(f"로그 파일을 찾을 수 없습니다.: {log_path}")
+
+        fmt = detect_format(log_path)
+        encoding = "utf-8"
+        with log_path.open("rb") as f:
+            f.seek(fmt.bom)
+            pos = [fmt.bom]
+            reader = csv.reader(_lines_with_offsets(f, encoding, pos), **fmt.fmtparams())
+            header = [h.strip() for h in next(reader, [])]
+            ts_col = header.index("timestamp") if "timestamp" in header else 0
+
+            entries: list[tuple[int, int, int]] = []
+            row_no = 0
+            while True:
+                offset = pos[0]
+                rec = next(reader, None)
+                if rec is None:
+                    break
+                if not rec:
+                    # DictReader와 같이 빈 줄은 행 번호에 포함하지 않음
+                    continue
+                row_no += 1
+                if ts_col >= len(rec):
+                    continue
+                epoch = parse_epoch(rec[ts_col])
+                if epoch is None:
+                    continue
+                entries.append((epoch, offset, row_no))
+
+        # 대부분 시간순으로 기록되므로 timsort가 거의 선형으로 동작
+        entries.sort()
+        epochs = array("q", (e[0] for e in entries))
+        offsets = array("q", (e[1] for e in entries))
+        orig = array("q", (e[2] for e in entries))
+
+        st = log_path.stat()
+        meta = {
+            "source": log_path.name,
+            "source_mtime_ns": st.st_mtime_ns,
+            "source_size": st.st_size,
+            "encoding": encoding,
+            "format": fmt._asdict(),
+            "header": header,
+            "rows": row_no,
+        }
+        index = cls(log_path, meta, epochs, offsets, orig)
+        index.save()
+        return index
+
+    def save(self) -> Path:
+        out = tidx_path_for(self.log_path)
+        meta = json.dumps(self.meta, ensure_ascii=False).encode("utf-8")
+        try:
+            with out.open("wb") as f:
+                f.write(MAGIC)
+                f.write(struct.pack("<q", len(meta)))
+                f.write(meta)
+                for arr in (self.epochs, self.offsets, self.orig):
+                    f.write(arr.tobytes())
+        except OSError as e:
+            raise OSError(f"시간 색인 저장 실패: {out} (사유: {e})") from e
+        return out
+
+    @classmethod
+    def load(cls, log_path: Path) -> "TimeIndex | None":
+        '''
+        저장된 색인을 읽습니다. 없거나 로그가 바뀌었으면 None.
+        '''
+        log_path = Path(log_path)
+        path = tidx_path_for(log_path)
+        if not path.exists() or not log_path.exists():
+            return None
+        try:
+            with path.open("rb") as f:
+                if f.read(len(MAGIC)) != MAGIC:
+                    return None
+                (n_meta,) = struct.unpack("<q", f.read(8))
+                meta = json.loads(f.read(n_meta).decode("utf-8"))
+                st = log_path.stat()
+                if (meta.get("source_mtime_ns"), meta.get("source_size")) != (st.st_mtime_ns, st.st_size):
+                    return None
+                body = f.read()
+        except (OSError, ValueError, struct.error):
+            return None
+        arrays = []
+        n = len(body) // 3
+        for i in range(3):
+            arr = array("q")
+            arr.frombytes(body[i * n:(i + 1) * n])
+            arrays.append(arr)
+        return cls(log_path, meta, *arrays)
+
+    @classmethod
+    def open(cls, log_path: Path) -> "TimeIndex":
+        '''
+        유효한 색인이 있으면 읽고, 없으면 새로 만듭니다(로그당 1회 빌드).
+        '''
+        index = cls.load(log_path)
+        return index if index is not None else cls.build(log_path)
+
+    def span(self, start: datetime | str | None, end: datetime | str | None) -> tuple[int, int]:
+        '''
+        [start, end] 구간(양끝 포함)에 해당하는 색인 위치 [lo, hi)를 이진 탐색으로 구합니다.
+        '''
+        lo = 0 if start is None else bisect_left(self.epochs, to_epoch(start))
+        hi = len(self.epochs) if end is None else bisect_right(self.epochs, to_epoch(end))
+        return lo, max(lo, hi)
+
+    def count(self, start: datetime | str | None, end: datetime | str | None) -> int:
+        lo, hi = self.span(start, end)
+        return hi - lo
+
+    def query(self, start: datetime | str | None, end: datetime | str | None) -> list[dict[str, Any]]:
+        '''
+        구간에 속한 행만 원본 CSV에서 읽어 시간 오름차순으로 반환합니다.
+        행 형식은 read_log_file과 같습니다(공백 제거, orig_idx 포함).
+        '''
+        lo, hi = self.span(start, end)
+        if lo == hi:
+            return []
+        header = self.meta["header"]
+        enc = self.meta["encoding"]
+        fmt = LogFormat(**self.meta["format"]).fmtparams()
+        rows: list[dict[str, Any]] = []
+        with self.log_path.open("rb") as f:
+            for i in range(lo, hi):
+                f.seek(self.offsets[i])
+                pos = [self.offsets[i]]
+                rec = next(csv.reader(_lines_with_offsets(f, enc, pos), **fmt), [])
+                row: dict[str, Any] = {
+                    h: (rec[j].strip() if j < len(rec) else None) for j, h in enumerate(header)
+                }
+                row["orig_idx"] = self.orig[i]
+                rows.append(row)
+        return rows
+
+
+def query_time_range(log_path: Path, start: datetime | str | None, end: datetime | str | None) -> list[dict[str, Any]]:
+    '''
+    로그의 [start, end] 구간 행을 반환합니다. 색인이 없거나 오래되었으면 먼저 빌드합니다.
+    '''
+    return TimeIndex.open(log_path).query(start, end)
@@ -0,0 +1,258 @@
+"""
+bulk_extract.py
+- 여러 zip 데이터 번들을 스레드 풀로 동시에 압축 해제하는 도구
+- 압축 파일마다 <출력 폴더>/<압축 파일 이름> 아래에 풀고, macOS 메타데이터(zip_fs.is_meta)는 제외
+  (다른 폴더의 같은 이름 압축 파일은 <이름>-2, <이름>-3 ... 으로 구분)
+- 경로 조작 방지: 절대 경로, 드라이브, '..' 로 출력 폴더 밖을 가리키는 멤버는 거부
+- 재실행 가속: 디스크 파일의 크기/CRC가 멤버와 같으면 건너뜀
+  (출력 폴더의 .extract_manifest.json에 (크기, CRC, mtime)을 기록 -> 파일을 다시 읽지 않고 비교)
+- 결과: 해제/건너뜀/실패 건수, 기록 byte, 처리량(MB/s)
+
+사용법:
+  python bulk_extract.py bundles/*.zip mars_base.zip --out extracted [--workers 8] [--quiet]
+"""
+import argparse
+import glob
+import json
+import os
+import shutil
+import threading
+import time
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import Any
+
+from zip_fs import is_meta
+
+MANIFEST = ".extract_manifest.json"
+_CHUNK = 1 << 20
+
+
+def safe_target(dest: Path, name: str) -> Path | None:
+    """멤버 이름을 dest 아래 경로로 변환. dest 밖을 가리키면 None"""
+    parts = PurePosixPath(name.replace("\\", "/")).parts
+    if not parts or parts[0] == "/" or ":" in parts[0] or ".." in parts:
+        return None
+    target = (dest / Path(*parts)).resolve()
+    root = dest.resolve()
+    if target != root and root not in target.parents:
+        return None
+    return target
+
+
+def _crc32(path: Path) -> int:
+    crc = 0
+    with open(path, "rb") as f:
+        while chunk := f.read(_CHUNK):
+            crc = zlib.crc32(chunk, crc)
+    return crc
+
+
+class _ZipCache:
+    """스레드마다 압축 파일을 한 번씩만 열어 재사용하고, close()로 모든 스레드의 핸들을 닫음"""
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._opened: list[zipfile.ZipFile] = []
+        self._lock = threading.Lock()
+
+    def get(self, archive: Path) -> zipfile.ZipFile:
+        cache = getattr(self._local, "zips", None)
+        if cache is None:
+            cache = self._local.zips = {}
+        zf = cache.get(archive)
+        if zf is None:
+            zf = cache[archive] = zipfile.ZipFile(archive, "r")
+            with self._lock:
+                self._opened.append(zf)
+        return zf
+
+    def close(self) -> None:
+        with self._lock:
+            opened, self._opened = self._opened, []
+        for zf in opened:
+            zf.close()
+
+
+def _dest_dirs(archives: list[Path], out_dir: Path) -> dict[Path, Path]:
+    """압축 파일별 출력 폴더. 이름(stem)이 겹치면 입력 순서대로 -2, -3 ... 을 붙여 구분"""
+    used: set[str] = set()
+    dests = {}
+    for archive in archives:
+        name, n = archive.stem, 1
+        while name.lower() in used:
+            n += 1
+            name = f"{archive.stem}-{n}"
+        used.add(name.lower())
+        dests[archive] = out_dir / name
+    return dests
+
+
+def _load_manifest(dest: Path) -> dict[str, list[int]]:
+    try:
+        return json.loads((dest / MANIFEST).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _is_current(target: Path, info: zipfile.ZipInfo, entry: list[int] | None) -> bool:
+    try:
+        st = target.stat()
+    except OSError:
+        return False
+    if st.st_size != info.file_size:
+        return False
+    if entry == [info.file_size, info.CRC, st.st_mtime_ns]:
+        return True
+    # 매니페스트가 없거나 달라졌으면 실제 CRC로 확인
+    return _crc32(target) == info.CRC
+
+
+def _extract_one(zf: zipfile.ZipFile, info: zipfile.ZipInfo, target: Path) -> int:
+    """임시 파일에 풀고 교체(중간에 실패해도 반쯤 쓴 파일이 남지 않음). CRC는 zipfile이 읽으며 검증"""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f".{target.name}.part{threading.get_ident()}")
+    try:
+        with zf.open(info) as src, open(tmp, "wb") as dst:
+            shutil.copyfileobj(src, dst, _CHUNK)
+        os.replace(tmp, target)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+    return info.file_size
+
+
+def expand_archives(specs: list[str]) -> list[Path]:
+    """파일/폴더(안의 *.zip)/glob 패턴을 압축 파일 목록으로(중복 제거, 입력 순서 유지)"""
+    out: dict[Path, None] = {}
+    for spec in specs:
+        p = Path(spec).expanduser()
+        if p.is_dir():
+            hits = sorted(p.glob("*.zip"))
+        elif p.is_file():
+            hits = [p]
+        else:
+            hits = sorted(Path(h) for h in glob.glob(str(p), recursive=True))
+        for h in hits:
+            out.setdefault(h.resolve(), None)
+    return list(out)
+
+
+def extract_many(archives: list[Path], out_dir: Path, workers: int | None = None,
+                 per_archive: bool = True) -> dict[str, Any]:
+    """여러 압축 파일을 동시에 해제하고 결과 요약을 반환합니다.
+
+    Args:
+        archives: 압축 파일 목록
+        out_dir: 출력 폴더
+        workers: 스레드 수(기본: CPU 수 기준, 최대 32)
+        per_archive: True면 <out_dir>/<압축 파일 이름>/ 아래에(이름이 겹치면 -2, -3 ...),
+            False면 out_dir에 바로 해제
+    """
+    zips = _ZipCache()
+    try:
+        return _extract_many(archives, Path(out_dir), workers, per_archive, zips)
+    finally:
+        zips.close()
+
+
+def _extract_many(archives: list[Path], out_dir: Path, workers: int | None, per_archive: bool,
+                  zips: _ZipCache) -> dict[str, Any]:
+    t0 = time.perf_counter()
+    dests = _dest_dirs(archives, out_dir) if per_archive else dict.fromkeys(archives, out_dir)
+    tasks: list[tuple[Path, zipfile.ZipInfo, Path, Path, str]] = []
+    report: dict[str, Any] = {"archives": {}, "extracted": 0, "skipped": 0, "failed": 0,
+                              "rejected": [], "errors": [], "bytes": 0}
+    manifests: dict[Path, dict[str, list[int]]] = {}
+
+    for archive in archives:
+        dest = dests[archive]
+        stat = report["archives"].setdefault(str(archive), {"extracted": 0, "skipped": 0, "failed": 0})
+        try:
+            infos = zips.get(archive).infolist()
+        except (OSError, zipfile.BadZipFile) as e:
+            report["errors"].append(f"{archive}: {e}")
+            stat["failed"] += 1
+            report["failed"] += 1
+            continue
+        manifest = manifests.setdefault(dest, _load_manifest(dest))
+        for info in infos:
+            if info.is_dir() or is_meta(info.filename):
+                continue
+            target = safe_target(dest, info.filename)
+            if target is None:
+                report["rejected"].append(f"{archive.name}:{info.filename}")
+                continue
+            key = target.relative_to(dest.resolve()).as_posix()
+            if _is_current(target, info, manifest.get(key)):
+                stat["skipped"] += 1
+                report["skipped"] += 1
+                continue
+            tasks.append((archive, info, target, dest, key))
+
+    def _run(task: tuple[Path, zipfile.ZipInfo, Path, Path, str]) -> tuple[tuple, int | Exception]:
+        archive, info, target, _, _ = task
+        try:
+            return task, _extract_one(zips.get(archive), info, target)
+        except (OSError, zipfile.BadZipFile, RuntimeError) as e:
+            return task, e
+
+    size = workers or min(32, (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max_workers=size) as pool:
+        for (archive, info, target, dest, key), result in pool.map(_run, tasks):
+            stat = report["archives"][str(archive)]
+            if isinstance(result, Exception):
+                stat["failed"] += 1
+                report["failed"] += 1
+                report["errors"].append(f"{archive.name}:{info.filename}: {result}")
+                continue
+            stat["extracted"] += 1
+            report["extracted"] += 1
+            report["bytes"] += result
+            manifests[dest][key] = [info.file_size, info.CRC, target.stat().st_mtime_ns]
+
+    for dest, manifest in manifests.items():
+        if dest.exists():
+            try:
+                (dest / MANIFEST).write_text(json.dumps(manifest, ensure_ascii=False), encoding="utf-8")
+            except OSError as e:
+                report["errors"].append(f"{dest / MANIFEST}: {e}")
+
+    seconds = time.perf_counter() - t0
+    report["seconds"] = seconds
+    report["mb_per_sec"] = report["bytes"] / (1 << 20) / seconds if seconds > 0 else 0.0
+    return report
+
+
+def print_report(report: dict[str, Any], quiet: bool = False) -> None:
+    if not quiet:
+        for name, s in report["archives"].items():
+            print(f"  {Path(name).name}: 해제 {s['extracted']}, 건너뜀 {s['skipped']}, 실패 {s['failed']}")
+    for r in report["rejected"]:
+        print(f"[경로 거부] {r}")
+    for e in report["errors"]:
+        print(f"[오류] {e}")
+    print(f"해제 {report['extracted']}건 / 건너뜀 {report['skipped']}건 / 실패 {report['failed']}건, "
+          f"{report['bytes'] / (1 << 20):.3f} MB, {report['seconds']:.3f}초 ({report['mb_per_sec']:.3f} MB/s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="여러 zip 번들 동시 압축 해제")
+    parser.add_argument("archives", nargs="+", help="압축 파일/폴더/glob 패턴")
+    parser.add_argument("--out", type=Path, default=Path.cwd() / "extracted", help="출력 폴더")
+    parser.add_argument("--workers", type=int, default=None, help="스레드 수")
+    parser.add_argument("--flat", action="store_true", help="압축 파일별 하위 폴더 없이 출력 폴더에 바로 해제")
+    parser.add_argument("--quiet", action="store_true", help="압축 파일별 요약 생략")
+    args = parser.parse_args()
+
+    archives = expand_archives(args.archives)
+    if not archives:
+        print("압축 파일을 찾을 수 없습니다.")
+        return
+    print_report(extract_many(archives, args.out, args.workers, per_archive=not args.flat), args.quiet)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+csv_table.py
+- design_dome.py 공용 CSV 로더: 파일을 한 번만 읽어 NumPy 구조화 배열(structured array)로 변환
+- 컬럼 타입: schema로 지정(float/str), 미지정 컬럼은 모든 값이 실수면 float, 아니면 str
+  (float 변환 실패 값은 nan)
+- 결과는 (경로, mtime, 크기) 키로 캐시 -> 같은 파일을 다시 요청하면 디스크를 읽지 않음
+- 원본 텍스트(text)도 함께 보관하여 원본 출력에 재사용
+- zipfile.Path(zip_fs)도 입력 가능 -> 압축을 풀지 않고 멤버를 바로 파싱((zip, 멤버, mtime, CRC) 키로 캐시)
+"""
+import csv
+import io
+import zipfile
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import numpy as np
+
+_CACHE: dict[tuple[Any, ...], "CsvTable"] = {}
+
+
+class CsvTable(NamedTuple):
+    """한 CSV 파일의 메모리 표현
+
+    Attributes:
+        path (Path): 원본 경로
+        text (str): 디코딩된 원본 텍스트(BOM 제거)
+        header (list[str]): 컬럼 순서
+        data (np.ndarray): 구조화 배열, 필드명 = 헤더
+    """
+    path: Path
+    text: str
+    header: list[str]
+    data: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def column(self, name: str) -> np.ndarray:
+        return self.data[name]
+
+    def is_float(self, name: str) -> bool:
+        return self.data.dtype[name].kind == "f"
+
+    def rows(self, idx: Any = None) -> list[dict]:
+        """기존 코드와 같은 dict 행 목록(숫자 컬럼은 float, 나머지는 str)
+
+        Args:
+            idx: 행 인덱스 배열/불리언 마스크(생략 시 전체)
+        """
+        sub = self.data if idx is None else self.data[idx]
+        return [{k: v.item() for k, v in zip(self.header, rec)} for rec in sub]
+
+
+def _parse_float(x: str) -> float:
+    try:
+        return float(x)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def _infer_float(values: list[str]) -> bool:
+    seen = False
+    for v in values:
+        if v == "":
+            continue
+        try:
+            float(v)
+        except ValueError:
+            return False
+        seen = True
+    return seen
+
+
+def parse_csv(text: str, schema: dict[str, type] | None = None, path: Path | None = None) -> CsvTable:
+    """CSV 텍스트를 구조화 배열로 변환합니다.
+
+    Args:
+        text (str): CSV 텍스트
+        schema (dict[str, type] | None): 컬럼별 타입(float/str)
+    """
+    schema = schema or {}
+    reader = csv.reader(io.StringIO(text, newline=""))
+    header = [h.strip() for h in next(reader, [])]
+    records = [rec for rec in reader if rec]
+    cols = [[(rec[j].strip() if j < len(rec) else "") for rec in records] for j in range(len(header))]
+
+    fields = []
+    arrays = []
+    for name, values in zip(header, cols):
+        kind = schema.get(name)
+        if kind is None:
+            kind = float if _infer_float(values) else str
+        if kind is float:
+            arrays.append(np.array([_parse_float(v) for v in values], dtype=np.float64))
+            fields.append((name, np.float64))
+        else:
+            width = max((len(v) for v in values), default=1) or 1
+            arrays.append(np.array(values, dtype=f"U{width}"))
+            fields.append((name, f"U{width}"))
+
+    data = np.empty(len(records), dtype=fields)
+    for (name, _), arr in zip(fields, arrays):
+        data[name] = arr
+    return CsvTable(Path(path) if path else Path(), text, header, data)
+
+
+def _source_key(p: Path | zipfile.Path) -> tuple[Any, ...]:
+    if isinstance(p, zipfile.Path):
+        zp = Path(p.root.filename)
+        info = p.root.getinfo(p.at)
+        return (str(zp.resolve()), p.at, zp.stat().st_mtime_ns, info.CRC)
+    st = p.stat()
+    return (str(p.resolve()), st.st_mtime_ns, st.st_size)
+
+
+def load_csv(path: Path | str | zipfile.Path, schema: dict[str, type] | None = None, cache: bool = True) -> CsvTable:
+    """CSV 파일을 읽어 CsvTable로 반환합니다(같은 파일/상태/스키마면 캐시 사용).
+    cache=False면 캐시를 조회/저장하지 않습니다(한 번만 쓰고 버릴 파일).
+
+    Raises:
+        FileNotFoundError: 파일 없음
+        UnicodeDecodeError: UTF-8(-SIG) 디코딩 실패
+    """
+    p = path if isinstance(path, zipfile.Path) else Path(path)
+    key = _source_key(p) + tuple(sorted((k, v.__name__) for k, v in (schema or {}).items()))
+    cached = _CACHE.get(key) if cache else None
+    if cached is not None:
+        return cached
+    text = p.read_bytes().decode("utf-8-sig")
+    table = parse_csv(text, schema, Path(str(p)))
+    if cache:
+        _CACHE[key] = table
+    return table
+
+
+def clear_cache() -> None:
+    _CACHE.clear()
@@ -1,22 +1,36 @@
 """
 design_dome.py
-- 문제1: 인화성 지수 정렬/필터 + CSV/이진 저장
+- 문제1: 인화성 지수 정렬/필터 + CSV/이진 저장(inventory_bin: 타입 고정 컬럼 포맷, pickle 미사용)
 - 문제2: 반구 돔 표면적/무게 계산(sphere_area) + 반복 CLI
+  (sphere_area_batch/dome_sweep: 지름×두께×재질 조합을 배열로 일괄 계산, --sweep으로 CSV 저장)
+  (DomeOptimizer: 최소 두께/무게 예산 조건에서 최경량 설계 + 파레토 설계 탐색, --optimize)
 - 문제3: NumPy로 부품 평균/필터 + CSV 저장/전치
+  (부품 파일 수 제한 없음: glob으로 찾고 파일별로 합계/개수 벡터에 누적 -> 메모리는 부품 수에 비례)
 제약: 외부 패키지는 금지(NumPy만 허용), 모든 파일처리 예외처리, 출력은 소수점 3자리
+CSV 읽기: csv_table.load_csv 한 곳에서 파일당 한 번 파싱(구조화 배열, (경로, mtime) 캐시)
+  디스크에 없으면 mars_base.zip 멤버를 압축 해제 없이 바로 읽음(zip_fs)
 """
+import argparse
+import fnmatch
+import os
 import zipfile
-import csv, pickle
+import csv
 from pathlib import Path
 from math import pi
 import numpy as np
 
+from csv_table import load_csv
+from inventory_bin import read_inventory, same_table, write_inventory
+from zip_fs import open_zip
+
 # 프로젝트 루트
 BASE = Path(__file__).resolve().parent
 
 MATERIAL_DENSITY = {"glass":2.4,"aluminum":2.7,"carbon_steel":7.85} # g/cm^3
 MARS_G = 0.38
 
+MARS_ZIP = BASE / "mars_base.zip"
+
 OUT_DIR = (Path(__file__).parent / "result").resolve()
 OUT_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -29,53 +43,91 @@ MATERIAL_KO = {"glass": "유리", "aluminum": "알루미늄", "carbon_steel": "
 
 # 데이터 부품관리 평균 값에 대한 재사용성을 위한 상수 선언입니다.
 PART_STRENGTH_MAX = 50
+PARTS_PATTERN = "mars_base_main_parts-*.csv"
 
-def extract_zip(zip_path, result_dir=None):
-    """zip파일 예외처리 및 압축해제 함수입니다.
+# 위험 물질 기준: {컬럼: 최솟값} (모든 조건을 만족하는 행만 위험, 값이 nan이면 제외)
+DANGER_RULES = {"Flammability": 0.7}
 
-    Raises:
-        FileNotFoundError: _description_
-        IsADirectoryError: _description_
+# CSV 컬럼 타입(지정하지 않은 컬럼은 값으로 추정)
+INVENTORY_SCHEMA = {"Flammability": float}
+PARTS_SCHEMA = {"parts": str, "strength": float}
 
-    Returns:
-        _type_: _description_
+def _skip_meta(name: str) -> bool:
+    """macOS 메타파일 여부(__MACOSX 폴더는 색인 단계에서 통째로 제외)"""
+    return name.startswith("._") or name == ".DS_Store"
+
+class FileIndex:
+    """roots 아래 파일을 한 번 훑어 소문자 파일명 -> 경로 목록으로 색인합니다.
+
+    - 색인할 때 본 모든 폴더의 mtime을 기록하고, 조회 시 하나라도 바뀌었으면(파일 추가/삭제/이름 변경,
+      zip 해제로 폴더 생성 등) 다시 훑음. 그 외에는 폴더 stat만 하고 rglob 없이 dict 조회
+    - 같은 이름이 여러 곳에 있으면 roots 순서, 폴더 이름순으로 먼저 찾은 경로가 앞
+    - exclude 폴더(결과 폴더 등)와 SKIP_DIRS(__pycache__ 등)는 훑지도 stat하지도 않음
+      -> 결과 파일을 써도 다시 훑지 않음
     """
-    zp = Path(zip_path)
-    base_result = Path(result_dir) if result_dir else Path.cwd()
-    if not zp.exists(): raise FileNotFoundError(f"ZIP파일을 찾을 수 없습니다. :{zp}")
-    if not zp.is_file(): raise IsADirectoryError(f"경로 확인 필요! :{zp}")
-
-    extract_dir = base_result / "mars_base"
-    extract_dir.mkdir(parents=True, exist_ok=True)
-
-    def _skip(name: str) -> bool:
-        return (name.startswith('__MACOSX/') or
-                name.endswith('.DS_Store') or
-                '/._' in name or
-                Path(name).name.startswith('._'))
-    
-    with zipfile.ZipFile(zp, "r") as zf:
-        names = [n for n in zf.namelist() if not _skip(n)]
-        for n in names:
-            zf.extract(n, extract_dir)
-        print(f"-------압축해제완료-------->{extract_dir}")
-        print("\n".join(names))
-        print(f" 압축 해제된 파일 수: {len(names)}")
 
-    return extract_dir
+    SKIP_DIRS = frozenset({"__MACOSX", "__pycache__"})
+
+    def __init__(self, roots: list[Path], exclude: list[Path] = ()) -> None:
+        self.roots = [Path(r) for r in roots]
+        self.exclude = {os.path.realpath(e) for e in exclude}
+        self.names: dict[str, list[Path]] = {}
+        self.dir_mtimes: dict[str, int | None] = {}
+        self.scans = 0
+
+    def _mtime(self, d: str) -> int | None:
+        try:
+            return os.stat(d).st_mtime_ns
+        except OSError:
+            return None
+
+    def _stale(self) -> bool:
+        if not self.scans:
+            return True
+        return any(self._mtime(d) != m for d, m in self.dir_mtimes.items())
+
+    def _scan(self) -> None:
+        names: dict[str, list[Path]] = {}
+        mtimes: dict[str, int | None] = {}
+        seen: set[str] = set()
+        for root in self.roots:
+            mtimes[str(root)] = self._mtime(str(root))
+            for dirpath, dirnames, filenames in os.walk(root):
+                real = os.path.realpath(dirpath)
+                if real in seen or real in self.exclude:
+                    dirnames[:] = []
+                    continue
+                seen.add(real)
+                mtimes[dirpath] = self._mtime(dirpath)
+                dirnames[:] = sorted(d for d in dirnames if d not in self.SKIP_DIRS)
+                for fn in sorted(filenames):
+                    if not _skip_meta(fn):
+                        names.setdefault(fn.lower(), []).append(Path(dirpath) / fn)
+        self.names, self.dir_mtimes = names, mtimes
+        self.scans += 1
+
+    def refresh(self) -> None:
+        if self._stale():
+            self._scan()
+
+    def lookup(self, name: str) -> Path | None:
+        self.refresh()
+        hits = self.names.get(name.lower())
+        return hits[0] if hits else None
+
+    def glob(self, pattern: str) -> list[Path]:
+        """패턴(대소문자 무시)과 일치하는 모든 파일"""
+        self.refresh()
+        pat = pattern.lower()
+        return [p for key, paths in self.names.items() if fnmatch.fnmatchcase(key, pat) for p in paths]
+
+# BASE(하위 mars_base 포함) 파일 색인: 첫 조회 때 한 번만 훑음
+FILE_INDEX = FileIndex([BASE, BASE / "mars_base"], exclude=[OUT_DIR])
 
 def find_file(name: str) -> Path:
     """BASE / BASE/mars_base에서 재귀 검색(case-insensitive).
-    macOS 메타파일/폴더는 무시."""
+    macOS 메타파일/폴더는 무시. 색인(FILE_INDEX)을 사용하므로 반복 호출해도 다시 훑지 않음."""
     targets = [BASE, BASE / "mars_base"]
-    target_lower = name.lower()
-
-    def _skip(p: Path) -> bool:
-        return (
-            "__MACOSX" in p.parts
-            or p.name.startswith("._")
-            or p.name == ".DS_Store"
-        )
 
     # 1) 최상위 정확 매치
     for d in targets:
@@ -84,48 +136,95 @@ def find_file(name: str) -> Path:
             return p
 
     # 2) 재귀(case-insensitive) 매치
-    for d in targets:
-        if d.exists():
-            for q in d.rglob("*"):
-                if q.is_file() and not _skip(q) and q.name.lower() == target_lower:
-                    return q
+    p = FILE_INDEX.lookup(name)
+    if p is not None:
+        return p
     # 찾을 수 없을 시
     raise FileNotFoundError(
         f"{name} not found. searched: {', '.join(str(d) for d in targets)}")
 
+def find_files(pattern: str) -> list[Path]:
+    """BASE / BASE/mars_base에서 glob 패턴과 일치하는 파일을 재귀 검색(이름순, 중복 제거).
+    macOS 메타파일/폴더는 무시."""
+    found: dict[Path, Path] = {}
+    for q in FILE_INDEX.glob(pattern):
+        found.setdefault(q.resolve(), q)
+    return sorted(found.values(), key=lambda q: (q.name.lower(), str(q)))
+
+def locate_csv(name: str) -> "Path | zipfile.Path":
+    """디스크(find_file)에서 먼저 찾고, 없으면 mars_base.zip 안의 멤버를 돌려줍니다(압축 해제 없음).
+
+    Raises:
+        FileNotFoundError: 디스크/zip 어디에도 없음
+    """
+    try:
+        return find_file(name)
+    except FileNotFoundError:
+        if not MARS_ZIP.exists():
+            raise
+        return open_zip(MARS_ZIP).find(name)
+
+def locate_csvs(pattern: str) -> "list[Path] | list[zipfile.Path]":
+    """find_files 결과가 없으면 mars_base.zip 멤버에서 같은 패턴으로 찾습니다."""
+    files = find_files(pattern)
+    if not files and MARS_ZIP.exists():
+        return open_zip(MARS_ZIP).glob(pattern)
+    return files
+
 def print_csv_raw(csv_path: Path) -> None:
     """CSV 원본 그대로 출력하는 함수입니다.
+    load_csv가 캐시한 원본 텍스트를 사용하므로 이후 단계에서 다시 읽지 않습니다.
 
     Args:
         csv_path (Path)
     """
     try:
-        with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
-            print("\n ======================원본 CSV 전체 출력 ===========================")
-            print(f.read().rstrip())
-    except OSError as e:
+        table = load_csv(csv_path, INVENTORY_SCHEMA)
+    except (OSError, UnicodeDecodeError) as e:
         print(f"[읽기오류] {csv_path} : {e}")
-    except UnicodeDecodeError:
-        # BOM없으면 재시도 처리
-        with open(csv_path, "r", encoding="utf-8", newline="") as f:
-            print("\n ======================원본 CSV 전체 출력 ===========================")
-            print(f.read().rstrip())
+        return
+    print("\n ======================원본 CSV 전체 출력 ===========================")
+    print(table.text.rstrip())
 
-def print_rows_plain(rows: list[dict], title: str, limit: int | None = None) -> None:
+def _format_column(col: np.ndarray, numeric_strings: bool = False) -> np.ndarray:
+    """컬럼 전체를 한 번에 문자열로 변환(숫자는 소수점 3자리)
+
+    Args:
+        col (np.ndarray): 구조화 배열의 한 컬럼
+        numeric_strings (bool): 문자열 컬럼 중 숫자로 해석되는 값도 3자리로 바꿀지 여부
+    """
+    if col.dtype.kind == "f":
+        return np.char.mod("%.3f", col)
+    col = col.astype(str)
+    if not numeric_strings or not len(col):
+        return col
+    # 고유값만 한 번씩 변환 후 코드로 펼침
+    uniq, inv = np.unique(col, return_inverse=True)
+    nums = np.array([_to_float(v) for v in uniq])
+    out = np.where(np.isnan(nums) & (np.char.lower(uniq) != "nan"), uniq, np.char.mod("%.3f", nums))
+    return out[inv]
+
+def print_rows_plain(rows: list[dict] | np.ndarray, title: str, limit: int | None = None) -> None:
     """dict 형태가 아닌 한줄로 출력
 
     Args:
-        rows (list[dict]): _description_
+        rows (list[dict] | np.ndarray): dict 행 목록 또는 구조화 배열
         title (str): _description_
         limit (int | None, optional): _description_. Defaults to None.
     """
-    if not rows:
+    if len(rows) == 0:
         print(f"\n{title}\n(비어있음)")
         return
-    header = list(rows[0].keys())
+    data = rows if limit is None else rows[:limit]
     print(f"\n{title} ===")
+    if isinstance(data, np.ndarray):
+        header = list(data.dtype.names)
+        print(", ".join(header))  # 헤더
+        cols = [_format_column(data[k], numeric_strings=True) for k in header]
+        print("\n".join(", ".join(r) for r in zip(*cols)))
+        return
+    header = list(data[0].keys())
     print(", ".join(header))  # 헤더
-    data = rows if limit is None else rows[:limit]
     def _fmt(v):
         try:
             return f"{float(v):.3f}"
@@ -150,62 +249,60 @@ def _to_float(x: str) -> float:
     except Exception:
         return float("nan")
 
-def load_inventory(p: Path) -> list[dict]:
-    rows = []
+def sort_inventory(data: np.ndarray, column: str = "Flammability", descending: bool = True) -> np.ndarray:
+    """정렬 순서(행 인덱스). 같은 값은 원래 순서 유지, nan은 맨 뒤."""
+    key = np.asarray(data[column], dtype=float)
+    key = np.where(np.isnan(key), -np.inf if descending else np.inf, key)
+    return np.argsort(-key if descending else key, kind="stable")
+
+def danger_mask(data: np.ndarray, rules: dict[str, float] | None = None) -> np.ndarray:
+    """rules의 모든 {컬럼: 최솟값} 조건을 만족하는 행 마스크(nan은 불일치)"""
+    mask = np.ones(len(data), dtype=bool)
+    for column, minimum in (DANGER_RULES if rules is None else rules).items():
+        with np.errstate(invalid="ignore"):
+            mask &= np.asarray(data[column], dtype=float) >= minimum
+    return mask
+
+def write_table_csv(path: Path, data: np.ndarray) -> None:
+    """구조화 배열을 CSV로 저장(숫자 컬럼은 소수점 3자리, 컬럼 단위 일괄 변환)"""
+    cols = [_format_column(data[k]) for k in data.dtype.names]
+    with open(path, "w", encoding="utf-8-sig", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(data.dtype.names)
+        w.writerows(zip(*cols))
+
+def convert_csv(csv_path: Path | str | None = None, out_dir: Path = OUT_DIR,
+                rules: dict[str, float] | None = None, sort_by: str = "Flammability"):
+    """인벤토리를 sort_by 내림차순 정렬 후 rules로 위험 행을 골라 CSV/BIN 저장
 
-    with open(p, "r", encoding="utf-8-sig", newline="") as f:
-        for row in csv.DictReader(f):
-            rows.append(row)
-    return rows
-
-def convert_csv(csv_path: Path | str | None = None, out_dir: Path = OUT_DIR):
+    Returns:
+        (정렬된 전체, 위험 목록, BIN 복구본) 구조화 배열. 실패 시 빈 리스트 3개
+    """
     danger_csv_path = out_dir / "Mars_Base_Inventory_danger.csv"
     bin_path = out_dir / "Mars_Base_Inventory_List.bin"
     
     try:
         if csv_path:
-            src = Path(csv_path)
+            src = csv_path if isinstance(csv_path, zipfile.Path) else Path(csv_path)
         else:
-            try:
-                src = find_file("Mars_Base_Inventory_List.csv")
-            except FileNotFoundError:
-                zip_path = BASE / "mars_base.zip"
-                if zip_path.exists():
-                    extract_zip(zip_path, BASE)
-                    src = find_file("Mars_Base_Inventory_List.csv")
-                else:
-                    raise
-
-        rows = load_inventory(src)
-        if not rows:
+            src = locate_csv("Mars_Base_Inventory_List.csv")
+
+        table = load_csv(src, INVENTORY_SCHEMA)
+        if not len(table):
             print("CSV에 데이터가 없습니다."); return [], [], []
         
-        for r in rows: 
-            r["Flammability"] = _to_float(r.get("Flammability",""))
-        rows.sort(
-            key=lambda r: (r["Flammability"] if isinstance(r["Flammability"], float) else -1),
-            reverse=True)
-        
-        danger = [r for r in rows if isinstance(r["Flammability"], float) and r["Flammability"]>=0.7]
+        # 정렬/필터 모두 배열 연산(argsort, 불리언 마스크)
+        rows = table.data[sort_inventory(table.data, sort_by)]
+        danger = rows[danger_mask(rows, rules)]
         
         # 저장 (CSV) - 소수점 3자리 고정
-        with open(danger_csv_path, "w", encoding="utf-8-sig", newline="") as f:
-            fieldnames = list(rows[0].keys())
-            w = csv.DictWriter(f, fieldnames=fieldnames)
-            w.writeheader()
-            for r in danger:
-                r_out = dict(r)
-                # 오탈자 수정 + 숫자일 때만 포맷팅
-                if isinstance(r_out.get("Flammability"), float):
-                    r_out["Flammability"] = f"{r_out['Flammability']:.3f}"
-                w.writerow(r_out)
-
-        # 보너스: 이진 저장/복구
-        with open(bin_path, "wb") as f:
-            pickle.dump(rows, f)
-        
-        with open(bin_path, "rb") as f:
-            restored = pickle.load(f)
+        write_table_csv(danger_csv_path, danger)
+
+        # 보너스: 이진 저장/복구(정렬된 구조화 배열 그대로 저장 후 다시 읽어 비교)
+        write_inventory(bin_path, rows)
+        restored = read_inventory(bin_path)
+        if not same_table(rows, restored):
+            raise ValueError(f"이진 복구 결과가 원본과 다릅니다.: {bin_path}")
         
         print(f"\n위험 {len(danger)}건 저장 -> {danger_csv_path.name} / 정렬본BIN -> {bin_path.name}")
         return rows, danger, restored
@@ -233,6 +330,168 @@ def sphere_area(diameter_m: float, material: str, thickness_cm: float=1.0) -> tu
     
     return round(curved_area_m2,3), round(weight_mars,3)
 
+def sphere_area_batch(diameter_m, material, thickness_cm=1.0) -> tuple[np.ndarray, np.ndarray]:
+    """sphere_area의 배열 버전(브로드캐스팅). 반올림하지 않은 (면적[m^2], 화성 무게[kg]) 배열 반환
+
+    Args:
+        diameter_m: 지름(m) 스칼라/배열
+        material: 재질 이름 스칼라/배열(MATERIAL_DENSITY 키)
+        thickness_cm: 두께(cm) 스칼라/배열
+
+    Raises:
+        ValueError: 0 이하 지름/두께, 알 수 없는 재질
+    """
+    d = np.asarray(diameter_m, dtype=float)
+    t = np.asarray(thickness_cm, dtype=float)
+    if np.any(d <= 0) or np.any(t <= 0):
+        raise ValueError("지름/두께는 0보다 커야 합니다.")
+
+    names = np.char.lower(np.char.strip(np.asarray(material, dtype=str)))
+    # 고유 재질만 사전 조회 후 코드로 펼침
+    uniq, inv = np.unique(names, return_inverse=True)
+    bad = [u for u in uniq.tolist() if u not in MATERIAL_DENSITY]
+    if bad:
+        raise ValueError(f"material은 glass/aluminum/carbon_steel 중 하나: {', '.join(bad)}")
+    density = np.array([MATERIAL_DENSITY[u] for u in uniq.tolist()])[inv].reshape(names.shape)
+
+    area = 2 * pi * (d / 2.0) ** 2
+    weight = area * 1e4 * t * density / 1000.0 * MARS_G
+    return area, weight
+
+def dome_sweep(diameters, thicknesses, materials=tuple(MATERIAL_DENSITY)) -> np.ndarray:
+    """지름 × 두께 × 재질 전체 조합을 한 번에 계산한 구조화 배열(재질 > 지름 > 두께 순서로 나열)"""
+    mats = np.asarray(materials, dtype=str)
+    m, d, t = np.meshgrid(mats, np.asarray(diameters, float), np.asarray(thicknesses, float), indexing="ij")
+    area, weight = sphere_area_batch(d, m, t)
+    out = np.empty(m.size, dtype=[("material", mats.dtype), ("diameter_m", float), ("thickness_cm", float),
+                                  ("area_m2", float), ("weight_kg", float)])
+    out["material"], out["diameter_m"], out["thickness_cm"] = m.ravel(), d.ravel(), t.ravel()
+    out["area_m2"], out["weight_kg"] = area.ravel(), weight.ravel()
+    return out
+
+def save_dome_sweep(out_csv: Path, diameters, thicknesses, materials=tuple(MATERIAL_DENSITY)) -> int:
+    """dome_sweep 결과 표 전체를 CSV로 한 번에 저장하고 행 수를 반환합니다.
+
+    Raises:
+        ValueError: 잘못된 지름/두께/재질
+        OSError: 저장 실패
+    """
+    table = dome_sweep(diameters, thicknesses, materials)
+    out_csv = Path(out_csv)
+    out_csv.parent.mkdir(parents=True, exist_ok=True)
+    write_table_csv(out_csv, table)
+    return len(table)
+
+class DomeOptimizer:
+    """지름 D에서 최소 두께/무게 예산을 만족하는 설계를 두께 격자 × 재질에서 탐색합니다.
+
+    - 무게는 두께에 비례(면적 × 두께 × 밀도)하므로 재질별 무게 예산 내 최대 두께를 해석적으로 구해
+      격자 구간을 searchsorted로 바로 자르고, 최소 두께에서도 예산을 넘는 재질은 평가 없이 제외
+    - (지름, 재질)별 두께 격자 전체 평가 결과를 캐시 -> 같은 지름의 반복 질의는 재계산 없음
+    - pareto: (무게 최소, 두께 최대) 기준으로 다른 설계에 지배되지 않는 설계 목록
+    """
+
+    def __init__(self, thicknesses, materials=tuple(MATERIAL_DENSITY)) -> None:
+        grid = np.unique(np.asarray(thicknesses, dtype=float))
+        if not len(grid) or np.any(grid <= 0):
+            raise ValueError("두께 격자는 0보다 큰 값이 하나 이상 필요합니다.")
+        mats = [m.strip().lower() for m in materials]
+        bad = [m for m in mats if m not in MATERIAL_DENSITY]
+        if bad:
+            raise ValueError(f"material은 glass/aluminum/carbon_steel 중 하나: {', '.join(bad)}")
+        self.thicknesses = grid
+        # 밀도 오름차순: 가벼운 재질부터 확인
+        self.materials = sorted(dict.fromkeys(mats), key=MATERIAL_DENSITY.get)
+        self._cache: dict[tuple[float, str], np.ndarray] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _weights(self, diameter: float, material: str) -> np.ndarray:
+        key = (float(diameter), material)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        _, weight = sphere_area_batch(diameter, material, self.thicknesses)
+        self._cache[key] = weight
+        return weight
+
+    def optimize(self, diameter: float, min_thickness: float = 0.0, max_weight: float = float("inf")) -> dict:
+        """조건을 만족하는 설계 탐색 결과
+
+        Returns:
+            dict: best(최경량 설계 또는 None), per_material(재질별 최경량), pareto, pruned(제외 재질), area_m2
+        """
+        if diameter <= 0:
+            raise ValueError("지름은 0보다 커야 합니다.")
+        area = 2 * pi * (diameter / 2.0) ** 2
+        lo = int(np.searchsorted(self.thicknesses, min_thickness, side="left"))
+        designs: list[dict] = []
+        per_material: list[dict] = []
+        pruned: list[str] = []
+        for m in self.materials:
+            unit = area * 1e4 * MATERIAL_DENSITY[m] / 1000.0 * MARS_G  # 두께 1cm당 무게
+            if lo >= len(self.thicknesses) or unit * self.thicknesses[lo] > max_weight:
+                pruned.append(m)
+                continue
+            hi = int(np.searchsorted(self.thicknesses, max_weight / unit, side="right"))
+            weight = self._weights(diameter, m)[lo:hi]
+            thick = self.thicknesses[lo:hi]
+            ok = weight <= max_weight  # 경계의 부동소수 오차 보정
+            found = [{"material": m, "thickness_cm": float(t), "weight_kg": float(w)}
+                     for t, w in zip(thick[ok], weight[ok])]
+            if found:
+                per_material.append(found[0])
+                designs.extend(found)
+            else:
+                pruned.append(m)
+
+        # 무게 오름차순(동률이면 두께 내림차순)으로 훑으며 두께가 커질 때만 파레토에 추가
+        pareto: list[dict] = []
+        for d in sorted(designs, key=lambda x: (x["weight_kg"], -x["thickness_cm"])):
+            if not pareto or d["thickness_cm"] > pareto[-1]["thickness_cm"]:
+                pareto.append(d)
+        return {
+            "diameter": float(diameter),
+            "area_m2": area,
+            "best": min(per_material, key=lambda x: x["weight_kg"]) if per_material else None,
+            "per_material": per_material,
+            "pareto": pareto,
+            "pruned": pruned,
+        }
+
+def print_optimum(result: dict) -> None:
+    """DomeOptimizer.optimize 결과 출력(소수점 3자리)"""
+    def _line(d: dict) -> str:
+        return (f"재질 ⇒ {MATERIAL_KO.get(d['material'], d['material'])}, "
+                f"두께 ⇒ {_pretty_int_or_3(d['thickness_cm'])}, 화성 유효중량 ⇒ {d['weight_kg']:.3f} kg")
+
+    print(f"\n지름 {_pretty_int_or_3(result['diameter'])} m, 면적 {result['area_m2']:.3f} m²")
+    if result["best"] is None:
+        print("조건을 만족하는 설계가 없습니다.")
+        return
+    print("최경량 설계: " + _line(result["best"]))
+    print("재질별 최경량:")
+    for d in result["per_material"]:
+        print("  " + _line(d))
+    if result["pruned"]:
+        print("제외된 재질: " + ", ".join(MATERIAL_KO.get(m, m) for m in result["pruned"]))
+    print(f"파레토 설계(무게↓, 두께↑) {len(result['pareto'])}건:")
+    for d in result["pareto"]:
+        print("  " + _line(d))
+
+def _parse_values(spec: str) -> np.ndarray:
+    """"1,2,5" 목록 또는 "시작:끝:간격"(끝 포함) 범위를 배열로 변환"""
+    if ":" in spec:
+        parts = [float(x) for x in spec.split(":")]
+        if len(parts) != 3 or parts[2] <= 0:
+            raise ValueError(f"범위는 시작:끝:간격(간격>0) 형식이어야 합니다.: {spec}")
+        start, stop, step = parts
+        n = int(np.floor((stop - start) / step + 1e-9)) + 1
+        return start + step * np.arange(max(n, 0))
+    return np.array([float(x) for x in spec.split(",") if x.strip()])
+
 def _pretty_int_or_3(x: float) -> str:
     """정수면 '10', 아니면 '10.500'처럼 3자리 고정"""
     return str(int(x)) if float(x).is_integer() else f"{x:.3f}"
@@ -275,57 +534,77 @@ def mars_structure_program():
         except Exception as e:
             print(f"입력 오류: {e}")
 
-def _parts_to_dict(p: Path) -> dict[str,float]:
-    out = {}
-    with open(p,"r",encoding="utf-8-sig",newline="") as f:
-        for row in csv.DictReader(f):
-            name = str(row.get("parts", "")).strip()
-            if not name:
-                continue
-            try:
-                value = float(row.get("strength", ""))
-            except (TypeError, ValueError):
-                value = float("nan")
-            out[name] = value
-    return out
+class PartsAccumulator:
+    """부품별 강도 합계/측정 개수를 파일 단위로 누적(이름 -> 인덱스 맵 + NumPy 벡터)
 
-def analysis_parts():
-    p1 = find_file("mars_base_main_parts-001.csv")
-    p2 = find_file("mars_base_main_parts-002.csv")
-    p3 = find_file("mars_base_main_parts-003.csv")
+    파일 하나를 더할 때마다 그 파일의 배열만 메모리에 올리므로 전체 메모리는 부품 수에만 비례합니다.
+    nan(측정 없음)은 np.nanmean처럼 합계/개수에서 제외합니다.
+    """
+
+    def __init__(self) -> None:
+        self.index: dict[str, int] = {}
+        self.sums = np.zeros(16)
+        self.counts = np.zeros(16, dtype=np.int64)
+
+    def add(self, names: np.ndarray, values: np.ndarray) -> None:
+        names = np.asarray(names, dtype=str)
+        values = np.asarray(values, dtype=float)
+        keep = names != ""
+        names, values = names[keep], values[keep]
+        if not len(names):
+            return
+        # 한 파일 안의 같은 부품은 마지막 값만 사용(기존 dict 동작과 동일)
+        uniq, last = np.unique(names[::-1], return_index=True)
+        values = values[::-1][last]
+        idx = np.fromiter((self.index.setdefault(n, len(self.index)) for n in uniq.tolist()),
+                          dtype=np.int64, count=len(uniq))
+        if len(self.index) > len(self.sums):
+            size = max(len(self.index), 2 * len(self.sums))
+            self.sums = np.concatenate([self.sums, np.zeros(size - len(self.sums))])
+            self.counts = np.concatenate([self.counts, np.zeros(size - len(self.counts), dtype=np.int64)])
+        valid = ~np.isnan(values)
+        np.add.at(self.sums, idx[valid], values[valid])
+        np.add.at(self.counts, idx[valid], 1)
+
+    def means(self) -> tuple[list[str], np.ndarray]:
+        """(이름순 부품 목록, 평균 강도 배열). 측정이 없는 부품은 nan"""
+        names = sorted(self.index)
+        idx = np.array([self.index[n] for n in names], dtype=np.int64)
+        sums, counts = self.sums[idx], self.counts[idx]
+        with np.errstate(all='ignore'):
+            avg = np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+        return names, avg
+
+def analysis_parts(pattern: str = PARTS_PATTERN):
+    files = locate_csvs(pattern)
+    if not files:
+        print(f" 부품 CSV 파일을 찾을 수 없습니다.: {pattern}")
+        return
     
     try:
-        arr1,arr2,arr3 = _parts_to_dict(p1),_parts_to_dict(p2),_parts_to_dict(p3)
-        names = sorted(set(arr1)|set(arr2)|set(arr3))
-        mat = np.vstack([
-            np.array([arr1.get(k, np.nan) for k in names], float),
-            np.array([arr2.get(k, np.nan) for k in names], float),
-            np.array([arr3.get(k, np.nan) for k in names], float),
-        ])
-        # errstate -> np에서 경고 or 에러 임시 제어 도구
-        with np.errstate(all='ignore'):
-            avg = np.nanmean(mat, axis=0)
+        acc = PartsAccumulator()
+        for p in files:
+            # 누적 후 버릴 파일이므로 로더 캐시에 남기지 않음
+            table = load_csv(p, PARTS_SCHEMA, cache=False)
+            acc.add(table.column("parts"), table.column("strength"))
+        names, avg = acc.means()
         # 필터링 된 값의 True인 값만 mask변수 선언
         mask = np.isfinite(avg) & (avg < PART_STRENGTH_MAX)
+        # 저장/전치에 함께 쓰는 결과 행(소수점 3자리 문자열)
+        parts2 = [[str(name), f"{float(val):.3f}"] for name, val in zip(np.array(names)[mask], avg[mask])]
         
         out_csv = OUT_DIR / "parts_to_work_on.csv"
         try:
             with open(out_csv,"w",encoding="utf-8-sig",newline="") as f:
                 w = csv.writer(f); w.writerow(["parts","avg_strength"])
-                for name,val in zip(np.array(names)[mask], avg[mask]):
-                    w.writerow([name, f"{float(val):.3f}"])
+                w.writerows(parts2)
         except OSError as e:
             print(f"[저장 오류] {out_csv}: {e}")
             return
 
-        # 보너스: transpose
+        # 보너스: transpose (방금 저장한 값을 다시 읽지 않고 메모리에서 그대로 사용)
         parts2_csv = OUT_DIR / "parts2.csv"
-        parts2=[]
         try:
-            with open(out_csv, "r", encoding="utf-8-sig", newline="") as f:
-                rd = csv.reader(f); next(rd,None)
-                for row in rd:
-                    parts2.append(row)
             with open(parts2_csv, "w", encoding="utf-8-sig", newline="") as f:
                 w = csv.writer(f)
                 w.writerow(["parts", "avg_strength"])
@@ -357,17 +636,42 @@ def analysis_parts():
         print(f" 오류: {e}")
 
 if __name__ == "__main__":
-    # 1) 파일 찾기(없으면 zip 해제 후 재시도)
+    parser = argparse.ArgumentParser(description="Mars 기지 인벤토리/부품 분석 + 돔 설계 계산")
+    parser.add_argument("--sweep", action="store_true",
+                        help="대화형 계산 대신 지름×두께×재질 전체 조합을 CSV로 일괄 저장")
+    parser.add_argument("--diameters", default="1:20:1", help='지름(m) 목록 "5,10" 또는 범위 "시작:끝:간격"')
+    parser.add_argument("--thicknesses", default="0.5:3:0.5", help='두께(cm) 목록 또는 범위')
+    parser.add_argument("--materials", default=",".join(MATERIAL_DENSITY), help="재질 목록(쉼표 구분)")
+    parser.add_argument("--out", type=Path, default=OUT_DIR / "dome_sweep.csv", help="--sweep 결과 CSV 경로")
+    parser.add_argument("--optimize", type=float, metavar="D", default=None,
+                        help="지름 D(m)에서 조건을 만족하는 최경량/파레토 설계 탐색(--thicknesses 격자 사용)")
+    parser.add_argument("--min-thickness", type=float, default=0.0, help="--optimize 최소 두께(cm)")
+    parser.add_argument("--max-weight", type=float, default=float("inf"), help="--optimize 무게 예산(kg)")
+    args = parser.parse_args()
+
+    if args.optimize is not None:
+        try:
+            opt = DomeOptimizer(_parse_values(args.thicknesses), [m for m in args.materials.split(",") if m.strip()])
+            print_optimum(opt.optimize(args.optimize, args.min_thickness, args.max_weight))
+        except ValueError as e:
+            print(f"입력 오류: {e}")
+        raise SystemExit(0)
+
+    if args.sweep:
+        try:
+            n = save_dome_sweep(args.out, _parse_values(args.diameters), _parse_values(args.thicknesses),
+                                [m for m in args.materials.split(",") if m.strip()])
+            print(f"돔 설계 조합 {n}건 저장 -> {args.out}")
+        except (ValueError, OSError) as e:
+            print(f"입력 오류: {e}")
+        raise SystemExit(0)
+
+    # 1) 파일 찾기(없으면 zip 안에서 바로 읽음, 압축 해제 없음)
     try:
-        src = find_file("Mars_Base_Inventory_List.csv")
+        src = locate_csv("Mars_Base_Inventory_List.csv")
     except FileNotFoundError:
-        zip_path = BASE / "mars_base.zip"
-        if zip_path.exists():
-            extract_zip(zip_path, BASE)
-            src = find_file("Mars_Base_Inventory_List.csv")
-        else:
-            print("CSV 파일을 찾을 수 없습니다.")
-            src = None
+        print("CSV 파일을 찾을 수 없습니다.")
+        src = None
 
     # 2) 원본 그대로 출력 + 정렬/필터/저장/복구
     if src:
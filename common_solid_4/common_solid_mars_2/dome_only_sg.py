@@ -1,27 +1,17 @@
-import zipfile
+import csv
+import io
 from pathlib import Path
 
-def extract_zip(zip_path, result_dir=None):
+from zip_fs import open_zip
 
-    zp = Path(zip_path)
-    base_result = Path(result_dir) if result_dir else Path.cwd()
-    if not zp.exists(): raise FileNotFoundError(f"ZIP파일을 찾을 수 없습니다. :{zp}")
-    if not zp.is_file(): raise IsADirectoryError(f"경로 확인 필요! :{zp}")
-
-    extract_dir = base_result / "mars_base"
-    extract_dir.mkdir(parents=True, exist_ok=True)
-
-    with zipfile.ZipFile(zp, "r") as zf:
-        names = zf.namelist()
-        zf.extractall(extract_dir)
-        print(f"-------압축해제완료-------->{extract_dir}")
-        print("\n".join(names))
-        print(f" 압축 해제된 파일 수: {len(names)}")
-
-    return extract_dir
-    
-def load_csv(csv_path):
-    csv_path = Path("mars_base/Mras_Base_Inventory_List.csv")
+def load_csv(name="Mars_Base_Inventory_List.csv", zip_path=None):
+    # 압축을 풀지 않고 zip 멤버를 바로 읽음(macOS 메타데이터 제외, 파일명 대소문자 무시)
+    src = open_zip(Path(zip_path) if zip_path else Path.cwd() / "mars_base.zip").find(name)
+    text = src.read_bytes().decode("utf-8-sig")
+    return list(csv.DictReader(io.StringIO(text, newline="")))
 
 if __name__ == "__main__":
-    extract_zip(Path.cwd() / "mars_base.zip")
\ No newline at end of file
+    rows = load_csv()
+    print(f"zip에서 바로 읽은 행 수: {len(rows)}")
+    for r in rows[:5]:
+        print(r)
\ No newline at end of file
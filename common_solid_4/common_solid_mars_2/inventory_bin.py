@@ -0,0 +1,193 @@
+"""
+inventory_bin.py
+- 인벤토리(구조화 배열)용 타입 고정 이진 포맷: pickle 대체(코드 실행 없음, 크기/속도 개선)
+- 파일 구조(리틀 엔디언, 각 구간은 8byte 정렬)
+    [MAGIC 8byte][헤더 JSON 길이 uint64][헤더 JSON]
+    [컬럼 0][컬럼 1]...            숫자 컬럼: float64 * rows, 문자열 컬럼: 문자열표 코드 int32 * rows
+    [문자열표 offsets int64 * (k+1)][문자열표 UTF-8 바이트]
+  헤더: {"rows": n, "columns": [{"name", "type": "f8"|"str", "offset"}], "strings": {"count", "offsets", "blob"}}
+        offset은 헤더 뒤 데이터 시작 위치 기준 byte 위치
+- 읽기: mmap으로 열어 필요한 컬럼만 np.frombuffer 뷰로 반환(파일 전체를 복사하지 않음)
+- 문자열은 컬럼 간 중복 없이 문자열표에 한 번만 저장
+"""
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+MAGIC = b"MBINV001"
+_ALIGN = 8
+
+
+def _pad(n: int) -> int:
+    return (-n) % _ALIGN
+
+
+def write_inventory(path: Path | str, data: np.ndarray) -> Path:
+    """구조화 배열을 이진 인벤토리 파일로 저장합니다.
+
+    Args:
+        path (Path | str): 저장 경로
+        data (np.ndarray): 구조화 배열(float 컬럼 -> f8, 그 외 -> 문자열)
+
+    Raises:
+        OSError: 저장 실패
+    """
+    path = Path(path)
+    n = len(data)
+    strings: dict[str, int] = {}
+    blocks: list[tuple[dict[str, Any], bytes]] = []
+    for name in data.dtype.names:
+        col = data[name]
+        if col.dtype.kind == "f":
+            blocks.append(({"name": name, "type": "f8"}, col.astype("<f8").tobytes()))
+        else:
+            # 고유값만 문자열표에 등록 후 코드로 펼침
+            uniq, inv = np.unique(col, return_inverse=True)
+            lut = np.fromiter((strings.setdefault(str(v), len(strings)) for v in uniq), dtype="<i4", count=len(uniq))
+            codes = lut[inv].astype("<i4")
+            blocks.append(({"name": name, "type": "str"}, codes.tobytes()))
+
+    encoded = [s.encode("utf-8") for s in strings]
+    str_offsets = np.zeros(len(encoded) + 1, dtype="<i8")
+    np.cumsum([len(b) for b in encoded], out=str_offsets[1:])
+    blob = b"".join(encoded)
+
+    pos = 0
+    columns = []
+    for meta, raw in blocks:
+        columns.append({**meta, "offset": pos})
+        pos += len(raw) + _pad(len(raw))
+    header = {
+        "rows": n,
+        "columns": columns,
+        "strings": {"count": len(encoded), "offsets": pos, "blob": pos + str_offsets.nbytes},
+    }
+    head = json.dumps(header, ensure_ascii=False).encode("utf-8")
+
+    try:
+        with open(path, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<Q", len(head)))
+            f.write(head)
+            f.write(b"\0" * _pad(f.tell()))
+            for _, raw in blocks:
+                f.write(raw)
+                f.write(b"\0" * _pad(len(raw)))
+            f.write(str_offsets.tobytes())
+            f.write(blob)
+    except OSError as e:
+        raise OSError(f"이진 저장 실패: {path} (사유: {e})") from e
+    return path
+
+
+class InventoryFile:
+    """이진 인벤토리 읽기(mmap). with 문 또는 close()로 닫습니다.
+
+    Examples:
+        with InventoryFile(path) as inv:
+            flam = inv.column("Flammability")      # float64 뷰(복사 없음)
+            part = inv.read(["Substance", "Flammability"])
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self._f = open(self.path, "rb")
+        try:
+            self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # 빈 파일
+            self._f.close()
+            raise ValueError(f"이진 인벤토리 형식이 아닙니다.: {self.path}")
+        if self._mm[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"이진 인벤토리 형식이 아닙니다.: {self.path}")
+        (head_len,) = struct.unpack_from("<Q", self._mm, len(MAGIC))
+        start = len(MAGIC) + 8
+        header = json.loads(self._mm[start:start + head_len].decode("utf-8"))
+        self._base = start + head_len + _pad(start + head_len)
+        self.rows: int = header["rows"]
+        self.columns: dict[str, dict[str, Any]] = {c["name"]: c for c in header["columns"]}
+        self._strings_meta = header["strings"]
+        self._offsets: np.ndarray | None = None
+
+    def __enter__(self) -> "InventoryFile":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """column()이 돌려준 뷰가 남아 있으면 mmap 해제는 GC에 맡깁니다."""
+        self._offsets = None
+        if getattr(self, "_mm", None) is not None:
+            try:
+                self._mm.close()
+            except BufferError:
+                pass
+            self._mm = None
+        self._f.close()
+
+    @property
+    def names(self) -> list[str]:
+        return list(self.columns)
+
+    def _string(self, code: int) -> str:
+        if self._offsets is None:
+            meta = self._strings_meta
+            self._offsets = np.frombuffer(self._mm, dtype="<i8", count=meta["count"] + 1,
+                                          offset=self._base + meta["offsets"])
+        base = self._base + self._strings_meta["blob"]
+        lo, hi = int(self._offsets[code]), int(self._offsets[code + 1])
+        return self._mm[base + lo:base + hi].decode("utf-8")
+
+    def codes(self, name: str) -> np.ndarray:
+        """문자열 컬럼의 문자열표 코드(int32 뷰)"""
+        meta = self.columns[name]
+        if meta["type"] != "str":
+            raise TypeError(f"문자열 컬럼이 아닙니다.: {name}")
+        return np.frombuffer(self._mm, dtype="<i4", count=self.rows, offset=self._base + meta["offset"])
+
+    def column(self, name: str) -> np.ndarray:
+        """숫자 컬럼은 float64 뷰, 문자열 컬럼은 필요한 문자열만 디코딩한 배열"""
+        if name not in self.columns:
+            raise KeyError(f"컬럼이 없습니다.: {name}")
+        meta = self.columns[name]
+        if meta["type"] == "f8":
+            return np.frombuffer(self._mm, dtype="<f8", count=self.rows, offset=self._base + meta["offset"])
+        codes = self.codes(name)
+        uniq, inv = np.unique(codes, return_inverse=True)
+        values = [self._string(int(c)) for c in uniq]
+        width = max((len(v) for v in values), default=1) or 1
+        return np.array(values, dtype=f"U{width}")[inv]
+
+    def read(self, columns: list[str] | None = None) -> np.ndarray:
+        """지정 컬럼만 구조화 배열로 읽습니다(생략 시 전체, 파일 순서)."""
+        names = list(columns) if columns else self.names
+        arrays = [self.column(n) for n in names]
+        data = np.empty(self.rows, dtype=[(n, a.dtype) for n, a in zip(names, arrays)])
+        for n, a in zip(names, arrays):
+            data[n] = a
+        return data
+
+
+def read_inventory(path: Path | str, columns: list[str] | None = None) -> np.ndarray:
+    """이진 인벤토리를 구조화 배열(복사본)로 읽습니다."""
+    with InventoryFile(path) as inv:
+        return inv.read(columns)
+
+
+def same_table(a: np.ndarray, b: np.ndarray) -> bool:
+    """두 구조화 배열의 컬럼/값이 같은지(nan끼리는 같다고 봄)"""
+    if a.dtype.names != b.dtype.names or len(a) != len(b):
+        return False
+    for name in a.dtype.names:
+        x, y = a[name], b[name]
+        if x.dtype.kind == "f" and y.dtype.kind == "f":
+            if not np.array_equal(x, y, equal_nan=True):
+                return False
+        elif not np.array_equal(x.astype(str), y.astype(str)):
+            return False
+    return True
@@ -0,0 +1,101 @@
+"""
+zip_fs.py
+- mars_base.zip 같은 압축 파일을 풀지 않고 그대로 읽는 가상 파일시스템
+- 멤버는 zipfile.Path로 돌려줌 -> read_bytes()/open()으로 바로 파서에 전달(디스크 기록 없음)
+- macOS 메타데이터(__MACOSX/, ._*, .DS_Store)와 폴더 항목은 제외
+- 파일명 조회는 대소문자 무시(소문자 파일명 -> 멤버 색인), glob 패턴 지원
+- 같은 zip은 경로별로 한 번만 열어서 재사용(mtime이 바뀌면 이전 핸들을 닫고 다시 엶, 종료 시 모두 닫음)
+"""
+import atexit
+import fnmatch
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import Any
+
+_OPEN: dict[str, tuple[int, "ZipFS"]] = {}
+
+
+def is_meta(name: str) -> bool:
+    """macOS 메타데이터 항목 여부"""
+    base = PurePosixPath(name).name
+    return (name.startswith("__MACOSX/") or "/__MACOSX/" in name
+            or base.startswith("._") or base == ".DS_Store")
+
+
+class ZipFS:
+    """압축 파일 하나를 읽기 전용 파일시스템처럼 다룹니다.
+
+    Examples:
+        fs = open_zip(BASE / "mars_base.zip")
+        src = fs.find("Mars_Base_Inventory_List.csv")   # zipfile.Path
+        text = src.read_bytes().decode("utf-8-sig")
+    """
+
+    def __init__(self, zip_path: Path | str) -> None:
+        self.path = Path(zip_path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"ZIP파일을 찾을 수 없습니다. :{self.path}")
+        if not self.path.is_file():
+            raise IsADirectoryError(f"경로 확인 필요! :{self.path}")
+        self.zf = zipfile.ZipFile(self.path, "r")
+        self.members: list[str] = [
+            i.filename for i in self.zf.infolist() if not i.is_dir() and not is_meta(i.filename)
+        ]
+        self._by_name: dict[str, list[str]] = {}
+        for m in self.members:
+            self._by_name.setdefault(PurePosixPath(m).name.lower(), []).append(m)
+
+    def __enter__(self) -> "ZipFS":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.zf.close()
+
+    def path_of(self, member: str) -> zipfile.Path:
+        return zipfile.Path(self.zf, at=member)
+
+    def find(self, name: str) -> zipfile.Path:
+        """파일명(대소문자 무시)으로 멤버를 찾습니다.
+
+        Raises:
+            FileNotFoundError: 일치하는 멤버 없음
+        """
+        hits = self._by_name.get(PurePosixPath(name).name.lower())
+        if not hits:
+            raise FileNotFoundError(f"{name} not found in {self.path.name}")
+        return self.path_of(hits[0])
+
+    def glob(self, pattern: str) -> list[zipfile.Path]:
+        """파일명이 패턴(대소문자 무시)과 일치하는 멤버(이름순)"""
+        pat = pattern.lower()
+        found = [m for key, ms in self._by_name.items() if fnmatch.fnmatchcase(key, pat) for m in ms]
+        return [self.path_of(m) for m in sorted(found, key=lambda m: (PurePosixPath(m).name.lower(), m))]
+
+
+def open_zip(zip_path: Path | str) -> ZipFS:
+    """같은 zip(경로, mtime)이면 이미 연 ZipFS를 재사용합니다.
+    압축 파일이 교체되었으면(mtime 변경/삭제) 이전 ZipFS를 닫고 목록에서 뺍니다.
+    """
+    p = Path(zip_path)
+    key = str(p.resolve())
+    mtime = p.stat().st_mtime_ns if p.exists() else -1
+    cached = _OPEN.get(key)
+    if cached is not None:
+        if cached[0] == mtime:
+            return cached[1]
+        del _OPEN[key]
+        cached[1].close()
+    fs = ZipFS(p)
+    _OPEN[key] = (mtime, fs)
+    return fs
+
+
+@atexit.register
+def close_all() -> None:
+    """open_zip으로 연 모든 압축 파일을 닫고 캐시를 비웁니다."""
+    while _OPEN:
+        _, (_, fs) = _OPEN.popitem()
+        fs.close()
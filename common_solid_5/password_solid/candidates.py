@@ -0,0 +1,237 @@
+"""
+candidates.py
+- unlock_zip용 후보 암호 생성기(모두 같은 병렬 구간 탐색 엔진을 사용)
+- 생성기는 후보에 0..size-1 인덱스를 매기고, 구간 [lo, hi)만 골라 검사할 수 있음
+  -> 키 공간 분할/체크포인트(zip_crack.Checkpoint)를 그대로 사용
+    MaskSource     : 자리별 문자 집합. hashcat 형식 마스크(?d?d?l?l?l?l) 또는 brute_force(길이 범위)
+    WordlistSource : 단어 목록 x 변형 규칙(hashcat 규칙 일부: : l u c t r d $X ^X sXY)
+    ChainSource    : 여러 생성기를 순서대로 이어 붙임(가능성 높은 후보 먼저)
+- likely_first(): 단어 목록+규칙 -> 흔한 마스크 -> 길이 범위 brute force(빈도순 문자) 순서의 계획
+제약: 표준 라이브러리만 사용
+"""
+
+import string
+from pathlib import Path
+from typing import Any, Iterable
+
+from zip_crack import ZipCracker, index_to_digits
+
+MASK_CHARSETS = {
+    "l": string.ascii_lowercase,
+    "u": string.ascii_uppercase,
+    "d": string.digits,
+    "h": "0123456789abcdef",
+    "H": "0123456789ABCDEF",
+    "s": " " + string.punctuation,
+}
+MASK_CHARSETS["a"] = MASK_CHARSETS["l"] + MASK_CHARSETS["u"] + MASK_CHARSETS["d"] + MASK_CHARSETS["s"]
+
+# 빈도순 정렬 기준(영문 글자 빈도, 암호에 흔한 숫자 순)
+LIKELY_ORDER = "etaoinsrhldcumfpgwybvkxjqz" + "1023456789" + "ETAOINSRHLDCUMFPGWYBVKXJQZ" + "!@#$._-*?"
+
+DEFAULT_RULES = [":", "c", "u", "$1", "$!", "$1$2$3", "c$1", "r", "d", "sa@so0se3si1", "^1"]
+COMMON_MASKS = ["?d?d?d?d", "?d?d?d?d?d?d", "?l?l?l?l?d?d", "?l?l?l?l?l?d?d", "?l?l?l?l?d?d?d?d"]
+
+
+def likely_order(charset: str) -> str:
+    """문자 집합을 빈도순으로 재정렬(목록에 없는 문자는 원래 순서로 뒤에)"""
+    rank = {c: i for i, c in enumerate(LIKELY_ORDER)}
+    return "".join(sorted(dict.fromkeys(charset), key=lambda c: rank.get(c, len(rank))))
+
+
+def _search_iter(cracker: ZipCracker, candidates: Iterable[str], stop_event: Any,
+                 poll: int = 4096) -> tuple[str | None, int]:
+    """일반 후보 목록 검사(stop_event를 poll개마다 확인)"""
+    tried = 0
+    for pwd in candidates:
+        tried += 1
+        if cracker.test(pwd):
+            return pwd, tried
+        if stop_event is not None and tried % poll == 0 and stop_event.is_set():
+            break
+    return None, tried
+
+
+class MaskSource:
+    """자리별 문자 집합으로 정의되는 키 공간(마지막 자리가 가장 빨리 바뀜)"""
+
+    def __init__(self, positions: list[str], label: str | None = None) -> None:
+        if not positions or any(not cs for cs in positions):
+            raise ValueError("마스크 자리가 비어 있습니다.")
+        self.positions = positions
+        self.bases = [len(cs) for cs in positions]
+        self.size = 1
+        for b in self.bases:
+            self.size *= b
+        self.label = label or "".join(f"[{cs}]" for cs in positions)
+
+    def describe(self) -> str:
+        return f"mask:{self.label}"
+
+    def candidate(self, index: int) -> str:
+        return "".join(cs[d] for cs, d in zip(self.positions, index_to_digits(index, self.bases)))
+
+    def search(self, cracker: ZipCracker, lo: int, hi: int, stop_event: Any = None) -> tuple[str | None, int]:
+        return cracker.search_positions(self.positions, lo, hi, stop_event)
+
+
+def parse_mask(mask: str, custom: dict[str, str] | None = None, likely: bool = False) -> MaskSource:
+    """hashcat 형식 마스크를 MaskSource로 변환합니다.
+
+    ?l ?u ?d ?h ?H ?s ?a: 내장 문자 집합, ?1~?9: custom 문자 집합, ??: '?' 문자, 그 외: 고정 문자
+
+    Raises:
+        ValueError: 알 수 없는 ?X 또는 끝이 '?'로 끝남
+    """
+    sets = {**MASK_CHARSETS, **(custom or {})}
+    positions = []
+    i = 0
+    while i < len(mask):
+        ch = mask[i]
+        if ch != "?":
+            positions.append(ch)
+            i += 1
+            continue
+        if i + 1 >= len(mask):
+            raise ValueError(f"마스크가 '?'로 끝납니다.: {mask}")
+        key = mask[i + 1]
+        if key == "?":
+            positions.append("?")
+        elif key in sets:
+            positions.append(likely_order(sets[key]) if likely else sets[key])
+        else:
+            raise ValueError(f"알 수 없는 마스크 문자 집합: ?{key}")
+        i += 2
+    return MaskSource(positions, label=mask)
+
+
+def brute_force(charset: str, min_len: int, max_len: int, likely: bool = False) -> "ChainSource":
+    """길이 min_len~max_len 전체 탐색(짧은 길이부터, likely=True면 빈도순 문자)"""
+    if not 1 <= min_len <= max_len:
+        raise ValueError(f"길이 범위가 올바르지 않습니다.: {min_len}~{max_len}")
+    cs = likely_order(charset) if likely else charset
+    return ChainSource([MaskSource([cs] * n, label=f"{cs}^{n}") for n in range(min_len, max_len + 1)])
+
+
+def apply_rule(word: str, rule: str) -> str:
+    """변형 규칙 적용(hashcat 규칙 일부)
+
+    :(그대로) l(소문자) u(대문자) c(첫 글자만 대문자) t(대소문자 반전) r(뒤집기) d(두 번 반복)
+    $X(끝에 X 추가) ^X(앞에 X 추가) sXY(X를 Y로 치환)
+
+    Raises:
+        ValueError: 알 수 없는 규칙
+    """
+    i = 0
+    while i < len(rule):
+        op = rule[i]
+        if op in ": ":
+            pass
+        elif op == "l":
+            word = word.lower()
+        elif op == "u":
+            word = word.upper()
+        elif op == "c":
+            word = word[:1].upper() + word[1:].lower()
+        elif op == "t":
+            word = word.swapcase()
+        elif op == "r":
+            word = word[::-1]
+        elif op == "d":
+            word = word + word
+        elif op in "$^" and i + 1 < len(rule):
+            word = word + rule[i + 1] if op == "$" else rule[i + 1] + word
+            i += 1
+        elif op == "s" and i + 2 < len(rule):
+            word = word.replace(rule[i + 1], rule[i + 2])
+            i += 2
+        else:
+            raise ValueError(f"알 수 없는 규칙: {rule!r}")
+        i += 1
+    return word
+
+
+class WordlistSource:
+    """단어 목록 x 변형 규칙. 인덱스 = 규칙 번호 * 단어 수 + 단어 번호
+    (모든 단어에 첫 규칙을 먼저 적용 -> 목록 순서가 빈도순이면 가능성 높은 후보부터)
+    """
+
+    def __init__(self, words: list[str], rules: list[str] | None = None, label: str = "words") -> None:
+        self.words = [w for w in dict.fromkeys(words) if w]
+        self.rules = rules or [":"]
+        for r in self.rules:
+            apply_rule("", r)  # 규칙 문법을 미리 확인
+        self.size = len(self.words) * len(self.rules)
+        self.label = label
+
+    @classmethod
+    def from_file(cls, path: Path | str, rules: list[str] | None = None) -> "WordlistSource":
+        """단어 목록 파일(한 줄에 한 단어, UTF-8)
+
+        Raises:
+            FileNotFoundError: 파일 없음
+        """
+        p = Path(path)
+        words = p.read_text(encoding="utf-8", errors="ignore").splitlines()
+        st = p.stat()
+        return cls(words, rules, label=f"{p.resolve()}:{st.st_size}:{st.st_mtime_ns}")
+
+    def describe(self) -> str:
+        return f"wordlist:{self.label}:{len(self.words)}:{'|'.join(self.rules)}"
+
+    def candidate(self, index: int) -> str:
+        r, w = divmod(index, len(self.words))
+        return apply_rule(self.words[w], self.rules[r])
+
+    def search(self, cracker: ZipCracker, lo: int, hi: int, stop_event: Any = None) -> tuple[str | None, int]:
+        return _search_iter(cracker, (self.candidate(i) for i in range(lo, hi)), stop_event)
+
+
+class ChainSource:
+    """여러 생성기를 순서대로 이어 붙인 키 공간"""
+
+    def __init__(self, sources: list[Any]) -> None:
+        self.sources = [s for s in sources if s.size > 0]
+        self.offsets = []
+        total = 0
+        for s in self.sources:
+            self.offsets.append(total)
+            total += s.size
+        self.size = total
+
+    def describe(self) -> str:
+        return " + ".join(s.describe() for s in self.sources)
+
+    def candidate(self, index: int) -> str:
+        for off, s in zip(self.offsets, self.sources):
+            if index < off + s.size:
+                return s.candidate(index - off)
+        raise IndexError(index)
+
+    def search(self, cracker: ZipCracker, lo: int, hi: int, stop_event: Any = None) -> tuple[str | None, int]:
+        """구간을 하위 생성기 경계에서 나눠 차례로 검사"""
+        tried = 0
+        for off, s in zip(self.offsets, self.sources):
+            a, b = max(lo, off), min(hi, off + s.size)
+            if a >= b:
+                continue
+            hit, n = s.search(cracker, a - off, b - off, stop_event)
+            tried += n
+            if hit or n < b - a:
+                return hit, tried
+        return None, tried
+
+
+def likely_first(charset: str, min_len: int, max_len: int, words: list[str] | None = None,
+                 rules: list[str] | None = None) -> ChainSource:
+    """가능성 높은 후보부터: 단어 목록+규칙 -> 흔한 마스크(길이 범위 안) -> 길이 범위 brute force(빈도순)"""
+    sources: list[Any] = []
+    if words:
+        sources.append(WordlistSource(words, rules or DEFAULT_RULES))
+    allowed = set(charset)
+    for m in COMMON_MASKS:
+        src = parse_mask(m, likely=True)
+        if min_len <= len(src.positions) <= max_len and all(set(cs) <= allowed for cs in src.positions):
+            sources.append(src)
+    sources.append(brute_force(charset, min_len, max_len, likely=True))
+    return ChainSource(sources)
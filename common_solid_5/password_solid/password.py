@@ -2,104 +2,242 @@
 door_hacking.py
 - 문제 1: ZIP 암호 풀기 (brute force + 멀티프로세스 보너스)
 - 문제 2: 카이사르 암호 해독 (brute force + 사전 기반 자동 중단 보너스)
+- ZIP 암호 검사는 zip_crack.ZipCracker(헤더 검사 byte 사전 검사 + CRC 검증) 사용
+- 키 공간을 연속 인덱스 구간으로 나눠 워커가 직접 열거, 한 워커가 찾으면 공유 이벤트로 전체 중단
+- 완료 구간을 상태 파일에 주기적으로 저장, --resume으로 이어서 탐색(진행률/속도/남은 시간 표시)
+- 카이사르 해독은 shift별 str.maketrans 번역표(미리 생성)로 변환, 큰 파일은 청크 단위 스트리밍 해독
+- 후보 생성기(candidates): 길이 범위, 마스크, 단어 목록+규칙, 가능성 높은 순 - 모두 같은 구간 탐색 엔진 사용
 제약: zipfile 외의 외부 라이브러리 사용 불가
 """
 
+import argparse
 import zipfile
 import string
-import itertools
+import multiprocessing
+import signal
 import time
 from pathlib import Path
+from typing import TextIO
 from multiprocessing import Pool, cpu_count
 
+from candidates import DEFAULT_RULES, WordlistSource, brute_force, likely_first, parse_mask
+from zip_crack import Checkpoint, ZipCracker, format_progress
+
 
 # ───────── 문제 1: ZIP 암호 풀기 ─────────
-def _try_password(args):
-    """병렬 탐색용 내부 함수"""
-    zip_path, pwd = args
-    try:
-        with zipfile.ZipFile(zip_path, "r") as zf:
-            zf.extractall(path="unlocked", pwd=pwd.encode("utf-8"))
-        return pwd
-    except Exception:
-        return None
+CHARSET = string.digits + string.ascii_lowercase
+PASSWORD_LEN = 6
+CHUNK_SIZE = 36 ** 3 * 4  # 작업 단위(키 공간 인덱스 개수): 워커당 1~2초 분량
+STATE_FILE = "unlock_state.json"
+
+_cracker: ZipCracker | None = None
+_source = None
+_stop = None
+
+
+def _init_worker(zip_path: str, source, stop_event) -> None:
+    """워커마다 압축 파일을 한 번만 열고 후보 생성기/공유 중단 이벤트를 받아 둠(Ctrl+C는 메인 프로세스가 처리)"""
+    global _cracker, _source, _stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _cracker = ZipCracker(zip_path)
+    _source = source
+    _stop = stop_event
+
+
+def _search_chunk(task: tuple[int, int]) -> tuple[int, int, str | None, int]:
+    """병렬 탐색용 내부 함수: 후보 인덱스 [start, stop)을 워커에서 직접 생성/검사 -> (구간, 찾은 암호, 시도 횟수)만 반환"""
+    start, stop = task
+    if _stop.is_set():
+        return start, stop, None, 0
+    hit, tried = _source.search(_cracker, start, stop, _stop)
+    if hit:
+        _stop.set()
+    return start, stop, hit, tried
+
+
+def _found(cracker: ZipCracker, pwd: str, out_dir: str, attempt: int, start_time: float,
+           password_file: Path) -> None:
+    elapsed = time.time() - start_time
+    print(f"[SUCCESS] 암호 발견: {pwd}")
+    print(f"총 시도 횟수: {attempt}, 소요 시간: {elapsed:.2f}초")
+    cracker.extract(pwd, out_dir)
+    with open(password_file, "w", encoding="utf-8") as f:
+        f.write(pwd)
+
 
+def _state_meta(zip_path: str, source) -> dict:
+    """상태 파일이 같은 탐색(같은 압축 파일/후보 생성기)의 것인지 확인하는 값"""
+    st = Path(zip_path).stat()
+    return {"zip": str(Path(zip_path).resolve()), "size": st.st_size, "mtime": st.st_mtime_ns,
+            "source": source.describe()}
 
-def unlock_zip(zip_path: str, out_dir: str = ".", use_parallel: bool = False) -> None:
-    """ZIP 파일 암호를 brute force로 푸는 함수"""
-    charset = string.digits + string.ascii_lowercase
+
+def unlock_zip(zip_path: str, out_dir: str = ".", use_parallel: bool = False, source=None,
+               chunk_size: int = CHUNK_SIZE, resume: bool = False, state_file: str = STATE_FILE,
+               report_every: float = 5.0, save_every: float = 30.0) -> None:
+    """ZIP 파일 암호를 찾는 함수(후보 인덱스 공간을 chunk_size 구간으로 나눠 탐색)
+
+    source는 candidates의 후보 생성기(기본: CHARSET 6자리 brute force).
+    완료 구간은 save_every초마다 state_file에 저장되고, resume=True면 남은 구간부터 이어서 탐색합니다.
+    """
+    if source is None:
+        source = brute_force(CHARSET, PASSWORD_LEN, PASSWORD_LEN)
     start_time = time.time()
     password_file = Path("password.txt")
 
-    if use_parallel:
-        print("[INFO] 멀티프로세스로 암호 탐색 시작")
-        pool = Pool(processes=cpu_count())
-        tasks = (("emergency_storage_key.zip", "".join(p))
-                 for p in itertools.product(charset, repeat=6))
-        for attempt, result in enumerate(pool.imap_unordered(_try_password, tasks), 1):
-            if result:
-                elapsed = time.time() - start_time
-                print(f"[SUCCESS] 암호 발견: {result}")
-                print(f"총 시도 횟수: {attempt}, 소요 시간: {elapsed:.2f}초")
-                with open(password_file, "w", encoding="utf-8") as f:
-                    f.write(result)
-                pool.terminate()
-                return
-            if attempt % 50000 == 0:
-                elapsed = time.time() - start_time
-                print(f"[TRY] {attempt}회 시도, 진행시간 {elapsed:.2f}초")
-        pool.close()
-        pool.join()
+    try:
+        cracker = ZipCracker(zip_path)
+    except FileNotFoundError:
+        print(f"[ERROR] ZIP 파일을 찾을 수 없음: {zip_path}")
+        return
+    except zipfile.BadZipFile:
+        print(f"[ERROR] 올바른 ZIP 파일이 아님: {zip_path}")
+        return
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        return
+
+    meta = _state_meta(zip_path, source)
+    if resume:
+        try:
+            checkpoint = Checkpoint.load(state_file, meta)
+        except ValueError as e:
+            print(f"[ERROR] {e}")
+            cracker.close()
+            return
+        if checkpoint.done:
+            print(f"[RESUME] {state_file}에서 이어서 탐색 ({checkpoint.covered}개 완료)")
     else:
-        attempt = 0
+        checkpoint = Checkpoint(state_file, meta)
+
+    total = source.size
+    tasks = checkpoint.remaining(total, chunk_size)
+    attempt = 0
+    next_report = start_time + report_every
+    next_save = start_time + save_every
+
+    def _progress(lo: int, hi: int, tried: int) -> None:
+        nonlocal next_report, next_save
+        if tried == hi - lo:
+            checkpoint.mark(lo, hi)
+        now = time.time()
+        if now >= next_save:
+            next_save = now + save_every
+            checkpoint.save()
+        if now >= next_report:
+            next_report = now + report_every
+            rate = attempt / (now - start_time) if now > start_time else 0.0
+            print(format_progress(checkpoint.covered, total, rate))
+
+    with cracker:
         try:
-            with zipfile.ZipFile(zip_path, "r") as zf:
-                for pwd_tuple in itertools.product(charset, repeat=6):
-                    attempt += 1
-                    pwd = "".join(pwd_tuple)
-                    try:
-                        zf.extractall(path=out_dir, pwd=pwd.encode("utf-8"))
-                        elapsed = time.time() - start_time
-                        print(f"[SUCCESS] 암호 발견: {pwd}")
-                        print(f"총 시도 횟수: {attempt}, 소요 시간: {elapsed:.2f}초")
-                        with open(password_file, "w", encoding="utf-8") as f:
-                            f.write(pwd)
+            if use_parallel:
+                print("[INFO] 멀티프로세스로 암호 탐색 시작")
+                stop_event = multiprocessing.Event()
+                with Pool(processes=cpu_count(), initializer=_init_worker, initargs=(zip_path, source, stop_event)) as pool:
+                    for lo, hi, result, tried in pool.imap_unordered(_search_chunk, tasks):
+                        attempt += tried
+                        if result:
+                            pool.terminate()
+                            _found(cracker, result, out_dir, attempt, start_time, password_file)
+                            checkpoint.remove()
+                            return
+                        _progress(lo, hi, tried)
+            else:
+                for lo, hi in tasks:
+                    result, tried = source.search(cracker, lo, hi)
+                    attempt += tried
+                    if result:
+                        _found(cracker, result, out_dir, attempt, start_time, password_file)
+                        checkpoint.remove()
                         return
-                    except Exception:
-                        if attempt % 100000 == 0:
-                            elapsed = time.time() - start_time
-                            print(f"[TRY] {attempt}회 시도, 진행시간 {elapsed:.2f}초")
-            print("암호를 찾지 못했습니다.")
-        except FileNotFoundError:
-            print(f"[ERROR] ZIP 파일을 찾을 수 없음: {zip_path}")
-        except zipfile.BadZipFile:
-            print(f"[ERROR] 올바른 ZIP 파일이 아님: {zip_path}")
+                    _progress(lo, hi, tried)
+        except KeyboardInterrupt:
+            checkpoint.save()
+            print(f"\n[STOP] 중단됨: {checkpoint.covered / total * 100:.2f}% ({checkpoint.covered}/{total}) 완료")
+            print(f"[STOP] 진행 상태 저장: {state_file} (--resume으로 이어서 탐색)")
+            return
+        checkpoint.remove()
+        print("암호를 찾지 못했습니다.")
 
 
 # ───────── 문제 2: 카이사르 암호 해독 ─────────
+def _caesar_table(shift: int) -> dict[int, int]:
+    lower, upper = string.ascii_lowercase, string.ascii_uppercase
+    return str.maketrans(lower + upper, lower[-shift:] + lower[:-shift] + upper[-shift:] + upper[:-shift])
+
+
+# shift별 해독 번역표(0~25, 모듈 로드 시 한 번만 생성)
+CAESAR_TABLES = [_caesar_table(shift) for shift in range(26)]
+CAESAR_CHUNK = 1 << 20
+CAESAR_DICTIONARY = ["secret", "mars", "key", "password"]  # 간단한 사전 예시
+
+
+def caesar_shift(text: str, shift: int) -> str:
+    """text를 shift만큼 되돌려 해독(영문 대소문자만 이동, 나머지는 그대로)"""
+    return text.translate(CAESAR_TABLES[shift % 26])
+
+
+def detect_shift(text: str, dictionary: list[str]) -> tuple[int, str] | None:
+    """사전 단어가 처음 나타나는 (shift, 단어). 없으면 None"""
+    lowered = text.lower()
+    words = [w.lower() for w in dictionary]
+    for shift in range(26):
+        line = lowered.translate(CAESAR_TABLES[shift])
+        for word, original in zip(words, dictionary):
+            if word in line:
+                return shift, original
+    return None
+
+
+def caesar_decode_stream(src: TextIO, dst: TextIO, shift: int, chunk_size: int = CAESAR_CHUNK) -> int:
+    """src를 chunk_size 글자씩 읽어 해독 후 dst에 기록(글자 단위 변환이라 청크 경계와 무관). 처리한 글자 수 반환"""
+    table = CAESAR_TABLES[shift % 26]
+    count = 0
+    while chunk := src.read(chunk_size):
+        dst.write(chunk.translate(table))
+        count += len(chunk)
+    return count
+
+
+def caesar_decode_file(in_path: str, out_path: str, shift: int | None = None,
+                       dictionary: list[str] | None = None, chunk_size: int = CAESAR_CHUNK) -> int:
+    """큰 암호문 파일을 스트리밍 해독합니다. shift가 없으면 첫 청크에서 사전 단어로 찾습니다.
+
+    Returns:
+        사용한 shift
+
+    Raises:
+        ValueError: shift를 정할 수 없음
+    """
+    with open(in_path, "r", encoding="utf-8", newline="") as src:
+        if shift is None:
+            found = detect_shift(src.read(chunk_size), dictionary or [])
+            if found is None:
+                raise ValueError("사전 단어로 shift를 찾지 못했습니다. --shift로 지정하세요.")
+            shift = found[0]
+            src.seek(0)
+        shift %= 26
+        with open(out_path, "w", encoding="utf-8", newline="") as dst:
+            caesar_decode_stream(src, dst, shift, chunk_size)
+    return shift
+
+
 def caesar_cipher_decode(target_text: str, dictionary: list[str] | None = None) -> None:
     """카이사르 암호 해독: 0~25 자리수 이동, 사전 기반 자동 멈춤 지원"""
-    alphabet = string.ascii_lowercase
     result_file = Path("result.txt")
+    words = [(w, w.lower()) for w in dictionary or []]
+    lowered = target_text.lower() if words else ""
 
     for shift in range(26):
-        decoded = []
-        for ch in target_text:
-            if ch.islower():
-                idx = (alphabet.index(ch) - shift) % 26
-                decoded.append(alphabet[idx])
-            elif ch.isupper():
-                idx = (alphabet.index(ch.lower()) - shift) % 26
-                decoded.append(alphabet[idx].upper())
-            else:
-                decoded.append(ch)
-        line = "".join(decoded)
+        line = target_text.translate(CAESAR_TABLES[shift])
         print(f"[{shift:02}] {line}")
 
         # 보너스: 사전 단어 매칭 → 자동 중단
-        if dictionary:
-            for word in dictionary:
-                if word.lower() in line.lower():
+        if words:
+            lowered_line = lowered.translate(CAESAR_TABLES[shift])
+            for word, key in words:
+                if key in lowered_line:
                     print(f"[AUTO-DECODE] 사전 단어 '{word}' 발견 → shift={shift}")
                     with open(result_file, "w", encoding="utf-8") as f:
                         f.write(line)
@@ -109,17 +247,7 @@ def caesar_cipher_decode(target_text: str, dictionary: list[str] | None = None)
     try:
         num = int(input("정답으로 보이는 shift 번호를 입력하세요: ").strip())
         if 0 <= num < 26:
-            decoded = []
-            for ch in target_text:
-                if ch.islower():
-                    idx = (alphabet.index(ch) - num) % 26
-                    decoded.append(alphabet[idx])
-                elif ch.isupper():
-                    idx = (alphabet.index(ch.lower()) - num) % 26
-                    decoded.append(alphabet[idx].upper())
-                else:
-                    decoded.append(ch)
-            final_text = "".join(decoded)
+            final_text = caesar_shift(target_text, num)
             with open(result_file, "w", encoding="utf-8") as f:
                 f.write(final_text)
             print(f"[RESULT] result.txt 파일에 저장 완료")
@@ -131,15 +259,52 @@ def caesar_cipher_decode(target_text: str, dictionary: list[str] | None = None)
 
 # ───────── 실행 예시 ─────────
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ZIP 암호 풀기 + 카이사르 암호 해독")
+    parser.add_argument("--resume", action="store_true", help="상태 파일에서 이어서 탐색")
+    parser.add_argument("--state", default=STATE_FILE, help="진행 상태 파일")
+    parser.add_argument("--serial", action="store_true", help="멀티프로세스 없이 탐색")
+    parser.add_argument("--charset", default=CHARSET, help="brute force 문자 집합")
+    parser.add_argument("--min-len", type=int, default=PASSWORD_LEN, help="최소 길이")
+    parser.add_argument("--max-len", type=int, default=PASSWORD_LEN, help="최대 길이")
+    parser.add_argument("--mask", help="hashcat 형식 마스크(예: ?d?d?l?l?l?l)")
+    parser.add_argument("--wordlist", help="단어 목록 파일(한 줄에 한 단어)")
+    parser.add_argument("--rules", help="변형 규칙 파일(한 줄에 한 규칙, 생략 시 기본 규칙)")
+    parser.add_argument("--likely", action="store_true",
+                        help="가능성 높은 후보부터(단어 목록 -> 흔한 마스크 -> 빈도순 brute force)")
+    parser.add_argument("--decode-file", help="큰 카이사르 암호문 파일을 스트리밍 해독(문제 1 생략)")
+    parser.add_argument("--shift", type=int, help="--decode-file의 shift(생략 시 사전 단어로 찾음)")
+    parser.add_argument("--out", default="result.txt", help="--decode-file 결과 파일")
+    args = parser.parse_args()
+
+    if args.decode_file:
+        try:
+            used = caesar_decode_file(args.decode_file, args.out, args.shift, CAESAR_DICTIONARY)
+            print(f"[RESULT] shift={used} 해독 결과를 {args.out}에 저장 완료")
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] {e}")
+        raise SystemExit
+
     print("=== 문제 1: ZIP 암호 풀기 ===")
-    unlock_zip("emergency_storage_key.zip", out_dir="unlocked", use_parallel=True)
+    try:
+        rules = Path(args.rules).read_text(encoding="utf-8").splitlines() if args.rules else DEFAULT_RULES
+        if args.likely:
+            words = Path(args.wordlist).read_text(encoding="utf-8").splitlines() if args.wordlist else None
+            source = likely_first(args.charset, args.min_len, args.max_len, words, rules)
+        elif args.mask:
+            source = parse_mask(args.mask)
+        elif args.wordlist:
+            source = WordlistSource.from_file(args.wordlist, rules)
+        else:
+            source = brute_force(args.charset, args.min_len, args.max_len)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    unlock_zip("emergency_storage_key.zip", out_dir="unlocked", use_parallel=not args.serial, source=source,
+               resume=args.resume, state_file=args.state)
 
     print("\n=== 문제 2: 카이사르 암호 해독 ===")
     try:
         with open("password.txt", "r", encoding="utf-8") as f:
             cipher_text = f.read().strip()
-            # 간단한 사전 예시
-            dict_words = ["secret", "mars", "key", "password"]
-            caesar_cipher_decode(cipher_text, dictionary=dict_words)
+            caesar_cipher_decode(cipher_text, dictionary=CAESAR_DICTIONARY)
     except FileNotFoundError:
         print("[ERROR] password.txt 파일을 찾을 수 없습니다.")
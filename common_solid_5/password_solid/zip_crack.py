@@ -0,0 +1,352 @@
+"""
+zip_crack.py
+- ZipCrypto(전통 PKWARE 암호) ZIP 암호 탐색 엔진
+- 후보마다 extractall 하던 방식 대신:
+    1) 압축 파일은 워커당 한 번만 열어 암호화 헤더(12byte)를 메모리에 보관
+    2) 후보 암호로 키를 만들어 헤더를 복호화 -> 마지막 byte가 검사 byte와 같은지만 비교(사전 검사)
+    3) 사전 검사를 통과한 후보(약 1/256)만 메모리에서 압축 해제 + CRC 검증(zipfile)
+- 같은 접두사를 가진 후보가 연속되면 접두사까지의 키 상태를 재사용
+- 키 공간(charset^length)은 정수 인덱스 구간으로 나눠 워커가 시작 인덱스부터 직접 열거
+  (itertools.product와 같은 순서, 첫 글자가 최상위 자리), 자리별 문자 집합(마스크)도 지원
+- Checkpoint: 완료된 구간을 상태 파일(JSON)에 주기적으로 저장 -> 중단 후 남은 구간부터 재개
+제약: zipfile 외의 외부 라이브러리 사용 불가(표준 라이브러리만 사용)
+"""
+
+import bisect
+import json
+import os
+import struct
+import zipfile
+import zlib
+from pathlib import Path
+from typing import Any, Iterable
+
+_KEY0, _KEY1, _KEY2 = 0x12345678, 0x23456789, 0x34567890
+_HEADER_LEN = 12
+# 로컬 파일 헤더(30 byte): 서명, 버전, 플래그, 압축 방식, 시각, 날짜, CRC, 압축/원본 크기, 파일명/추가 필드 길이
+_LOCAL_HEADER = struct.Struct("<4s5H3I2H")
+_LOCAL_SIG = b"PK\x03\x04"
+
+
+def _make_crc_table() -> list[int]:
+    table = []
+    for n in range(256):
+        c = n
+        for _ in range(8):
+            c = (c >> 1) ^ 0xEDB88320 if c & 1 else c >> 1
+        table.append(c)
+    return table
+
+
+_CRC = _make_crc_table()
+
+
+def init_keys(pwd: bytes, keys: tuple[int, int, int] = (_KEY0, _KEY1, _KEY2)) -> tuple[int, int, int]:
+    """암호 byte로 ZipCrypto 키를 갱신합니다(keys에서 이어서 갱신 가능 -> 접두사 재사용)."""
+    k0, k1, k2 = keys
+    crc = _CRC
+    for c in pwd:
+        k0 = (k0 >> 8) ^ crc[(k0 ^ c) & 0xFF]
+        k1 = ((k1 + (k0 & 0xFF)) * 134775813 + 1) & 0xFFFFFFFF
+        k2 = (k2 >> 8) ^ crc[(k2 ^ (k1 >> 24)) & 0xFF]
+    return k0, k1, k2
+
+
+def header_check(keys: tuple[int, int, int], header: bytes) -> int:
+    """키로 암호화 헤더 12byte를 복호화하고 마지막 byte(검사 byte)를 반환합니다."""
+    k0, k1, k2 = keys
+    crc = _CRC
+    p = 0
+    for c in header:
+        t = (k2 | 2) & 0xFFFF
+        p = c ^ (((t * (t ^ 1)) >> 8) & 0xFF)
+        k0 = (k0 >> 8) ^ crc[(k0 ^ p) & 0xFF]
+        k1 = ((k1 + (k0 & 0xFF)) * 134775813 + 1) & 0xFFFFFFFF
+        k2 = (k2 >> 8) ^ crc[(k2 ^ (k1 >> 24)) & 0xFF]
+    return p
+
+
+def index_to_digits(index: int, bases: list[int]) -> list[int]:
+    """키 공간 인덱스 -> 자리별 인덱스(혼합 진법, 마지막 자리가 최하위)"""
+    out = [0] * len(bases)
+    for i in range(len(bases) - 1, -1, -1):
+        index, out[i] = divmod(index, bases[i])
+    return out
+
+
+def index_to_password(index: int, charset: str, length: int) -> str:
+    """키 공간 인덱스 -> 암호(itertools.product(charset, repeat=length)의 index번째)"""
+    return "".join(charset[d] for d in index_to_digits(index, [len(charset)] * length))
+
+
+def split_keyspace(total: int, chunk: int, start: int = 0) -> Iterable[tuple[int, int]]:
+    """[start, total)를 chunk 크기의 연속 구간 (시작, 끝)으로 나눕니다."""
+    for lo in range(start, total, chunk):
+        yield lo, min(lo + chunk, total)
+
+
+def format_progress(covered: int, total: int, rate: float) -> str:
+    """진행률/속도/남은 시간 한 줄 요약"""
+    pct = covered / total * 100 if total else 100.0
+    if rate > 0:
+        left = int((total - covered) / rate)
+        eta = f"{left // 3600}:{left // 60 % 60:02}:{left % 60:02}"
+    else:
+        eta = "-"
+    return f"[PROGRESS] {pct:6.2f}% ({covered}/{total}), {rate:,.0f}회/s, 남은 시간 {eta}"
+
+
+class Checkpoint:
+    """완료된 키 공간 구간 기록(재개용 상태 파일)
+
+    상태 파일: {"meta": {...탐색 조건...}, "done": [[시작, 끝], ...]}  (구간은 정렬/병합 상태)
+    """
+
+    def __init__(self, path: Path | str, meta: dict[str, Any]) -> None:
+        self.path = Path(path)
+        self.meta = meta
+        self.done: list[list[int]] = []
+
+    @classmethod
+    def load(cls, path: Path | str, meta: dict[str, Any]) -> "Checkpoint":
+        """상태 파일을 읽습니다(없으면 빈 기록).
+
+        Raises:
+            ValueError: 상태 파일의 탐색 조건(meta)이 현재와 다름
+        """
+        cp = cls(path, meta)
+        try:
+            state = json.loads(cp.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return cp
+        except (OSError, ValueError) as e:
+            raise ValueError(f"상태 파일을 읽을 수 없습니다.: {cp.path} (사유: {e})") from e
+        if state.get("meta") != meta:
+            raise ValueError(f"상태 파일의 탐색 조건이 현재와 다릅니다.: {cp.path}")
+        for lo, hi in state.get("done", []):
+            cp.mark(lo, hi)
+        return cp
+
+    @property
+    def covered(self) -> int:
+        return sum(hi - lo for lo, hi in self.done)
+
+    def mark(self, lo: int, hi: int) -> None:
+        """[lo, hi) 완료 기록(겹치거나 맞닿은 구간은 병합)"""
+        if lo >= hi:
+            return
+        i = bisect.bisect_left(self.done, [lo, hi])
+        self.done.insert(i, [lo, hi])
+        j = max(i - 1, 0)
+        while j + 1 < len(self.done):
+            a, b = self.done[j], self.done[j + 1]
+            if b[0] <= a[1]:
+                a[1] = max(a[1], b[1])
+                del self.done[j + 1]
+            elif j >= i:
+                break
+            else:
+                j += 1
+
+    def remaining(self, total: int, chunk: int) -> Iterable[tuple[int, int]]:
+        """아직 완료되지 않은 구간을 chunk 크기로 나눠 돌려줌(호출 시점 기록 기준)"""
+        gaps = []
+        pos = 0
+        for lo, hi in self.done:
+            if pos < lo:
+                gaps.append((pos, lo))
+            pos = max(pos, hi)
+        if pos < total:
+            gaps.append((pos, total))
+        for lo, hi in gaps:
+            yield from split_keyspace(hi, chunk, lo)
+
+    def save(self) -> None:
+        """임시 파일에 쓰고 교체(저장 중 중단돼도 이전 상태 유지)"""
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps({"meta": self.meta, "done": self.done}), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def remove(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+def _check_byte(info: zipfile.ZipInfo) -> int:
+    """헤더 검사 byte: 데이터 디스크립터(flag bit 3) 사용 시 수정 시각 상위 byte, 아니면 CRC 상위 byte"""
+    if info.flag_bits & 0x8:
+        h, m, s = info.date_time[3:6]
+        return ((h << 11 | m << 5 | s // 2) >> 8) & 0xFF
+    return (info.CRC >> 24) & 0xFF
+
+
+def _raw_header(f: Any, info: zipfile.ZipInfo) -> bytes:
+    """멤버의 암호화 헤더 12 byte(로컬 파일 헤더와 파일명/추가 필드 바로 뒤)
+
+    Raises:
+        zipfile.BadZipFile: 로컬 헤더 서명이 맞지 않거나 파일이 잘림
+    """
+    f.seek(info.header_offset)
+    raw = f.read(_LOCAL_HEADER.size)
+    if len(raw) != _LOCAL_HEADER.size:
+        raise zipfile.BadZipFile(f"로컬 헤더가 잘렸습니다.: {info.filename}")
+    sig, *_, name_len, extra_len = _LOCAL_HEADER.unpack(raw)
+    if sig != _LOCAL_SIG:
+        raise zipfile.BadZipFile(f"로컬 헤더가 올바르지 않습니다.: {info.filename}")
+    f.seek(name_len + extra_len, 1)
+    header = f.read(_HEADER_LEN)
+    if len(header) != _HEADER_LEN:
+        raise zipfile.BadZipFile(f"암호화 헤더가 잘렸습니다.: {info.filename}")
+    return header
+
+
+class ZipCracker:
+    """압축 파일을 한 번 열어 두고 후보 암호를 검사합니다.
+
+    Examples:
+        with ZipCracker("emergency_storage_key.zip") as zc:
+            pwd = zc.search(["1234", "abcd"])   # 찾으면 암호 문자열, 없으면 None
+    """
+
+    def __init__(self, zip_path: Path | str) -> None:
+        self.path = Path(zip_path)
+        self.zf = zipfile.ZipFile(self.path, "r")
+        # 암호화된 멤버의 (헤더, 검사 byte) - 작은 멤버부터(검증 비용이 작은 순)
+        members = sorted((i for i in self.zf.infolist() if i.flag_bits & 0x1 and not i.is_dir()),
+                         key=lambda i: i.compress_size)
+        if not members:
+            self.zf.close()
+            raise ValueError(f"암호화된 멤버가 없습니다.: {self.path}")
+        self.members = members
+        try:
+            with open(self.path, "rb") as f:
+                self.headers: list[tuple[bytes, int]] = [(_raw_header(f, i), _check_byte(i)) for i in members]
+        except (OSError, zipfile.BadZipFile):
+            self.zf.close()
+            raise
+        self.tried = 0
+        self.prechecked = 0
+        self._prefix: bytes | None = None
+        self._prefix_keys = (_KEY0, _KEY1, _KEY2)
+
+    def __enter__(self) -> "ZipCracker":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.zf.close()
+
+    def precheck(self, pwd: bytes) -> bool:
+        """헤더 검사 byte만으로 후보를 거릅니다(틀린 암호의 약 255/256 제거)."""
+        prefix = pwd[:-1]
+        if prefix != self._prefix:
+            self._prefix = prefix
+            self._prefix_keys = init_keys(prefix)
+        keys = init_keys(pwd[-1:], self._prefix_keys)
+        for header, check in self.headers:
+            if header_check(keys, header) != check:
+                return False
+        return True
+
+    def verify(self, pwd: bytes) -> bool:
+        """메모리에서 압축 해제 + CRC 검증(가장 작은 멤버)"""
+        try:
+            self.zf.read(self.members[0], pwd=pwd)
+            return True
+        except (RuntimeError, zipfile.BadZipFile, zlib.error, ValueError, EOFError):
+            return False
+
+    def test(self, pwd: str | bytes) -> bool:
+        raw = pwd.encode("utf-8") if isinstance(pwd, str) else pwd
+        self.tried += 1
+        if not self.precheck(raw):
+            return False
+        self.prechecked += 1
+        return self.verify(raw)
+
+    def search(self, candidates: Iterable[str]) -> str | None:
+        """후보를 순서대로 검사해 처음 맞는 암호를 반환합니다."""
+        for pwd in candidates:
+            if self.test(pwd):
+                return pwd
+        return None
+
+    def extract(self, pwd: str, out_dir: Path | str) -> list[str]:
+        """찾은 암호로 전체를 한 번만 해제합니다."""
+        self.zf.extractall(path=out_dir, pwd=pwd.encode("utf-8"))
+        return self.zf.namelist()
+
+    def search_range(self, charset: str, length: int, start: int, stop: int,
+                     stop_event: Any = None, poll: int = 1 << 16) -> tuple[str | None, int]:
+        """키 공간 charset^length의 [start, stop) 구간을 검사합니다(search_positions 참고)."""
+        return self.search_positions([charset] * length, start, stop, stop_event, poll)
+
+    def search_positions(self, positions: list[str], start: int, stop: int,
+                         stop_event: Any = None, poll: int = 1 << 16) -> tuple[str | None, int]:
+        """자리별 문자 집합(마스크)의 키 공간 [start, stop) 구간을 직접 열거하며 검사합니다.
+
+        Args:
+            positions (list[str]): 자리별 문자 집합(마지막 자리가 가장 빨리 바뀜)
+            start, stop (int): 인덱스 구간
+            stop_event: is_set()이 True가 되면 중단(다른 워커가 찾은 경우)
+            poll (int): stop_event 확인 간격(시도 횟수)
+
+        Returns:
+            (찾은 암호 또는 None, 시도 횟수)
+        """
+        if not positions or start >= stop:
+            return None, 0
+        raw = [[c.encode("utf-8") for c in cs] for cs in positions]
+        bases = [len(cs) for cs in positions]
+        last_raw = raw[-1]
+        last = [c[0] for c in last_raw] if all(len(c) == 1 for c in last_raw) else None
+        header, check = self.headers[0]
+        crc = _CRC
+        digits = index_to_digits(start, bases)
+        pos = start
+        next_poll = start + poll
+        while pos < stop:
+            prefix = b"".join(raw[i][d] for i, d in enumerate(digits[:-1]))
+            pk0, pk1, pk2 = init_keys(prefix)
+            lo = digits[-1]
+            hi = min(bases[-1], lo + stop - pos)
+            for d in range(lo, hi):
+                if last is not None:
+                    # 마지막 글자 키 갱신 + 헤더 복호화를 함수 호출 없이 처리
+                    c = last[d]
+                    k0 = (pk0 >> 8) ^ crc[(pk0 ^ c) & 0xFF]
+                    k1 = ((pk1 + (k0 & 0xFF)) * 134775813 + 1) & 0xFFFFFFFF
+                    k2 = (pk2 >> 8) ^ crc[(pk2 ^ (k1 >> 24)) & 0xFF]
+                    for b in header:
+                        t = (k2 | 2) & 0xFFFF
+                        p = b ^ (((t * (t ^ 1)) >> 8) & 0xFF)
+                        k0 = (k0 >> 8) ^ crc[(k0 ^ p) & 0xFF]
+                        k1 = ((k1 + (k0 & 0xFF)) * 134775813 + 1) & 0xFFFFFFFF
+                        k2 = (k2 >> 8) ^ crc[(k2 ^ (k1 >> 24)) & 0xFF]
+                    if p != check:
+                        continue
+                elif header_check(init_keys(last_raw[d], (pk0, pk1, pk2)), header) != check:
+                    continue
+                pwd = prefix + last_raw[d]
+                self.prechecked += 1
+                if all(header_check(init_keys(pwd), h) == c for h, c in self.headers[1:]) and self.verify(pwd):
+                    tried = pos + d - lo + 1 - start
+                    self.tried += tried
+                    return pwd.decode("utf-8"), tried
+            pos += hi - lo
+            # 다음 접두사로(자리 올림)
+            digits[-1] = 0
+            i = len(digits) - 2
+            while i >= 0:
+                digits[i] += 1
+                if digits[i] < bases[i]:
+                    break
+                digits[i] = 0
+                i -= 1
+            if stop_event is not None and pos >= next_poll:
+                next_poll = pos + poll
+                if stop_event.is_set():
+                    break
+        self.tried += pos - start
+        return None, pos - start